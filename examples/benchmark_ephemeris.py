@@ -0,0 +1,36 @@
+import timeit
+
+import numpy as np
+
+from orbital.envs.core import OrbitalConfig, OrbitalCore
+
+
+def main(num_satellites: int = 20, num_debris_clouds: int = 400, steps: int = 300):
+    actions = np.random.default_rng(0).integers(0, 8, size=(steps, num_satellites))
+    print(f"{num_satellites} satellites, {num_debris_clouds} debris clouds, world_dim=3")
+    timings = {}
+    for mode in ("newton", "ephemeris"):
+        config = OrbitalConfig(
+            num_satellites=num_satellites, num_debris_clouds=num_debris_clouds, world_dim=3,
+            body_propagation=mode, max_steps=10**6)
+        core = OrbitalCore(config)
+        core.reset(0)
+
+        def run_steps():
+            for step_actions in actions:
+                core.step_array(step_actions)
+
+        clouds = core.debris_clouds
+        live = np.ones((len(clouds),), dtype=np.bool_)
+        step_time = min(timeit.repeat(run_steps, number=1, repeat=3)) / steps
+        propagate_time = min(timeit.repeat(
+            lambda: clouds.propagate(live, config.kepler_constant), number=200, repeat=3)) / 200
+        timings[mode] = (step_time, propagate_time)
+        print(f"  {mode:>9}: {step_time * 1e3:7.3f} ms/step, debris propagation {propagate_time * 1e6:8.1f} us")
+    newton, ephemeris = timings["newton"], timings["ephemeris"]
+    print(f"  ephemeris speedup: {newton[0] / ephemeris[0]:.2f}x per step, "
+          f"{newton[1] / ephemeris[1]:.2f}x on debris propagation")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+import copy
+import timeit
+
+import numpy as np
+
+from orbital.envs.core import OrbitalConfig, OrbitalCore
+
+
+def main(num_satellites: int = 32, repeats: int = 2000):
+    core = OrbitalCore(OrbitalConfig(num_satellites=num_satellites, world_dim=3))
+    core.reset(0)
+    for _ in range(10):
+        core.step_array(np.random.default_rng(0).integers(0, 8, size=num_satellites))
+
+    snap = core.snapshot()
+    timings = {
+        "snapshot": timeit.timeit(core.snapshot, number=repeats) / repeats,
+        "restore": timeit.timeit(lambda: core.restore(snap), number=repeats) / repeats,
+        "deepcopy": timeit.timeit(lambda: copy.deepcopy(core), number=repeats // 20) / (repeats // 20),
+    }
+    print(f"{num_satellites} satellites, snapshot holds {snap.nbytes} bytes of arrays")
+    for name, seconds in timings.items():
+        print(f"  {name:>8}: {seconds * 1e6:9.1f} us")
+    clone_cost = timings["snapshot"] + timings["restore"]
+    print(f"  snapshot + restore is {timings['deepcopy'] / clone_cost:.0f}x faster than deepcopy")
+
+
+if __name__ == "__main__":
+    main()
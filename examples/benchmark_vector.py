@@ -0,0 +1,40 @@
+import timeit
+
+import numpy as np
+
+from orbital.envs.core import OrbitalConfig, OrbitalCore, VectorOrbitalCore
+
+
+def main(num_envs: int = 64, num_satellites: int = 8, steps: int = 50):
+    config = OrbitalConfig(num_satellites=num_satellites)
+    actions = np.random.default_rng(0).integers(0, 8, size=(steps, num_envs, num_satellites))
+
+    vec = VectorOrbitalCore(config, num_envs=num_envs, seed=0)
+    cores = [OrbitalCore(config) for _ in range(num_envs)]
+    for b, core in enumerate(cores):
+        core.reset(b)
+
+    def run_vector():
+        for step_actions in actions:
+            vec.step(step_actions)
+
+    def run_loop():
+        for step_actions in actions:
+            for core, core_actions in zip(cores, step_actions):
+                core.step_array(core_actions)
+                core.observe_all()
+                if core.last_episode is not None:
+                    core.reset(None)
+
+    timings = {
+        "vector": min(timeit.repeat(run_vector, number=1, repeat=3)) / steps,
+        "loop": min(timeit.repeat(run_loop, number=1, repeat=3)) / steps,
+    }
+    print(f"{num_envs} environments x {num_satellites} satellites, per batched step")
+    for name, seconds in timings.items():
+        print(f"  {name:>6}: {seconds * 1e3:8.2f} ms  ({num_envs / seconds:9.0f} env-steps/s)")
+    print(f"  VectorOrbitalCore is {timings['loop'] / timings['vector']:.2f}x the loop over cores")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ import math
 import numpy as np
 
 from orbital import parallel_env3d
+from orbital.envs.core.comm import CommGraph
 
 
 ACTION_OBSERVE = 0
@@ -60,13 +61,16 @@ def force_overview_state(env) -> None:
     core.update_comm_graph()
 
     # Keep links globally but isolate one satellite for "blocked downlink" + "isolated" view.
-    core.comm_adj[n - 1, :] = False
-    core.comm_adj[:, n - 1] = False
+    rows, cols = core.comm_graph.edges()
+    keep = (rows != n - 1) & (cols != n - 1)
+    core.comm_graph = CommGraph.from_pairs(n, rows[keep], cols[keep])
 
     # Keep one compromised satellite to show alert overlay.
     if n > 2:
         core.compromised_for[2] = max(core.compromised_for[2], 3)
 
+    core.invalidate_derived("comm", "cyber")
+
 
 def main() -> None:
     env = parallel_env3d(
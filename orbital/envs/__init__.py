@@ -5,6 +5,7 @@ __all__ = [
     "OrbitalParallelEnv",
     "Orbital3DAECEnv",
     "Orbital3DParallelEnv",
+    "OrbitalSubprocVectorEnv",
     "env",
     "parallel_env",
     "env3d",
@@ -29,4 +30,8 @@ def __getattr__(name: str):
         from orbital.envs.orbital3d_parallel import Orbital3DParallelEnv, parallel_env as parallel_env3d
 
         return Orbital3DParallelEnv if name == "Orbital3DParallelEnv" else parallel_env3d
+    if name == "OrbitalSubprocVectorEnv":
+        from orbital.envs.orbital_vector import OrbitalSubprocVectorEnv
+
+        return OrbitalSubprocVectorEnv
     raise AttributeError(f"module 'orbital.envs' has no attribute {name!r}")
@@ -1,4 +1,16 @@
 from orbital.envs.core.config import OrbitalConfig
 from orbital.envs.core.dynamics import OrbitalCore
+from orbital.envs.core.functional import step
+from orbital.envs.core.pool import InitialStatePool
+from orbital.envs.core.state import OrbitalState, StepOutputs
+from orbital.envs.core.vector import VectorOrbitalCore
 
-__all__ = ["OrbitalConfig", "OrbitalCore"]
+__all__ = [
+    "InitialStatePool",
+    "OrbitalConfig",
+    "OrbitalCore",
+    "OrbitalState",
+    "StepOutputs",
+    "VectorOrbitalCore",
+    "step",
+]
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterator
+
+import numpy as np
+
+from orbital.envs.core.kepler import TWO_PI, coordinates_from_elements
+
+if TYPE_CHECKING:
+    from orbital.envs.core.ephemeris import BodyEphemeris
+
+
+ELEMENT_FIELDS = (
+    "semi_major_axis",
+    "eccentricity",
+    "mean_anomaly",
+    "arg_periapsis",
+    "inclination",
+    "raan",
+)
+
+
+def _column_property(name: str, cast: type) -> property:
+    def getter(self):
+        return cast(getattr(self._catalog, name)[self._idx])
+
+    def setter(self, value):
+        getattr(self._catalog, name)[self._idx] = value
+
+    return property(getter, setter)
+
+
+class OrbitView:
+    """`KeplerOrbit`-shaped view onto one row of a body catalog."""
+
+    __slots__ = ("_catalog", "_idx")
+
+    semi_major_axis = _column_property("semi_major_axis", float)
+    eccentricity = _column_property("eccentricity", float)
+    mean_anomaly = _column_property("mean_anomaly", float)
+    arg_periapsis = _column_property("arg_periapsis", float)
+    inclination = _column_property("inclination", float)
+    raan = _column_property("raan", float)
+
+    def __init__(self, catalog: BodyCatalog, idx: int):
+        self._catalog = catalog
+        self._idx = idx
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name):.4f}" for name in ELEMENT_FIELDS)
+        return f"OrbitView({fields})"
+
+
+class BodyView:
+    """Attribute view onto one row of a body catalog.
+
+    Views hold no state of their own: reads and writes go straight to the
+    catalog arrays, so `core.tasks[i].theta` style access keeps working for
+    renderers, examples, and tests.
+    """
+
+    __slots__ = ("_catalog", "_idx")
+
+    theta = _column_property("theta", float)
+    radius = _column_property("radius", float)
+    phi = _column_property("phi", float)
+
+    def __init__(self, catalog: BodyCatalog, idx: int):
+        self._catalog = catalog
+        self._idx = idx
+
+    @property
+    def orbit(self) -> OrbitView:
+        return OrbitView(self._catalog, self._idx)
+
+    @property
+    def position(self) -> np.ndarray:
+        return self._catalog.positions[self._idx]
+
+
+class TaskView(BodyView):
+    __slots__ = ()
+
+    priority = _column_property("priority", float)
+    active = _column_property("active", bool)
+    age = _column_property("age", int)
+
+    def __repr__(self) -> str:
+        return (
+            f"TaskView(idx={self._idx}, priority={self.priority:.3f}, "
+            f"active={self.active}, age={self.age})"
+        )
+
+
+class DebrisCloudView(BodyView):
+    __slots__ = ()
+
+    spread = _column_property("spread", float)
+    density = _column_property("density", float)
+
+    def __repr__(self) -> str:
+        return (
+            f"DebrisCloudView(idx={self._idx}, spread={self.spread:.3f}, "
+            f"density={self.density:.3f})"
+        )
+
+
+class BodyCatalog:
+    """Struct-of-arrays storage for passive orbiting bodies.
+
+    Each body follows a fixed Kepler orbit between respawns. Elements and
+    derived coordinates are stored column-wise so propagation runs in one
+    batched pass over any subset of bodies.
+    """
+
+    view_type: type[BodyView] = BodyView
+    # Column arrays that make up the catalog state.
+    COLUMNS = ELEMENT_FIELDS + ("theta", "radius", "phi", "positions")
+
+    def __init__(self, capacity: int, world_dim: int):
+        self.world_dim = world_dim
+        self.semi_major_axis = np.zeros((capacity,), dtype=np.float64)
+        self.eccentricity = np.zeros((capacity,), dtype=np.float64)
+        self.mean_anomaly = np.zeros((capacity,), dtype=np.float64)
+        self.arg_periapsis = np.zeros((capacity,), dtype=np.float64)
+        self.inclination = np.zeros((capacity,), dtype=np.float64)
+        self.raan = np.zeros((capacity,), dtype=np.float64)
+        self.theta = np.zeros((capacity,), dtype=np.float32)
+        self.radius = np.zeros((capacity,), dtype=np.float32)
+        self.phi = np.zeros((capacity,), dtype=np.float32)
+        self.positions = np.zeros((capacity, world_dim), dtype=np.float32)
+        # Optional position tables used instead of the Newton solver.
+        self.ephemeris: BodyEphemeris | None = None
+
+    def __len__(self) -> int:
+        return self.semi_major_axis.shape[0]
+
+    def __getitem__(self, idx: int) -> BodyView:
+        n = len(self)
+        if idx < 0:
+            idx += n
+        if not 0 <= idx < n:
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return self.view_type(self, int(idx))
+
+    def __iter__(self) -> Iterator[BodyView]:
+        for idx in range(len(self)):
+            yield self.view_type(self, idx)
+
+    def set_elements(self, indices: np.ndarray, elements: dict[str, np.ndarray]) -> None:
+        for name in ELEMENT_FIELDS:
+            getattr(self, name)[indices] = elements[name]
+        if self.ephemeris is not None and len(indices):
+            self.ephemeris.build(self, indices)
+        self.refresh_coordinates(indices)
+
+    def refresh_coordinates(self, indices: np.ndarray | None = None) -> None:
+        if indices is None:
+            indices = np.arange(len(self))
+        if len(indices) == 0:
+            return
+        if self.ephemeris is not None:
+            positions, theta, radius, phi = self.ephemeris.coordinates(self, indices)
+        else:
+            positions, theta, radius, phi = coordinates_from_elements(
+                *(getattr(self, name)[indices] for name in ELEMENT_FIELDS),
+                self.world_dim,
+            )
+        self.positions[indices] = positions
+        self.theta[indices] = theta
+        self.radius[indices] = radius
+        self.phi[indices] = phi
+
+    def propagate(self, mask: np.ndarray, kepler_constant: float) -> None:
+        """Advance the mean anomaly of the masked bodies by one step."""
+        indices = np.flatnonzero(mask)
+        if len(indices) == 0:
+            return
+        axis = np.maximum(1e-6, self.semi_major_axis[indices])
+        self.mean_anomaly[indices] = np.mod(
+            self.mean_anomaly[indices] + kepler_constant / axis ** 1.5, TWO_PI)
+        self.refresh_coordinates(indices)
+
+
+class TaskCatalog(BodyCatalog):
+    view_type = TaskView
+    COLUMNS = BodyCatalog.COLUMNS + ("priority", "active", "age")
+
+    def __init__(self, capacity: int, world_dim: int):
+        super().__init__(capacity, world_dim)
+        self.priority = np.zeros((capacity,), dtype=np.float64)
+        self.active = np.zeros((capacity,), dtype=np.bool_)
+        self.age = np.zeros((capacity,), dtype=np.int64)
+
+
+class DebrisCatalog(BodyCatalog):
+    view_type = DebrisCloudView
+    COLUMNS = BodyCatalog.COLUMNS + ("spread", "density")
+
+    def __init__(self, capacity: int, world_dim: int):
+        super().__init__(capacity, world_dim)
+        self.spread = np.zeros((capacity,), dtype=np.float64)
+        self.density = np.zeros((capacity,), dtype=np.float64)
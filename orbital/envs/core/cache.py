@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable
+
+
+class DerivedStateCache:
+    """Memoize quantities derived from simulator state.
+
+    Each entry records which state sources it was computed from (for example
+    ``"positions"`` or ``"comm"``). Owners call `invalidate` with the sources
+    they just mutated; only entries depending on those sources are dropped.
+    Entries with no sources only depend on configuration and survive until
+    `clear`.
+    """
+
+    def __init__(self) -> None:
+        self._values: dict[str, Any] = {}
+        self._depends_on: dict[str, frozenset[str]] = {}
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, compute: Callable[[], Any], depends_on: Iterable[str] = ()) -> Any:
+        if key in self._values:
+            self.hits += 1
+            return self._values[key]
+        self.misses += 1
+        value = compute()
+        self._values[key] = value
+        self._depends_on[key] = frozenset(depends_on)
+        return value
+
+    def invalidate(self, *sources: str) -> None:
+        """Drop entries derived from any of `sources` (all state-derived entries if none)."""
+        for key, deps in list(self._depends_on.items()):
+            if deps and (not sources or not deps.isdisjoint(sources)):
+                del self._values[key]
+                del self._depends_on[key]
+        self.version += 1
+
+    def clear(self) -> None:
+        self._values.clear()
+        self._depends_on.clear()
+        self.version += 1
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "version": self.version, "entries": len(self._values)}
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import numpy as np
+
+# Largest constellation for which `OrbitalCore.comm_adj` builds a dense view.
+MAX_DENSE_VIEW_SATELLITES = 1024
+# Candidate pairs the grid search gathers before filtering them, which bounds
+# its temporaries independently of the constellation size.
+GRID_PAIR_BLOCK = 1 << 16
+
+
+def _read_only(value: np.ndarray, dtype: type) -> np.ndarray:
+    """`value` as a read-only array, copied if the caller could still write to it."""
+    array = np.asarray(value, dtype=dtype)
+    if array.flags.writeable:
+        if isinstance(value, np.ndarray) and np.may_share_memory(array, value):
+            array = array.copy()
+        array.flags.writeable = False
+    return array
+
+
+class CommGraph:
+    """Undirected satellite links in compressed sparse row (CSR) form.
+
+    The neighbours of satellite ``i`` are ``indices[indptr[i]:indptr[i + 1]]``
+    in ascending order, and every link is listed from both ends. Storage
+    grows with the number of links instead of ``N**2``. Graphs are never
+    modified after construction (their arrays are read-only), so snapshots,
+    exported states and recordings keep a reference instead of a copy.
+    """
+
+    __slots__ = ("indptr", "indices", "sources", "degree")
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray):
+        self.indptr = _read_only(indptr, np.int64)
+        self.indices = _read_only(indices, np.int32)
+        self.degree = np.diff(self.indptr)
+        # Row of every entry of `indices`, so per-link work stays vectorized.
+        self.sources = np.repeat(np.arange(len(self.degree), dtype=np.int32), self.degree)
+        self.degree.flags.writeable = False
+        self.sources.flags.writeable = False
+
+    @classmethod
+    def from_pairs(cls, num_nodes: int, rows: np.ndarray, cols: np.ndarray) -> CommGraph:
+        """Build the graph linking ``rows[k]`` and ``cols[k]``.
+
+        Pairs must be distinct, have ``rows < cols`` and come in row-major
+        order, as the link candidate searches and `edges` return them. Every
+        neighbour of node ``i`` listed by a pair ``(j, i)`` is smaller than
+        one listed by a pair ``(i, j)``, so each row is the former (ordered by
+        a stable sort on `cols`) followed by the latter, with no full sort.
+        """
+        rows = np.asarray(rows, dtype=np.int32)
+        cols = np.asarray(cols, dtype=np.int32)
+        count = len(rows)
+        forward = np.bincount(rows, minlength=num_nodes)
+        backward = np.bincount(cols, minlength=num_nodes)
+        indptr = np.zeros((num_nodes + 1,), dtype=np.int64)
+        np.cumsum(forward + backward, out=indptr[1:])
+        indices = np.empty((2 * count,), dtype=np.int32)
+        # Slot of the k-th pair is k shifted by a per-node base: forward links
+        # start after the node's backward ones.
+        base = indptr[:-1] + backward - (np.cumsum(forward) - forward)
+        slots = base[rows]
+        slots += np.arange(count)
+        indices[slots] = cols
+        order = np.argsort(cols, kind="stable")
+        base = indptr[:-1] - (np.cumsum(backward) - backward)
+        slots = base[cols[order]]
+        slots += np.arange(count)
+        indices[slots] = rows[order]
+        indptr.flags.writeable = False
+        indices.flags.writeable = False
+        return cls(indptr, indices)
+
+    @classmethod
+    def empty(cls, num_nodes: int) -> CommGraph:
+        return cls(np.zeros((num_nodes + 1,), dtype=np.int64), np.zeros((0,), dtype=np.int32))
+
+    def __reduce__(self):
+        return CommGraph, (self.indptr, self.indices)
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.degree)
+
+    @property
+    def num_links(self) -> int:
+        return len(self.indices) // 2
+
+    @property
+    def nbytes(self) -> int:
+        return self.indptr.nbytes + self.indices.nbytes + self.sources.nbytes + self.degree.nbytes
+
+    def neighbors(self, i: int) -> np.ndarray:
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def edges(self) -> tuple[np.ndarray, np.ndarray]:
+        """Every link once as ``(i, j)`` with ``i < j``, in row-major order."""
+        keep = self.sources < self.indices
+        return self.sources[keep], self.indices[keep]
+
+    def adjacent_to(self, mask: np.ndarray) -> np.ndarray:
+        """Boolean mask of the nodes linked to at least one node in `mask`."""
+        out = np.zeros((self.num_nodes,), dtype=np.bool_)
+        out[self.indices[mask[self.sources]]] = True
+        return out
+
+    def count_neighbors(self, mask: np.ndarray) -> np.ndarray:
+        """Number of each node's neighbours that are in `mask`."""
+        return np.bincount(self.sources[mask[self.indices]], minlength=self.num_nodes)
+
+    def to_dense(self) -> np.ndarray:
+        """Boolean ``(N, N)`` adjacency matrix; allocates ``N**2`` bytes."""
+        adj = np.zeros((self.num_nodes, self.num_nodes), dtype=np.bool_)
+        adj[self.sources, self.indices] = True
+        return adj
+
+    def equals(self, other: CommGraph) -> bool:
+        return np.array_equal(self.indptr, other.indptr) and np.array_equal(self.indices, other.indices)
+
+
+def segments_intersect_earth(p1: np.ndarray, p2: np.ndarray, earth_radius: float) -> np.ndarray:
+    """Vectorized line-of-sight test for segments ``p1[k] -> p2[k]``.
+
+    Returns a boolean array that is True where the segment crosses the Earth
+    disc/sphere, using the same quadratic and tolerances as the scalar
+    `OrbitalCore._segment_intersects_earth`.
+    """
+    p1f = np.asarray(p1, dtype=np.float64)
+    d = np.asarray(p2, dtype=np.float64) - p1f
+    a = np.einsum("ij,ij->i", d, d)
+    b = 2.0 * np.einsum("ij,ij->i", p1f, d)
+    c = np.einsum("ij,ij->i", p1f, p1f) - earth_radius ** 2
+    disc = b * b - 4.0 * a * c
+    sq = np.sqrt(np.maximum(0.0, disc))
+    denom = 2.0 * np.maximum(a, 1e-12)
+    t1 = (-b - sq) / denom
+    t2 = (-b + sq) / denom
+    eps = 1e-6
+    return (a >= 1e-12) & (disc >= 0.0) & (t1 < 1.0 - eps) & (t2 > eps)
+
+
+def dense_link_candidates(
+    positions: np.ndarray,
+    alive: np.ndarray,
+    comm_dist: float,
+    earth_radius: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return satellite pairs ``(i, j)`` with ``i < j`` that can hold a link.
+
+    A candidate pair has both endpoints alive, lies within `comm_dist`, and
+    has a clear line of sight. Pairs are returned in row-major order so that
+    per-pair link-drop draws consume the RNG in the same order as the
+    original nested loop.
+    """
+    rows, cols = np.triu_indices(positions.shape[0], k=1)
+    keep = alive[rows] & alive[cols]
+    rows, cols = rows[keep], cols[keep]
+    return filter_link_candidates(positions, rows, cols, comm_dist, earth_radius)
+
+
+def filter_link_candidates(
+    positions: np.ndarray,
+    rows: np.ndarray,
+    cols: np.ndarray,
+    comm_dist: float,
+    earth_radius: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Keep the pairs within `comm_dist` whose segment clears the Earth."""
+    diff = positions[rows] - positions[cols]
+    in_range = np.sqrt(np.einsum("ij,ij->i", diff, diff)) <= comm_dist
+    rows, cols = rows[in_range], cols[in_range]
+    los_clear = ~segments_intersect_earth(
+        positions[rows], positions[cols], earth_radius)
+    return rows[los_clear], cols[los_clear]
+
+
+def grid_link_candidates(
+    positions: np.ndarray,
+    alive: np.ndarray,
+    comm_dist: float,
+    earth_radius: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Uniform cell-grid counterpart of `dense_link_candidates`.
+
+    Satellites are hashed into cubic cells of side `comm_dist`, so only pairs
+    in the same or adjacent cells are tested. Memory grows with the number of
+    nearby pairs instead of ``N**2``. Output pairs and their order are
+    identical to the dense search.
+    """
+    members = np.flatnonzero(alive).astype(np.int32)
+    if len(members) < 2:
+        empty = np.zeros((0,), dtype=np.int64)
+        return empty, empty
+    pos = positions[members].astype(np.float64)
+    dim = pos.shape[1]
+    cell_size = max(float(comm_dist), 1e-6)
+    # Shift by one cell so every neighbour offset stays inside the padded grid.
+    cells = np.floor((pos - pos.min(axis=0)) / cell_size).astype(np.int64) + 1
+    extent = cells.max(axis=0) + 2
+    strides = np.ones((dim,), dtype=np.int64)
+    for axis in range(dim - 2, -1, -1):
+        strides[axis] = strides[axis + 1] * extent[axis + 1]
+    keys = cells @ strides
+
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    offsets = np.stack(np.meshgrid(
+        *([np.array([-1, 0, 1], dtype=np.int64)] * dim), indexing="ij"), axis=-1).reshape(-1, dim)
+
+    rows_parts = []
+    cols_parts = []
+    for offset in offsets @ strides:
+        target = keys + offset
+        start = np.searchsorted(sorted_keys, target, side="left")
+        counts = np.searchsorted(sorted_keys, target, side="right") - start
+        ends = np.cumsum(counts)
+        if ends[-1] == 0:
+            continue
+        # Filter the pairs in blocks of whole source satellites, so only the
+        # survivors of the distance and line-of-sight tests are kept around.
+        cuts = np.searchsorted(ends, np.arange(GRID_PAIR_BLOCK, ends[-1], GRID_PAIR_BLOCK))
+        bounds = np.unique(np.concatenate([[0], cuts, [len(members)]]))
+        for lo, hi in zip(bounds[:-1], bounds[1:]):
+            block = counts[lo:hi]
+            total = int(block.sum())
+            if total == 0:
+                continue
+            src = np.repeat(np.arange(lo, hi), block)
+            run_start = np.repeat(np.cumsum(block) - block, block)
+            dst = order[np.arange(total) - run_start + np.repeat(start[lo:hi], block)]
+            rows, cols = members[src], members[dst]
+            keep = rows < cols
+            rows, cols = filter_link_candidates(
+                positions, rows[keep], cols[keep], comm_dist, earth_radius)
+            rows_parts.append(rows)
+            cols_parts.append(cols)
+
+    if not rows_parts:
+        empty = np.zeros((0,), dtype=np.int64)
+        return empty, empty
+    rows = np.concatenate(rows_parts)
+    cols = np.concatenate(cols_parts)
+    pair_order = np.lexsort((cols, rows))
+    return rows[pair_order], cols[pair_order]
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    import numba
+except ModuleNotFoundError:  # pragma: no cover - exercised when numba is absent
+    numba = None
+
+NUMBA_AVAILABLE = numba is not None
+
+# Action codes used by the kernels (see `ACTION_MAP`).
+OBSERVE = 0
+RELAY_GROUND = 1
+RELAY_SAT = 2
+ORBIT_DOWN = 3
+ORBIT_UP = 4
+LOWPOWER = 5
+CYBERSCAN = 6
+IDLE = 7
+
+# Upper bounds on uniform draws per satellite, used to size the draw blocks.
+ACTION_DRAWS_PER_SATELLITE = 4
+HAZARD_DRAWS_PER_SATELLITE = 2
+
+_TWO_PI = 2.0 * np.pi
+
+
+def _jit(fn):
+    """Compile `fn` with Numba when available; otherwise keep the Python function.
+
+    The kernels mirror the scalar NumPy path statement by statement. Values
+    that are float32 array elements there are combined with explicit float32
+    casts here, so both backends round identically.
+    """
+    if numba is None:
+        return fn
+    return numba.njit(cache=True)(fn)
+
+
+@_jit
+def dispatch_actions(
+    actions, health, energy, compromised_for, last_action_forced, jammed, scan_boost,
+    semi_major_axis, eccentricity, mean_anomaly, orbit_radius, orbit_theta, sunlit,
+    cloud_theta, cloud_radius, cloud_active, energy_costs, draws,
+    executed, run_payload, forced_penalty, energy_spent, jam_penalty, cyber_penalty,
+    forced_action_prob, jam_prob, scan_duration_reduction, scan_clean_prob,
+    enable_recharge, recharge_rate, energy_budget, orbit_shift_step, orbit_min_radius,
+    orbit_max_radius, low_orbit_margin, high_orbit_margin, high_orbit_comm_cost_scale,
+    kepler_constant,
+):
+    """Per-satellite part of the action loop that does not touch tasks or links.
+
+    Resolves forced actions, energy costs, jamming, cyberscans, low-power
+    recharge, orbit shifts and Kepler propagation. `executed` receives the
+    executed action code and `run_payload` marks satellites whose observe or
+    relay action still has to be applied. Returns the number of `draws` used.
+    """
+    used = 0
+    low_threshold = np.float32(orbit_min_radius + low_orbit_margin)
+    high_start = orbit_max_radius - high_orbit_margin
+    for i in range(actions.shape[0]):
+        executed[i] = IDLE
+        run_payload[i] = False
+        if not health[i] > 0.0:
+            continue
+        if energy[i] > 0.0:
+            # Forced actions from active malware.
+            act = actions[i]
+            last_action_forced[i] = False
+            if compromised_for[i] > 0:
+                forced = draws[used] < forced_action_prob
+                used += 1
+                if forced:
+                    last_action_forced[i] = True
+                    nearest = -1
+                    best = 0.0
+                    for k in range(cloud_theta.shape[0]):
+                        if not cloud_active[k]:
+                            continue
+                        d_theta = ((np.float64(cloud_theta[k]) - np.float64(orbit_theta[i]) + np.pi) % _TWO_PI) - np.pi
+                        score = abs(d_theta) + abs(np.float64(orbit_radius[i]) - np.float64(cloud_radius[k]))
+                        if nearest < 0 or score < best:
+                            nearest = k
+                            best = score
+                    decided = False
+                    if nearest >= 0:
+                        toward = draws[used] < 0.55
+                        used += 1
+                        if toward:
+                            decided = True
+                            radius = np.float64(orbit_radius[i])
+                            if np.float64(cloud_radius[nearest]) > radius + 0.05:
+                                act = ORBIT_UP
+                            elif np.float64(cloud_radius[nearest]) < radius - 0.05:
+                                act = ORBIT_DOWN
+                            else:
+                                act = IDLE
+                    if not decided:
+                        if orbit_radius[i] <= low_threshold:
+                            act = ORBIT_DOWN
+                        else:
+                            down = draws[used] < 0.70
+                            used += 1
+                            act = ORBIT_DOWN if down else IDLE
+            if last_action_forced[i]:
+                forced_penalty[i] += np.float32(1.0)
+            if act < 0 or act > IDLE:
+                act = IDLE
+            executed[i] = act
+
+            # Energy cost, scaled up for relays from high orbits.
+            cost = energy_costs[act]
+            if act == RELAY_GROUND or act == RELAY_SAT:
+                factor = 0.0
+                if not orbit_radius[i] <= np.float32(high_start):
+                    factor = (orbit_radius[i] - np.float32(high_start)) / np.float32(max(1e-6, high_orbit_margin))
+                    factor = min(max(factor, np.float32(0.0)), np.float32(1.0))
+                cost *= 1.0 + high_orbit_comm_cost_scale * np.float64(factor)
+            energy[i] = max(0.0, np.float64(energy[i] - np.float32(cost)))
+            energy_spent[i] += np.float32(cost)
+
+            if not (energy[i] <= 0.0 and act != LOWPOWER):
+                jam = False
+                if (act == RELAY_GROUND or act == RELAY_SAT) and compromised_for[i] > 0:
+                    jam = draws[used] < jam_prob
+                    used += 1
+                if jam:
+                    jammed[i] = True
+                    jam_penalty[i] += np.float32(1.0)
+                    cyber_penalty[i] += np.float32(0.5)
+                elif act == ORBIT_DOWN or act == ORBIT_UP:
+                    ecc = np.float64(eccentricity[i])
+                    lo = orbit_min_radius / max(1e-6, 1.0 - ecc)
+                    hi = orbit_max_radius / max(1e-6, 1.0 + ecc)
+                    delta = -orbit_shift_step if act == ORBIT_DOWN else orbit_shift_step
+                    semi_major_axis[i] = min(max(np.float64(semi_major_axis[i]) + delta, lo), hi)
+                elif act == OBSERVE or act == RELAY_GROUND or act == RELAY_SAT:
+                    run_payload[i] = True
+                elif act == CYBERSCAN:
+                    scan_boost[i] = 4
+                    if compromised_for[i] > 0:
+                        compromised_for[i] = max(0, compromised_for[i] - scan_duration_reduction)
+                        clean = draws[used] < scan_clean_prob
+                        used += 1
+                        if clean:
+                            compromised_for[i] = 0
+                elif act == LOWPOWER:
+                    if enable_recharge and sunlit[i]:
+                        energy[i] = min(energy_budget, np.float64(energy[i] + np.float32(recharge_rate)))
+
+        # Kepler propagation of the mean anomaly.
+        axis = max(1e-6, np.float64(semi_major_axis[i]))
+        mean_motion = kepler_constant / (axis ** 1.5)
+        mean_anomaly[i] = np.float64(mean_anomaly[i] + np.float32(mean_motion)) % _TWO_PI
+    return used
+
+
+@_jit
+def apply_passive_recharge(health, energy, sunlit, energy_budget, amount):
+    """Sunlight recharge applied to every alive satellite after the action loop."""
+    for i in range(health.shape[0]):
+        if health[i] > 0.0 and sunlit[i]:
+            energy[i] = min(energy_budget, np.float64(energy[i] + np.float32(amount)))
+
+
+@_jit
+def apply_hazards(
+    health, energy, buffered_data, orbit_radius, pc_estimates, executed, draws,
+    health_loss, atmospheric, debris_risk, collision, data_loss,
+    orbit_min_radius, low_orbit_margin, atmospheric_health_loss, enable_debris,
+    debris_mitigation_factor, pc_alert_threshold, pc_collision_scale,
+    debris_health_loss_min, debris_health_loss_max,
+):
+    """Atmospheric drag and debris collisions; returns the number of `draws` used."""
+    used = 0
+    low_threshold = np.float32(orbit_min_radius + low_orbit_margin)
+    for i in range(health.shape[0]):
+        if not health[i] > 0.0:
+            continue
+        if orbit_radius[i] <= low_threshold:
+            loss = min(np.float64(health[i]), atmospheric_health_loss)
+            health[i] = health[i] - np.float32(loss)
+            health_loss[i] += np.float32(loss)
+            atmospheric[i] += np.float32(loss)
+        pc = np.float64(pc_estimates[i]) if health[i] > 0.0 else 0.0
+        maneuvered = executed[i] == ORBIT_DOWN or executed[i] == ORBIT_UP
+        if maneuvered:
+            pc *= (1.0 - debris_mitigation_factor)
+        debris_risk[i] = pc
+        if enable_debris and pc >= pc_alert_threshold and not maneuvered:
+            hit = draws[used] < pc_collision_scale * pc
+            used += 1
+            if hit:
+                sample = debris_health_loss_min + (debris_health_loss_max - debris_health_loss_min) * draws[used]
+                used += 1
+                loss = min(np.float64(health[i]), sample * max(0.25, pc))
+                health[i] = health[i] - np.float32(loss)
+                health_loss[i] += np.float32(loss)
+                collision[i] = 1.0
+                if health[i] <= 0.0:
+                    lost = np.float64(buffered_data[i])
+                    energy[i] = 0.0
+                    buffered_data[i] = 0.0
+                    data_loss[i] += np.float32(lost)
+    return used
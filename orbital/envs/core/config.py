@@ -66,6 +66,8 @@ class OrbitalConfig:
     relay_capacity_sat: float = 0.8
     comm_radius: int = 3
     p_link_drop: float = 0.05
+    comm_neighbor_search: str = "auto"
+    comm_grid_min_satellites: int = 256
     adversarial_rate: float = 0.05
     compromise_duration: int = 8
     spoof_mode: str = "obs_spoof"
@@ -90,6 +92,13 @@ class OrbitalConfig:
     reward_weights: dict[str, float] = field(
         default_factory=lambda: dict(DEFAULT_REWARD_WEIGHTS))
     reward_mode: str = "shared"
+    info_level: str = "full"
+    kernel_backend: str = "numpy"
+    rng_streams: str = "shared"
+    reset_mode: str = "standard"
+    body_propagation: str = "newton"
+    ephemeris_samples: int = 64
+    ephemeris_tolerance: float = 1e-4
     max_steps: int = 256
     sunlight_period: int = 20
     orbit_min_radius: float = 2.0
@@ -128,6 +137,11 @@ class OrbitalConfig:
                 "task_knowledge_mode must be ground_catalog or local_discovery")
         if not 0.0 <= self.p_link_drop <= 1.0:
             raise ValueError("p_link_drop must be in [0,1]")
+        if self.comm_neighbor_search not in {"auto", "dense", "grid"}:
+            raise ValueError(
+                "comm_neighbor_search must be 'auto', 'dense', or 'grid'")
+        if self.comm_grid_min_satellites < 2:
+            raise ValueError("comm_grid_min_satellites must be >= 2")
         if not 0.0 <= self.adversarial_rate <= 1.0:
             raise ValueError("adversarial_rate must be in [0,1]")
         if self.energy_budget <= 0.0:
@@ -177,6 +191,20 @@ class OrbitalConfig:
             raise ValueError("debris_mitigation_factor must be in [0,1]")
         if self.reward_mode not in {"shared", "local"}:
             raise ValueError("reward_mode must be shared or local")
+        if self.info_level not in {"none", "summary", "full", "lazy"}:
+            raise ValueError("info_level must be none, summary, full, or lazy")
+        if self.kernel_backend not in {"numpy", "numba", "auto"}:
+            raise ValueError("kernel_backend must be numpy, numba, or auto")
+        if self.rng_streams not in {"shared", "split"}:
+            raise ValueError("rng_streams must be shared or split")
+        if self.reset_mode not in {"standard", "fast"}:
+            raise ValueError("reset_mode must be standard or fast")
+        if self.body_propagation not in {"newton", "ephemeris"}:
+            raise ValueError("body_propagation must be newton or ephemeris")
+        if self.ephemeris_samples < 4:
+            raise ValueError("ephemeris_samples must be >= 4")
+        if self.ephemeris_tolerance <= 0.0:
+            raise ValueError("ephemeris_tolerance must be > 0")
         if self.orbit_min_radius <= 0.0:
             raise ValueError("orbit_min_radius must be > 0")
         if self.orbit_max_radius <= self.orbit_min_radius:
@@ -1,13 +1,38 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable
 
 import numpy as np
 
+from orbital.envs.core.bodies import ELEMENT_FIELDS, BodyCatalog, DebrisCatalog, DebrisCloudView, TaskCatalog
+from orbital.envs.core.cache import DerivedStateCache
+from orbital.envs.core.compiled import (
+    ACTION_DRAWS_PER_SATELLITE,
+    HAZARD_DRAWS_PER_SATELLITE,
+    NUMBA_AVAILABLE,
+    apply_hazards,
+    apply_passive_recharge,
+    dispatch_actions,
+)
+from orbital.envs.core.comm import (
+    MAX_DENSE_VIEW_SATELLITES,
+    CommGraph,
+    dense_link_candidates,
+    grid_link_candidates,
+)
 from orbital.envs.core.config import OrbitalConfig
-from orbital.envs.core.reward import compute_shared_reward
-from orbital.envs.core.spaces import ACTION_MAP
+from orbital.envs.core.ephemeris import BodyEphemeris
+from orbital.envs.core.info import INFO_FIELDS, SUMMARY_FIELDS, LazyInfo
+from orbital.envs.core.kepler import coordinates_from_elements
+from orbital.envs.core.kernels import collision_probability, debris_density, pairwise_distances, wrapped_angle_delta
+from orbital.envs.core.reward import REWARD_COMPONENTS, REWARD_INDEX, compile_reward_weights
+from orbital.envs.core.spaces import ACTION_MAP, OBSERVATION_SIZE
+from orbital.envs.core.state import STATE_TOTALS, CoreSnapshot, OrbitalState
+from orbital.envs.core.streams import BlockStream, RandomStreams
+
+if TYPE_CHECKING:
+    from orbital.envs.core.pool import InitialStatePool
 
 
 @dataclass
@@ -20,27 +45,6 @@ class KeplerOrbit:
     raan: float
 
 
-@dataclass
-class Task:
-    orbit: KeplerOrbit
-    priority: float
-    theta: float = 0.0
-    radius: float = 0.0
-    phi: float = 0.0
-    active: bool = True
-    age: int = 0
-
-
-@dataclass
-class DebrisCloud:
-    orbit: KeplerOrbit
-    spread: float
-    density: float
-    theta: float = 0.0
-    radius: float = 0.0
-    phi: float = 0.0
-
-
 class OrbitalCore:
     """ORBITAL V2 transition model.
 
@@ -49,8 +53,67 @@ class OrbitalCore:
     distinct mission constraints.
     """
 
+    # Per-satellite state arrays, all with a leading axis of size num_agents.
+    # They are only ever updated in place after the first reset.
+    SATELLITE_STATE = (
+        "orbit_semi_major_axis",
+        "orbit_eccentricity",
+        "orbit_mean_anomaly",
+        "orbit_arg_periapsis",
+        "orbit_inclination",
+        "orbit_raan",
+        "orbit_theta",
+        "orbit_phi",
+        "orbit_radius",
+        "positions",
+        "energy",
+        "health",
+        "compromised_for",
+        "malware_awake",
+        "jammed",
+        "last_action_forced",
+        "scan_boost",
+        "buffered_data",
+        "known_tasks",
+    )
+
     def __init__(self, config: OrbitalConfig):
+        self._setup(config)
+        self.reset(seed=None)
+
+    @classmethod
+    def from_state(cls, config: OrbitalConfig, state: OrbitalState,
+                   rng: np.random.Generator | RandomStreams | None = None) -> OrbitalCore:
+        """Build a core positioned at `state` without sampling a new episode.
+
+        `rng` is used as is (it is not copied); a fresh unseeded generator is
+        used when omitted. Pass another core's `streams` to continue its
+        random streams exactly, which ``rng_streams="split"`` requires: a
+        plain generator there seeds new subsystem streams from one draw.
+        """
+        core = cls.__new__(cls)
+        core._setup(config)
+        core.load_state(state)
+        if rng is not None:
+            core._attach_rng(rng)
+        return core
+
+    def _attach_rng(self, rng: np.random.Generator | RandomStreams) -> None:
+        """Draw from `rng` from now on (see `from_state`)."""
+        if isinstance(rng, RandomStreams):
+            if rng.split != (self.config.rng_streams == "split"):
+                raise ValueError("streams do not match the configured rng_streams mode")
+            self.streams = rng
+            self.rng = rng.rng
+        else:
+            self.rng = rng
+            self.streams = RandomStreams(self.config, rng)
+
+    def _setup(self, config: OrbitalConfig) -> None:
         self.config = config
+        # Callables run as ``hook(core, actions)`` after every step, and with
+        # ``actions=None`` after every reset (see `EpisodeRecorder`).
+        self.step_hooks: list[Callable[[OrbitalCore, np.ndarray | None], None]] = []
         self.num_agents = config.num_satellites
         self.ground = np.array([0, 0], dtype=np.int32)
         self.ground_thetas = np.array(
@@ -71,58 +134,77 @@ class OrbitalCore:
                     ],
                     dtype=np.float32,
                 )
+        ground_norms = np.linalg.norm(
+            self.ground_vectors.astype(np.float64), axis=1)
+        self.ground_unit_valid = ground_norms >= 1e-9
+        self.ground_units = np.zeros((len(self.ground_thetas), 3), dtype=np.float64)
+        self.ground_units[self.ground_unit_valid] = (
+            self.ground_vectors[self.ground_unit_valid].astype(np.float64)
+            / ground_norms[self.ground_unit_valid, None])
         self.rng = np.random.default_rng()
-        self.reset(seed=None)
+        self.streams = RandomStreams(config, self.rng)
+        self.seed: int | None = None
+        # Episode starts for unseeded resets (see `InitialStatePool`).
+        self.reset_pool: InitialStatePool | None = None
+        self.derived_cache = DerivedStateCache()
+        backend = config.kernel_backend
+        if backend == "auto":
+            backend = "numba" if NUMBA_AVAILABLE else "numpy"
+        if backend == "numba" and not NUMBA_AVAILABLE:
+            raise ModuleNotFoundError("numba is required for kernel_backend='numba'")
+        self._use_compiled_kernels = backend == "numba"
 
     def reset(self, seed: int | None) -> None:
+        """Start a new episode.
+
+        State buffers from the previous episode are reused in place. With
+        ``reset_mode="fast"`` the satellites' initial elements are sampled in
+        one vectorized draw per element instead of one satellite at a time,
+        which yields different (equally distributed) episodes per seed. An
+        unseeded reset takes the next episode start from `reset_pool` when
+        one is attached.
+        """
+        if seed is None and self.reset_pool is not None:
+            self._reset_from_pool()
+            return
+        self.seed = seed
         self.rng = np.random.default_rng(seed)
+        self.streams = RandomStreams(self.config, self.rng, np.random.SeedSequence(seed))
+        self.streams.begin_step()
+        self.derived_cache.clear()
         self.t = 0
-        sampled_orbits = [self._sample_orbit() for _ in range(self.num_agents)]
-        self.orbit_semi_major_axis = np.array(
-            [orbit.semi_major_axis for orbit in sampled_orbits], dtype=np.float32)
-        self.orbit_eccentricity = np.array(
-            [orbit.eccentricity for orbit in sampled_orbits], dtype=np.float32)
-        self.orbit_mean_anomaly = np.array(
-            [orbit.mean_anomaly for orbit in sampled_orbits], dtype=np.float32)
-        self.orbit_arg_periapsis = np.array(
-            [orbit.arg_periapsis for orbit in sampled_orbits], dtype=np.float32)
-        self.orbit_inclination = np.array(
-            [orbit.inclination for orbit in sampled_orbits], dtype=np.float32)
-        self.orbit_raan = np.array(
-            [orbit.raan for orbit in sampled_orbits], dtype=np.float32)
-        self.orbit_theta = np.zeros((self.num_agents,), dtype=np.float32)
-        self.orbit_phi = np.zeros((self.num_agents,), dtype=np.float32)
-        self.orbit_radius = np.zeros((self.num_agents,), dtype=np.float32)
-        self.positions = np.zeros(
-            (self.num_agents, self.config.world_dim), dtype=np.float32)
+        n = self.num_agents
+        if self.config.reset_mode == "fast":
+            elements = self._sample_orbits(n, self.streams.orbits)
+        else:
+            sampled_orbits = [self._sample_orbit() for _ in range(n)]
+            elements = {name: [getattr(orbit, name) for orbit in sampled_orbits] for name in ELEMENT_FIELDS}
+        for name in ELEMENT_FIELDS:
+            self._assign_state(f"orbit_{name}", np.asarray(elements[name], dtype=np.float32))
+        self._fill_state("orbit_theta", (n,), np.float32)
+        self._fill_state("orbit_phi", (n,), np.float32)
+        self._fill_state("orbit_radius", (n,), np.float32)
+        self._fill_state("positions", (n, self.config.world_dim), np.float32)
         self._refresh_satellite_positions()
 
-        self.energy = np.full((self.num_agents,),
-                              self.config.energy_budget, dtype=np.float32)
-        self.health = np.full((self.num_agents,),
-                              self.config.health_budget, dtype=np.float32)
-        self.compromised_for = np.zeros((self.num_agents,), dtype=np.int32)
-        self.malware_awake = np.zeros((self.num_agents,), dtype=np.bool_)
-        self.jammed = np.zeros((self.num_agents,), dtype=np.bool_)
-        self.last_action_forced = np.zeros((self.num_agents,), dtype=np.bool_)
-        self.scan_boost = np.zeros((self.num_agents,), dtype=np.int32)
-        self.buffered_data = np.zeros((self.num_agents,), dtype=np.float32)
-
-        self.tasks = [self._spawn_task() for _ in range(self.config.num_tasks)]
-        self.known_tasks = np.zeros(
-            (self.num_agents, self.config.num_tasks), dtype=np.bool_)
-        self.station_known_tasks = np.array(
-            [self.config.task_knowledge_mode ==
-                "ground_catalog" and task.active for task in self.tasks],
-            dtype=np.bool_,
-        )
-        self.debris_clouds = [self._spawn_debris_cloud()
-                              for _ in range(self.config.num_debris_clouds)]
-        self.comm_adj = np.zeros(
-            (self.num_agents, self.num_agents), dtype=np.bool_)
-        self.last_executed_actions = ["idle"] * self.num_agents
-        self.last_reward_components = self._empty_components()
-        self.last_reward = 0.0
+        self._fill_state("energy", (n,), np.float32, self.config.energy_budget)
+        self._fill_state("health", (n,), np.float32, self.config.health_budget)
+        self._fill_state("compromised_for", (n,), np.int32)
+        self._fill_state("malware_awake", (n,), np.bool_)
+        self._fill_state("jammed", (n,), np.bool_)
+        self._fill_state("last_action_forced", (n,), np.bool_)
+        self._fill_state("scan_boost", (n,), np.int32)
+        self._fill_state("buffered_data", (n,), np.float32)
+
+        self._reuse_catalogs()
+        self._spawn_tasks(np.arange(self.config.num_tasks))
+        self.invalidate_derived("tasks")
+        self._fill_state("known_tasks", (n, self.config.num_tasks), np.bool_)
+        ground_catalog = self.config.task_knowledge_mode == "ground_catalog"
+        self._fill_state("station_known_tasks", (self.config.num_tasks,), np.bool_)
+        self.station_known_tasks |= self.tasks.active & ground_catalog
+        self._spawn_debris_clouds(np.arange(self.config.num_debris_clouds))
+        self._reset_episode_buffers()
         self.delivered_total = 0.0
         self.observed_total = 0.0
         self.knowledge_shared_total = 0.0
@@ -130,46 +212,226 @@ class OrbitalCore:
         self.forced_action_count = 0
         self.update_comm_graph()
         self._refresh_task_knowledge()
-
-    def _empty_components(self) -> dict[str, float]:
-        return {
-            "task": 0.0,
-            "delivery": 0.0,
-            "ground_task_intake": 0.0,
-            "knowledge": 0.0,
-            "energy": 0.0,
-            "overflow": 0.0,
-            "data_loss": 0.0,
-            "health": 0.0,
-            "isolation": 0.0,
-            "failure": 0.0,
-            "cyber": 0.0,
-            "jam": 0.0,
-            "forced_action": 0.0,
-            "atmospheric_drag": 0.0,
-            "debris_risk": 0.0,
-            "collision": 0.0,
-        }
-
-    def _spawn_task(self) -> Task:
-        task = Task(
-            orbit=self._sample_orbit(),
-            priority=float(self.rng.uniform(0.2, 1.0)),
-            active=True,
-            age=0,
+        self.streams.end_step()
+        for hook in self.step_hooks:
+            hook(self, None)
+
+    def _reset_from_pool(self) -> None:
+        pool = self.reset_pool
+        if pool.config is not self.config and pool.config != self.config:
+            raise ValueError("reset_pool was built for a different configuration")
+        start = pool.get()
+        self.seed = start.seed
+        self.streams = start.streams
+        self.rng = start.streams.rng
+        self.load_state(start.state)
+        for hook in self.step_hooks:
+            hook(self, None)
+
+    def _fill_state(self, name: str, shape: tuple[int, ...], dtype: type, value: Any = 0) -> None:
+        """Set a state array to a constant, reusing the existing buffer when it fits."""
+        current = getattr(self, name, None)
+        if isinstance(current, np.ndarray) and current.shape == shape and current.dtype == dtype:
+            current.fill(value)
+        else:
+            setattr(self, name, np.full(shape, value, dtype=dtype))
+
+    def _reuse_catalogs(self) -> None:
+        """Keep the task and debris catalogs when their size still matches the config.
+
+        Every column is rewritten by the spawn that follows a reset or by
+        `load_state`, so reused catalogs need no clearing.
+        """
+        cfg = self.config
+        tasks = getattr(self, "tasks", None)
+        if tasks is None or len(tasks) != cfg.num_tasks or tasks.world_dim != cfg.world_dim:
+            self.tasks = self._new_catalog(TaskCatalog, cfg.num_tasks)
+        clouds = getattr(self, "debris_clouds", None)
+        if clouds is None or len(clouds) != cfg.num_debris_clouds or clouds.world_dim != cfg.world_dim:
+            self.debris_clouds = self._new_catalog(DebrisCatalog, cfg.num_debris_clouds)
+
+    def _invalidate_ephemerides(self) -> None:
+        """Have the body ephemerides re-check elements written behind their back."""
+        for catalog in (self.tasks, self.debris_clouds):
+            if catalog.ephemeris is not None:
+                catalog.ephemeris.invalidate()
+
+    def _new_catalog(self, catalog_type: type[BodyCatalog], capacity: int) -> BodyCatalog:
+        cfg = self.config
+        catalog = catalog_type(capacity, cfg.world_dim)
+        # Only debris lives long enough to pay for its table; tasks expire
+        # after 25 steps, well before a table costs less than Newton solves.
+        if cfg.body_propagation == "ephemeris" and catalog_type is DebrisCatalog:
+            catalog.ephemeris = BodyEphemeris(
+                capacity, cfg.world_dim, cfg.ephemeris_samples, cfg.ephemeris_tolerance)
+        return catalog
+
+    def _reset_episode_buffers(self) -> None:
+        """Reset the per-episode outputs and scratch buffers that are not state."""
+        n = self.num_agents
+        if getattr(self, "_obs_buffer", None) is None or self._obs_buffer.shape[0] != n:
+            self._obs_buffer = np.zeros((n, OBSERVATION_SIZE), dtype=np.float32)
+        if len(getattr(self, "last_executed_actions", ())) == n:
+            self.last_executed_actions[:] = ("idle",) * n
+        else:
+            self.last_executed_actions = ["idle"] * n
+        self.reward_weight_vector = compile_reward_weights(self.config.reward_weights)
+        self._energy_cost_vector = np.array([
+            self.config.energy_costs.get(ACTION_MAP[a], self.config.energy_costs["idle"])
+            for a in range(len(ACTION_MAP))
+        ], dtype=np.float64)
+        self._allocate_step_workspace()
+        self.last_reward_components = self._empty_components()
+        self.last_reward = 0.0
+        self.last_episode: dict[str, Any] | None = None
+        self.info_epoch = getattr(self, "info_epoch", 0) + 1
+
+    def export_state(self) -> OrbitalState:
+        """Copy the current state into an immutable `OrbitalState`."""
+        return OrbitalState.from_arrays(
+            satellites={name: getattr(self, name) for name in self.SATELLITE_STATE},
+            tasks={name: getattr(self.tasks, name) for name in self.tasks.COLUMNS},
+            debris={name: getattr(self.debris_clouds, name) for name in self.debris_clouds.COLUMNS},
+            station_known_tasks=self.station_known_tasks,
+            comm_graph=self.comm_graph,
+            t=self.t,
+            totals={name: getattr(self, name) for name in STATE_TOTALS},
         )
-        self._refresh_body_coordinates(task)
-        return task
-
-    def _spawn_debris_cloud(self) -> DebrisCloud:
-        cloud = DebrisCloud(
-            orbit=self._sample_orbit(),
-            spread=float(self.rng.uniform(
-                self.config.debris_spread_min, self.config.debris_spread_max)),
-            density=float(self.rng.uniform(0.35, 1.0)),
+
+    def _state_arrays(self) -> list[np.ndarray]:
+        """Live state arrays in the fixed order used by `snapshot`/`restore`."""
+        arrays = [getattr(self, name) for name in self.SATELLITE_STATE]
+        arrays += [getattr(self.tasks, name) for name in self.tasks.COLUMNS]
+        arrays += [getattr(self.debris_clouds, name) for name in self.debris_clouds.COLUMNS]
+        arrays.append(self.station_known_tasks)
+        return arrays
+
+    def snapshot(self) -> CoreSnapshot:
+        """Cheap copy of the state and generator for planners; see `restore`."""
+        return CoreSnapshot(
+            arrays=tuple(array.copy() for array in self._state_arrays()),
+            scalars=(self.t, *(getattr(self, name) for name in STATE_TOTALS), self.last_reward),
+            rng_state=self.streams.get_state(),
+            comm_graph=self.comm_graph,
+            executed_actions=tuple(self.last_executed_actions),
+            last_episode=self.last_episode,
         )
-        self._refresh_body_coordinates(cloud)
-        return cloud
+
+    def restore(self, snap: CoreSnapshot) -> None:
+        """Return to a `snapshot` taken from a core with the same configuration.
+
+        Arrays are copied back in place, so the snapshot stays reusable and
+        views held by `VectorOrbitalCore` remain bound. The generator resumes
+        exactly where it was when the snapshot was taken.
+        """
+        for target, source in zip(self._state_arrays(), snap.arrays, strict=True):
+            target[...] = source
+        self._invalidate_ephemerides()
+        self.comm_graph = snap.comm_graph
+        self.t, *totals, self.last_reward = snap.scalars
+        for name, value in zip(STATE_TOTALS, totals):
+            setattr(self, name, value)
+        self.streams.set_state(snap.rng_state)
+        self.last_executed_actions[:] = snap.executed_actions
+        self.last_episode = snap.last_episode
+        self.info_epoch += 1
+        self.invalidate_derived()
+
+    def load_state(self, state: OrbitalState) -> None:
+        """Overwrite the current state with a copy of `state`.
+
+        Satellite arrays are written in place where possible (see
+        `_assign_state`). Step outputs such as `last_executed_actions` and
+        `last_reward_components` start over as after `reset`; the generator
+        is left untouched.
+        """
+        if state.num_satellites != self.num_agents:
+            raise ValueError(
+                f"state has {state.num_satellites} satellites, core expects {self.num_agents}")
+        for name in self.SATELLITE_STATE:
+            self._assign_state(name, state.satellites[name], copy=True)
+        self._reuse_catalogs()
+        for catalog, columns in ((self.tasks, state.tasks), (self.debris_clouds, state.debris)):
+            for name in catalog.COLUMNS:
+                getattr(catalog, name)[...] = columns[name]
+        self._invalidate_ephemerides()
+        self._assign_state("station_known_tasks", state.station_known_tasks, copy=True)
+        self.comm_graph = state.comm_graph
+        self.t = state.t
+        for name in STATE_TOTALS:
+            setattr(self, name, state.totals[name])
+        self.derived_cache.clear()
+        self._reset_episode_buffers()
+
+    def _assign_state(self, name: str, value: np.ndarray, copy: bool = False) -> None:
+        """Store a per-satellite state array, writing in place when possible.
+
+        Existing buffers of the same shape and dtype are overwritten rather
+        than replaced, so storage bound from outside (see `VectorOrbitalCore`)
+        stays valid across resets. Otherwise `value` itself is stored, or a
+        copy of it with `copy`.
+        """
+        current = getattr(self, name, None)
+        if isinstance(current, np.ndarray) and current.shape == value.shape and current.dtype == value.dtype:
+            current[...] = value
+        else:
+            setattr(self, name, np.array(value) if copy else value)
+
+    def _allocate_step_workspace(self) -> None:
+        """Allocate the buffers `step_array` reuses instead of allocating per step."""
+        n = self.num_agents
+        c = len(REWARD_COMPONENTS)
+        if getattr(self, "reward_components", None) is None or self.reward_components.shape != (n, c):
+            self.reward_components = np.zeros((n, c), dtype=np.float32)
+            self._reward_columns = tuple(self.reward_components.T)
+            self._reward_components64 = np.zeros((n, c), dtype=np.float64)
+            self._reward_totals = np.zeros((c,), dtype=np.float32)
+            self._reward_totals64 = np.zeros((c,), dtype=np.float64)
+            self._rewards = np.zeros((n,), dtype=np.float64)
+            self._terminations = np.zeros((n,), dtype=np.bool_)
+            self._truncations = np.zeros((n,), dtype=np.bool_)
+            self._alive_scratch = np.zeros((n,), dtype=np.bool_)
+            self._executed_codes = np.zeros((n,), dtype=np.int64)
+            self._run_payload = np.zeros((n,), dtype=np.bool_)
+        else:
+            self.reward_components.fill(0.0)
+
+    def _empty_components(self) -> dict[str, float]:
+        return dict.fromkeys(REWARD_COMPONENTS, 0.0)
+
+    @property
+    def _orbit_draws(self) -> int:
+        return 6 if self.config.world_dim == 3 else 4
+
+    def _spawn_tasks(self, indices: np.ndarray, draws: np.ndarray | None = None) -> None:
+        """Respawn the tasks at `indices`.
+
+        Each task takes one row of uniforms: its orbit elements in
+        `_sample_orbit` order, then its priority. Drawing the rows in one
+        ``random`` call consumes the generator exactly like spawning the tasks
+        one at a time. `draws` passes rows already drawn by the caller.
+        """
+        count = len(indices)
+        if count == 0:
+            return
+        if draws is None:
+            draws = self.streams.tasks.random((count, self._orbit_draws + 1))
+        self.tasks.set_elements(indices, self._orbits_from_uniforms(draws))
+        self.tasks.priority[indices] = 0.2 + (1.0 - 0.2) * draws[:, -1]
+        self.tasks.active[indices] = True
+        self.tasks.age[indices] = 0
+
+    def _spawn_debris_clouds(self, indices: np.ndarray, draws: np.ndarray | None = None) -> None:
+        """Respawn the clouds at `indices`; rows are orbit elements, spread, density."""
+        count = len(indices)
+        if count == 0:
+            return
+        if draws is None:
+            draws = self.streams.debris.random((count, self._orbit_draws + 2))
+        self.debris_clouds.set_elements(indices, self._orbits_from_uniforms(draws))
+        low, high = self.config.debris_spread_min, self.config.debris_spread_max
+        self.debris_clouds.spread[indices] = low + (high - low) * draws[:, -2]
+        self.debris_clouds.density[indices] = 0.35 + (1.0 - 0.35) * draws[:, -1]
 
     def _is_alive(self, i: int) -> bool:
         return self.health[i] > 0.0
@@ -178,28 +440,67 @@ class OrbitalCore:
         return self._is_alive(i) and self.energy[i] > 0.0
 
     def update_comm_graph(self) -> None:
-        n = self.num_agents
-        adj = np.zeros((n, n), dtype=np.bool_)
-        comm_dist = self._comm_distance_threshold()
-        for i in range(n):
-            if not self._is_alive(i):
-                continue
-            for j in range(i + 1, n):
-                if not self._is_alive(j):
-                    continue
-                dist = float(np.linalg.norm(
-                    self.positions[i] - self.positions[j]))
-                los_clear = not self._segment_intersects_earth(
-                    self.positions[i], self.positions[j])
-                if dist <= comm_dist and los_clear and self.rng.random() > self.config.p_link_drop:
-                    adj[i, j] = True
-                    adj[j, i] = True
-        self.comm_adj = adj
+        """Rebuild `comm_graph` from the current positions and link drops."""
+        rows, cols = self._link_candidates()(
+            self.positions,
+            self.health > 0.0,
+            self._comm_distance_threshold(),
+            self.config.earth_radius,
+        )
+        # One draw per surviving candidate, in the same row-major order as the
+        # scalar pair loop, so link drops consume the RNG identically.
+        kept = self.streams.comm.random(len(rows)) > self.config.p_link_drop
+        self.comm_graph = CommGraph.from_pairs(self.num_agents, rows[kept], cols[kept])
+        self.invalidate_derived("comm")
+
+    @property
+    def comm_adj(self) -> np.ndarray:
+        """Dense read-only ``(N, N)`` view of `comm_graph` for small constellations.
+
+        Built on first access after each graph update. Above
+        `MAX_DENSE_VIEW_SATELLITES` satellites it is not available; use
+        `comm_graph` instead.
+        """
+        if self.num_agents > MAX_DENSE_VIEW_SATELLITES:
+            raise ValueError(
+                f"comm_adj is only built for up to {MAX_DENSE_VIEW_SATELLITES} satellites; "
+                "use comm_graph")
+        return self.derived_cache.get("comm_adj", self._dense_comm_adj, ("comm",))
+
+    def _dense_comm_adj(self) -> np.ndarray:
+        adj = self.comm_graph.to_dense()
+        adj.flags.writeable = False
+        return adj
+
+    def invalidate_derived(self, *sources: str) -> None:
+        """Drop cached derived quantities after mutating core state.
+
+        Sources are ``"positions"``, ``"health"``, ``"comm"``, ``"debris"``,
+        ``"tasks"`` and ``"cyber"``; with no arguments every state-derived
+        entry is dropped.
+        Code that edits core arrays directly (examples, tests, scripted
+        scenarios) must call this before querying observations or routes.
+        """
+        self.derived_cache.invalidate(*sources)
+
+    def _link_candidates(self):
+        """Pick the candidate-pair search backend for the current fleet size."""
+        mode = self.config.comm_neighbor_search
+        if mode == "auto":
+            mode = "grid" if self.num_agents >= self.config.comm_grid_min_satellites else "dense"
+        return grid_link_candidates if mode == "grid" else dense_link_candidates
 
     def _in_sunlight(self, i: int | None = None) -> bool:
         if i is None:
             return True
-        return bool(self.positions[i][1] < 0.0)
+        return bool(self._sunlight_mask()[i])
+
+    def _sunlight_mask(self) -> np.ndarray:
+        return self.derived_cache.get(
+            "sunlight", lambda: self.positions[:, 1] < 0.0, ("positions",))
+
+    def _comm_degree(self) -> np.ndarray:
+        return self.comm_graph.degree
 
     def _cartesian_from_orbit(self, theta: float, radius: float, phi: float = 0.0) -> np.ndarray:
         if self.config.world_dim == 3:
@@ -218,11 +519,17 @@ class OrbitalCore:
         return float(((a1 - a0 + np.pi) % (2.0 * np.pi)) - np.pi)
 
     def _comm_distance_threshold(self) -> float:
+        return self.derived_cache.get("comm_distance_threshold", self._compute_comm_distance_threshold)
+
+    def _compute_comm_distance_threshold(self) -> float:
         radial_span = self.config.orbit_max_radius - self.config.orbit_min_radius
         band_step = radial_span / max(1.0, float(self.config.grid_size - 1))
         return max(0.35, float(self.config.comm_radius) * band_step)
 
     def _sensing_distance_threshold(self) -> float:
+        return self.derived_cache.get("sensing_distance_threshold", self._compute_sensing_distance_threshold)
+
+    def _compute_sensing_distance_threshold(self) -> float:
         radial_span = self.config.orbit_max_radius - self.config.orbit_min_radius
         band_step = radial_span / max(1.0, float(self.config.grid_size - 1))
         return max(0.25, 1.4 * band_step)
@@ -231,25 +538,43 @@ class OrbitalCore:
         return 1.75 * self._sensing_distance_threshold()
 
     def _direct_ground_contact(self, i: int) -> bool:
-        if not self._is_alive(i):
-            return False
+        return bool(self._ground_contact_mask()[i])
+
+    def _ground_contact_mask(self) -> np.ndarray:
+        return self._ground_contact()[2]
+
+    def ground_contact_matrix(self) -> np.ndarray:
+        """``(N, G)`` boolean matrix: satellite i is in contact with station g."""
+        return self._ground_contact()[0]
+
+    def ground_contact_station(self) -> np.ndarray:
+        """Best-aligned station each satellite is in contact with, or -1."""
+        return self._ground_contact()[1]
+
+    def _ground_contact(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        return self.derived_cache.get(
+            "ground_contact", self._compute_ground_contact, ("positions", "health"))
+
+    def _compute_ground_contact(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
         if self.config.world_dim == 3:
-            sat_vec = self.positions[i].astype(np.float64)
-            sat_norm = float(np.linalg.norm(sat_vec))
-            if sat_norm < 1e-9:
-                return False
-            sat_unit = sat_vec / sat_norm
-            cos_th = np.cos(self.config.ground_contact_angle)
-            for g in self.ground_vectors:
-                g_vec = g.astype(np.float64)
-                g_norm = float(np.linalg.norm(g_vec))
-                if g_norm < 1e-9:
-                    continue
-                if float(np.dot(sat_unit, g_vec / g_norm)) >= cos_th:
-                    return True
-            return False
-        sat_theta = float(self.orbit_theta[i])
-        return any(abs(self._angle_delta(sat_theta, float(gs_theta))) <= self.config.ground_contact_angle for gs_theta in self.ground_thetas)
+            sat_vec = self.positions.astype(np.float64)
+            sat_norm = np.sqrt(np.einsum("ij,ij->i", sat_vec, sat_vec))
+            sat_unit = sat_vec / np.maximum(sat_norm, 1e-9)[:, None]
+            # Higher cosine means better aligned with the station zenith.
+            alignment = sat_unit @ self.ground_units.T
+            contact = alignment >= np.cos(self.config.ground_contact_angle)
+            contact &= (sat_norm >= 1e-9)[:, None] & self.ground_unit_valid[None, :]
+        else:
+            alignment = -np.abs(wrapped_angle_delta(
+                self.orbit_theta[:, None].astype(np.float64),
+                self.ground_thetas[None, :].astype(np.float64),
+            ))
+            contact = alignment >= -self.config.ground_contact_angle
+        contact &= (self.health > 0.0)[:, None]
+        mask = contact.any(axis=1)
+        station = np.where(
+            mask, np.argmax(np.where(contact, alignment, -np.inf), axis=1), -1)
+        return contact, station, mask
 
     def _segment_intersects_earth(self, p1: np.ndarray, p2: np.ndarray) -> bool:
         p1f = p1.astype(np.float64)
@@ -275,23 +600,75 @@ class OrbitalCore:
         return ACTION_MAP.get(int(a), "idle")
 
     def _sample_orbit(self) -> KeplerOrbit:
-        eccentricity = float(self.rng.uniform(
+        rng = self.streams.orbits
+        eccentricity = float(rng.uniform(
             self.config.eccentricity_min, self.config.eccentricity_max))
         lo, hi = self._semi_major_axis_bounds(eccentricity)
         return KeplerOrbit(
-            semi_major_axis=float(self.rng.uniform(lo, hi)),
+            semi_major_axis=float(rng.uniform(lo, hi)),
             eccentricity=eccentricity,
-            mean_anomaly=float(self.rng.uniform(0.0, 2.0 * np.pi)),
-            arg_periapsis=float(self.rng.uniform(0.0, 2.0 * np.pi)),
-            inclination=float(self.rng.uniform(
+            mean_anomaly=float(rng.uniform(0.0, 2.0 * np.pi)),
+            arg_periapsis=float(rng.uniform(0.0, 2.0 * np.pi)),
+            inclination=float(rng.uniform(
                 -self.config.inclination_max, self.config.inclination_max))
             if self.config.world_dim == 3
             else 0.0,
-            raan=float(self.rng.uniform(0.0, 2.0 * np.pi))
+            raan=float(rng.uniform(0.0, 2.0 * np.pi))
             if self.config.world_dim == 3
             else 0.0,
         )
 
+    def _sample_orbits(self, count: int, rng: np.random.Generator | BlockStream) -> dict[str, np.ndarray]:
+        """Vectorized `_sample_orbit` returning element arrays of length `count`."""
+        eccentricity = rng.uniform(
+            self.config.eccentricity_min, self.config.eccentricity_max, size=count)
+        lo = self.config.orbit_min_radius / np.maximum(1e-6, 1.0 - eccentricity)
+        hi = self.config.orbit_max_radius / np.maximum(1e-6, 1.0 + eccentricity)
+        semi_major_axis = rng.uniform(lo, hi)
+        mean_anomaly = rng.uniform(0.0, 2.0 * np.pi, size=count)
+        arg_periapsis = rng.uniform(0.0, 2.0 * np.pi, size=count)
+        if self.config.world_dim == 3:
+            inclination = rng.uniform(
+                -self.config.inclination_max, self.config.inclination_max, size=count)
+            raan = rng.uniform(0.0, 2.0 * np.pi, size=count)
+        else:
+            inclination = np.zeros((count,), dtype=np.float64)
+            raan = np.zeros((count,), dtype=np.float64)
+        return {
+            "semi_major_axis": semi_major_axis,
+            "eccentricity": eccentricity,
+            "mean_anomaly": mean_anomaly,
+            "arg_periapsis": arg_periapsis,
+            "inclination": inclination,
+            "raan": raan,
+        }
+
+    def _orbits_from_uniforms(self, draws: np.ndarray) -> dict[str, np.ndarray]:
+        """Elements from per-body rows of uniforms, one row per `_sample_orbit` call.
+
+        Applies ``low + (high - low) * u`` like ``Generator.uniform``, so the
+        results match the scalar sampler bit for bit.
+        """
+        cfg = self.config
+        count = draws.shape[0]
+        eccentricity = cfg.eccentricity_min + (cfg.eccentricity_max - cfg.eccentricity_min) * draws[:, 0]
+        lo = cfg.orbit_min_radius / np.maximum(1e-6, 1.0 - eccentricity)
+        hi = cfg.orbit_max_radius / np.maximum(1e-6, 1.0 + eccentricity)
+        elements = {
+            "semi_major_axis": lo + (hi - lo) * draws[:, 1],
+            "eccentricity": eccentricity,
+            "mean_anomaly": 0.0 + (2.0 * np.pi - 0.0) * draws[:, 2],
+            "arg_periapsis": 0.0 + (2.0 * np.pi - 0.0) * draws[:, 3],
+        }
+        if cfg.world_dim == 3:
+            elements["inclination"] = -cfg.inclination_max + (
+                cfg.inclination_max - -cfg.inclination_max) * draws[:, 4]
+            elements["raan"] = 0.0 + (2.0 * np.pi - 0.0) * draws[:, 5]
+        else:
+            elements["inclination"] = np.zeros((count,), dtype=np.float64)
+            elements["raan"] = np.zeros((count,), dtype=np.float64)
+        return elements
+
     def _semi_major_axis_bounds(self, eccentricity: float) -> tuple[float, float]:
         lo = self.config.orbit_min_radius / max(1e-6, 1.0 - eccentricity)
         hi = self.config.orbit_max_radius / max(1e-6, 1.0 + eccentricity)
@@ -359,26 +736,26 @@ class OrbitalCore:
         )
 
     def _refresh_satellite_positions(self) -> None:
-        for i in range(self.num_agents):
-            vec, theta, radius, phi = self._coordinates_from_elements(
-                self._satellite_orbit(i))
-            self.positions[i] = vec
-            self.orbit_theta[i] = theta
-            self.orbit_radius[i] = radius
-            self.orbit_phi[i] = phi
+        # Batched counterpart of `_coordinates_from_elements`, which remains the
+        # scalar reference used for tasks, debris, and equivalence tests.
+        positions, theta, radius, phi = coordinates_from_elements(
+            self.orbit_semi_major_axis,
+            self.orbit_eccentricity,
+            self.orbit_mean_anomaly,
+            self.orbit_arg_periapsis,
+            self.orbit_inclination,
+            self.orbit_raan,
+            self.config.world_dim,
+        )
+        self.positions[:] = positions
+        self.orbit_theta[:] = theta
+        self.orbit_radius[:] = radius
+        self.orbit_phi[:] = phi
+        self.invalidate_derived("positions")
 
     def _refresh_cartesian_positions(self) -> None:
         self._refresh_satellite_positions()
 
-    def _refresh_body_coordinates(self, body: Task | DebrisCloud) -> None:
-        _, body.theta, body.radius, body.phi = self._coordinates_from_elements(
-            body.orbit)
-
-    def _propagate_body(self, body: Task | DebrisCloud) -> None:
-        body.orbit.mean_anomaly = self._wrap_angle(
-            body.orbit.mean_anomaly + self._kepler_mean_motion(body.orbit.semi_major_axis))
-        self._refresh_body_coordinates(body)
-
     def _propagate_kepler(self, i: int) -> None:
         mean_motion = self._kepler_mean_motion(float(self.orbit_semi_major_axis[i]))
         self.orbit_mean_anomaly[i] = self._wrap_angle(
@@ -396,76 +773,116 @@ class OrbitalCore:
     def _update_debris_clouds(self) -> None:
         if not self.config.enable_debris:
             return
-        for idx, cloud in enumerate(self.debris_clouds):
-            if cloud.density <= 1e-4:
-                if self.rng.random() < self.config.debris_spawn_rate:
-                    self.debris_clouds[idx] = self._spawn_debris_cloud()
+        update = self._draw_debris_update()
+        self.debris_clouds.propagate(update[0], self.config.kepler_constant)
+        self._apply_debris_update(update)
+
+    def _draw_debris_update(self) -> tuple[Any, ...]:
+        """Take this step's debris draws; `_apply_debris_update` applies them after propagation."""
+        self.invalidate_derived("debris")
+        clouds = self.debris_clouds
+        rng = self.streams.debris
+        depleted = clouds.density <= 1e-4
+        live = ~depleted
+        # Draws are taken cloud by cloud in the original per-cloud order, so
+        # seeded episodes match the list-based implementation; the state
+        # updates then run on the columns.
+        spawn_rate = self.config.debris_spawn_rate
+        spawn_width = self._orbit_draws + 2
+        spread_noise = np.zeros((len(clouds),), dtype=np.float64)
+        bursts: list[int] = []
+        burst_sizes: list[float] = []
+        respawn: list[int] = []
+        respawn_draws: list[np.ndarray] = []
+        for idx in range(len(clouds)):
+            if depleted[idx]:
+                if rng.random() < spawn_rate:
+                    respawn.append(idx)
+                    respawn_draws.append(rng.random(spawn_width))
                 continue
-            self._propagate_body(cloud)
-            cloud.spread = float(np.clip(
-                cloud.spread + float(self.rng.normal(0.0, 0.02)),
-                self.config.debris_spread_min,
-                self.config.debris_spread_max,
-            ))
-            cloud.density = max(0.0, cloud.density *
-                                (1.0 - self.config.debris_decay))
-            if self.rng.random() < self.config.debris_spawn_rate * 0.25:
-                cloud.density = min(1.0, cloud.density +
-                                    float(self.rng.uniform(0.05, 0.2)))
+            spread_noise[idx] = rng.normal(0.0, 0.02)
+            if rng.random() < spawn_rate * 0.25:
+                bursts.append(idx)
+                burst_sizes.append(rng.uniform(0.05, 0.2))
+        return live, spread_noise, bursts, burst_sizes, respawn, respawn_draws
+
+    def _apply_debris_update(self, update: tuple[Any, ...]) -> None:
+        live, spread_noise, bursts, burst_sizes, respawn, respawn_draws = update
+        clouds = self.debris_clouds
+        clouds.spread[live] = np.clip(
+            clouds.spread[live] + spread_noise[live],
+            self.config.debris_spread_min,
+            self.config.debris_spread_max,
+        )
+        clouds.density[live] = np.maximum(
+            0.0, clouds.density[live] * (1.0 - self.config.debris_decay))
+        if bursts:
+            clouds.density[bursts] = np.minimum(1.0, clouds.density[bursts] + np.array(burst_sizes))
+        if respawn:
+            self._spawn_debris_clouds(np.array(respawn), np.array(respawn_draws))
 
     def _local_debris_density(self, i: int) -> float:
-        if not self.config.enable_debris or len(self.debris_clouds) == 0 or not self._is_alive(i):
-            return 0.0
-        sat_theta = float(self.orbit_theta[i])
-        sat_radius = float(self.orbit_radius[i])
-        sat_phi = float(self.orbit_phi[i])
-        density = 0.0
-        for cloud in self.debris_clouds:
-            if cloud.density <= 1e-4:
-                continue
-            d_theta = self._angle_delta(sat_theta, cloud.theta)
-            d_radius = sat_radius - cloud.radius
-            d_phi = sat_phi - cloud.phi if self.config.world_dim == 3 else 0.0
-            dist = float(np.sqrt(d_theta * d_theta +
-                         d_radius * d_radius + d_phi * d_phi))
-            density += cloud.density * \
-                float(np.exp(-0.5 * (dist / max(1e-3, cloud.spread)) ** 2))
-        return float(np.clip(density, 0.0, 1.5))
+        return float(self._debris_density_vector()[i])
+
+    def _debris_density_vector(self) -> np.ndarray:
+        return self.derived_cache.get(
+            "debris_density", self._compute_debris_density, ("positions", "health", "debris"))
+
+    def _compute_debris_density(self) -> np.ndarray:
+        if not self.config.enable_debris or len(self.debris_clouds) == 0:
+            return np.zeros((self.num_agents,), dtype=np.float64)
+        clouds = self.debris_clouds
+        return debris_density(
+            self.orbit_theta,
+            self.orbit_radius,
+            self.orbit_phi,
+            self.health > 0.0,
+            clouds.theta,
+            clouds.radius,
+            clouds.phi,
+            clouds.spread,
+            clouds.density,
+            self.config.world_dim,
+        )
 
     def _local_pc_estimate(self, i: int) -> float:
-        base = self._local_debris_density(i)
-        if self.compromised_for[i] > 0:
-            base *= 1.10
-        return float(np.clip(self.config.debris_risk_gain * base, 0.0, 1.0))
+        return float(self._pc_estimate_vector()[i])
+
+    def _pc_estimate_vector(self) -> np.ndarray:
+        return self.derived_cache.get(
+            "pc_estimate", self._compute_pc_estimates, ("positions", "health", "debris", "cyber"))
+
+    def _compute_pc_estimates(self) -> np.ndarray:
+        return collision_probability(
+            self._debris_density_vector(), self.compromised_for > 0, self.config.debris_risk_gain)
 
     def _refresh_task_knowledge(self) -> float:
         gained = 0.0
         if self.config.task_knowledge_mode == "ground_catalog":
-            for task_idx, task in enumerate(self.tasks):
-                self.station_known_tasks[task_idx] = bool(task.active)
+            self.station_known_tasks[:] = self.tasks.active
         if not self.config.enable_local_task_discovery:
             return gained
-        discover_dist = self._discovery_distance_threshold()
-        for task_idx, task in enumerate(self.tasks):
-            if not task.active:
-                continue
-            task_pos = self._cartesian_from_orbit(
-                task.theta, task.radius, task.phi)
-            for i in range(self.num_agents):
-                if not self._is_alive(i):
-                    continue
-                if float(np.linalg.norm(self.positions[i] - task_pos)) <= discover_dist and not self.known_tasks[i, task_idx]:
-                    self.known_tasks[i, task_idx] = True
-                    gained += 1.0
-            if self.config.task_knowledge_mode == "local_discovery" and self._task_visible_from_ground(task):
-                self.station_known_tasks[task_idx] = True
+        active = self.tasks.active
+        discovered = self._task_distances() <= self._discovery_distance_threshold()
+        discovered &= (self.health > 0.0)[:, None] & active[None, :]
+        gained = float(np.count_nonzero(discovered & ~self.known_tasks))
+        self.known_tasks |= discovered
+        if self.config.task_knowledge_mode == "local_discovery":
+            self.station_known_tasks |= active & self._tasks_visible_from_ground()
         return gained
 
-    def _task_visible_from_ground(self, task: Task) -> bool:
-        for gs_theta in self.ground_thetas:
-            if abs(self._angle_delta(task.theta, float(gs_theta))) <= 1.5 * self.config.ground_contact_angle:
-                return True
-        return False
+    def _task_distances(self) -> np.ndarray:
+        """Satellite-to-task distance matrix of shape ``(N, T)``, cached per step."""
+        return self.derived_cache.get(
+            "task_distances",
+            lambda: pairwise_distances(self.positions, self.tasks.positions),
+            ("positions", "tasks"),
+        )
+
+    def _tasks_visible_from_ground(self) -> np.ndarray:
+        d_theta = wrapped_angle_delta(
+            self.tasks.theta[:, None].astype(np.float64), self.ground_thetas[None, :].astype(np.float64))
+        return (np.abs(d_theta) <= 1.5 * self.config.ground_contact_angle).any(axis=1)
 
     def task_is_known(self, task_idx: int) -> bool:
         if task_idx < 0 or task_idx >= len(self.tasks):
@@ -476,44 +893,63 @@ class OrbitalCore:
         return self._ground_route_distance(src) is not None
 
     def _ground_route_distance(self, src: int) -> int | None:
-        if not self._is_alive(src):
-            return None
-        if self._direct_ground_contact(src):
-            return 0
-        visited = {src}
-        frontier = [(src, 0)]
-        while frontier:
-            node, dist = frontier.pop(0)
-            for nxt in np.where(self.comm_adj[node])[0]:
-                j = int(nxt)
-                if j in visited or not self._is_alive(j):
-                    continue
-                if self._direct_ground_contact(j):
-                    return dist + 1
-                visited.add(j)
-                frontier.append((j, dist + 1))
-        return None
+        dist = int(self._ground_route_table()[src])
+        return None if dist < 0 else dist
+
+    def _ground_route_table(self) -> np.ndarray:
+        """Hop count from every satellite to ground, or -1 when unreachable.
+
+        One reverse multi-source BFS from all satellites in direct ground
+        contact, through alive satellites only. The table is cached until the
+        comm graph, positions, or the alive set change.
+        """
+        return self.derived_cache.get(
+            "ground_route", self._compute_ground_route_table, ("positions", "health", "comm"))
+
+    def _compute_ground_route_table(self) -> np.ndarray:
+        alive = self.health > 0.0
+        dist = np.full((self.num_agents,), -1, dtype=np.int32)
+        frontier = self._ground_contact_mask() & alive
+        hops = 0
+        while frontier.any():
+            dist[frontier] = hops
+            hops += 1
+            frontier = self.comm_graph.adjacent_to(frontier) & alive & (dist < 0)
+        return dist
 
     def _ground_route_score(self, i: int) -> float:
         if not self._is_alive(i):
             return -1.0
-        route_dist = self._ground_route_distance(i)
-        if route_dist is not None:
-            return 4.0 - min(3.0, float(route_dist))
-        return float(self.comm_adj[i].sum()) / max(1, self.num_agents - 1)
+        return float(self._ground_route_scores()[i])
+
+    def _ground_route_scores(self) -> np.ndarray:
+        """Relay preference of every satellite, ignoring whether it is alive.
+
+        Four minus the hops to ground (at least one) when a route exists,
+        otherwise the normalized comm degree.
+        """
+        return self.derived_cache.get(
+            "ground_route_scores", self._compute_ground_route_scores, ("positions", "health", "comm"))
+
+    def _compute_ground_route_scores(self) -> np.ndarray:
+        dist = self._ground_route_table()
+        return np.where(
+            dist >= 0,
+            4.0 - np.minimum(3.0, dist.astype(np.float64)),
+            self._comm_degree() / max(1, self.num_agents - 1),
+        )
 
     def _best_relay_neighbor(self, i: int) -> int | None:
-        neighbors = np.where(self.comm_adj[i])[0]
+        neighbors = self.comm_graph.neighbors(i)
+        neighbors = neighbors[self.health[neighbors] > 0.0]
         if len(neighbors) == 0:
             return None
-        score_i = self._ground_route_score(i)
-        candidates = [int(j) for j in neighbors if self._is_alive(
-            int(j)) and self._ground_route_score(int(j)) > score_i]
-        if not candidates:
-            candidates = [int(j) for j in neighbors if self._is_alive(int(j))]
-        if not candidates:
-            return None
-        return max(candidates, key=self._ground_route_score)
+        candidate_scores = self._ground_route_scores()[neighbors]
+        better = candidate_scores > self._ground_route_score(i)
+        if better.any():
+            neighbors, candidate_scores = neighbors[better], candidate_scores[better]
+        # argmax keeps the first of equal scores, in neighbour order.
+        return int(neighbors[np.argmax(candidate_scores)])
 
     def _apply_energy_cost(self, i: int, action_name: str) -> float:
         cost = float(self.config.energy_costs.get(
@@ -525,13 +961,13 @@ class OrbitalCore:
         return cost
 
     def _wake_malware(self) -> None:
-        if self.rng.random() >= self.config.adversarial_rate:
+        if self.streams.malware.random() >= self.config.adversarial_rate:
             return
         healthy = np.where((self.compromised_for <= 0)
                            & (self.health > 0.0))[0]
         if len(healthy) == 0:
             return
-        idx = int(self.rng.choice(healthy))
+        idx = int(self.streams.malware.choice(healthy))
         self.compromised_for[idx] = self.config.compromise_duration
         self.malware_awake[idx] = True
 
@@ -539,36 +975,36 @@ class OrbitalCore:
         self.last_action_forced[i] = False
         if self.compromised_for[i] <= 0:
             return act
-        if self.rng.random() >= self.config.malware_forced_action_prob:
+        if self.streams.malware.random() >= self.config.malware_forced_action_prob:
             return act
         self.last_action_forced[i] = True
         nearest = self._nearest_debris_cloud(i)
-        if nearest is not None and self.rng.random() < 0.55:
+        if nearest is not None and self.streams.malware.random() < 0.55:
             cloud = nearest
             if cloud.radius > float(self.orbit_radius[i]) + 0.05:
                 return 4  # UP toward the debris band
             if cloud.radius < float(self.orbit_radius[i]) - 0.05:
                 return 3  # DN toward the debris band
             return 7  # drift through the hazard
-        if self._is_low_orbit(i) or self.rng.random() < 0.70:
+        if self._is_low_orbit(i) or self.streams.malware.random() < 0.70:
             return 3  # DN
         return 7
 
-    def _nearest_debris_cloud(self, i: int) -> DebrisCloud | None:
-        if not self.config.enable_debris or not self.debris_clouds:
+    def _nearest_debris_cloud(self, i: int) -> DebrisCloudView | None:
+        if not self.config.enable_debris or len(self.debris_clouds) == 0:
             return None
-        active = [d for d in self.debris_clouds if d.density > 1e-4]
-        if not active:
+        clouds = self.debris_clouds
+        active = np.flatnonzero(clouds.density > 1e-4)
+        if len(active) == 0:
             return None
-        return min(
-            active,
-            key=lambda d: abs(self._angle_delta(float(
-                self.orbit_theta[i]), d.theta)) + abs(float(self.orbit_radius[i]) - d.radius),
-        )
-
-    def _drain_malware(self) -> tuple[np.ndarray, np.ndarray]:
-        energy_loss = np.zeros((self.num_agents,), dtype=np.float32)
-        health_loss = np.zeros((self.num_agents,), dtype=np.float32)
+        theta = clouds.theta[active].astype(np.float64)
+        d_theta = ((theta - float(self.orbit_theta[i]) + np.pi) % (2.0 * np.pi)) - np.pi
+        score = np.abs(d_theta) + np.abs(
+            float(self.orbit_radius[i]) - clouds.radius[active].astype(np.float64))
+        return clouds[int(active[np.argmin(score)])]
+
+    def _drain_malware(self, energy_loss: np.ndarray, health_loss: np.ndarray) -> None:
+        """Apply malware drain, writing the per-satellite losses into the outputs."""
         for i in range(self.num_agents):
             if not self._is_alive(i) or self.compromised_for[i] <= 0:
                 continue
@@ -578,92 +1014,175 @@ class OrbitalCore:
             self.health[i] -= h
             energy_loss[i] = e
             health_loss[i] = h
-        return energy_loss, health_loss
 
     def step(self, actions: dict[str, int], agent_names: list[str]) -> tuple[dict[str, float], dict[str, bool], dict[str, bool], dict[str, dict[str, Any]]]:
-        n = self.num_agents
-        serviced = np.zeros((n,), dtype=np.float32)
-        delivered = np.zeros((n,), dtype=np.float32)
-        ground_task_intake = np.zeros((n,), dtype=np.float32)
-        knowledge = np.zeros((n,), dtype=np.float32)
-        energy_spent = np.zeros((n,), dtype=np.float32)
-        overflow = np.zeros((n,), dtype=np.float32)
-        data_loss = np.zeros((n,), dtype=np.float32)
-        health_loss = np.zeros((n,), dtype=np.float32)
-        cyber_penalty = np.zeros((n,), dtype=np.float32)
-        jam_penalty = np.zeros((n,), dtype=np.float32)
-        forced_penalty = np.zeros((n,), dtype=np.float32)
-        atmospheric = np.zeros((n,), dtype=np.float32)
-        debris_risk = np.zeros((n,), dtype=np.float32)
-        collision = np.zeros((n,), dtype=np.float32)
-        executed_actions = ["idle"] * n
+        """Dict-keyed wrapper around `step_array` for the PettingZoo frontends.
 
+        Satellite ``i`` is addressed as ``agent_names[i]``; agents missing from
+        `actions` idle.
+        """
+        action_array = np.full((self.num_agents,), 7, dtype=np.int64)
+        for i, name in enumerate(agent_names):
+            action_array[i] = int(actions.get(name, 7))
+        rewards, terminations, truncations = self.step_array(action_array)
+        infos = self.build_infos()
+        return (
+            {name: float(rewards[i]) for i, name in enumerate(agent_names)},
+            {name: bool(terminations[i]) for i, name in enumerate(agent_names)},
+            {name: bool(truncations[i]) for i, name in enumerate(agent_names)},
+            {name: infos[i] for i, name in enumerate(agent_names)},
+        )
+
+    def step_array(self, actions: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Advance one step with one integer action per satellite.
+
+        Returns ``(rewards, terminations, truncations)`` as arrays of shape
+        ``(num_satellites,)``. When the episode ends, its summary is stored in
+        `last_episode`; per-satellite infos are built on demand by `build_infos`.
+
+        The returned arrays and `reward_components` belong to the step
+        workspace allocated at `reset` and are overwritten by the next step.
+        """
+        actions = np.asarray(actions)
+        if actions.shape != (self.num_agents,):
+            raise ValueError(
+                f"actions must have shape {(self.num_agents,)}, got {actions.shape}")
+        # `VectorOrbitalCore` runs the same phases, batching the per-satellite
+        # ones and the body propagation across environments.
+        self._begin_step()
+        if self._use_compiled_kernels:
+            self._apply_actions_compiled(actions)
+        else:
+            self._apply_actions(actions)
+        # Cyberscans above may have shortened infections.
+        self.invalidate_derived("cyber")
+        if self.config.enable_recharge:
+            self._apply_passive_recharge()
+        self._refresh_satellite_positions()
+        self._update_debris_clouds()
+        self.update_comm_graph()
+        self._share_task_knowledge()
+        if self._use_compiled_kernels:
+            self._apply_hazards_compiled()
+        else:
+            self._apply_hazards()
+        self._destroy_dead_satellites(self._reward_columns[REWARD_INDEX["data_loss"]])
+        self._update_tasks()
+        return self._end_step(actions)
+
+    def _begin_step(self) -> None:
+        """Start-of-step bookkeeping: malware wake-up and drain, knowledge refresh."""
+        self.reward_components.fill(0.0)
+        energy_spent, health_loss, cyber_penalty = (
+            self._reward_columns[REWARD_INDEX[name]] for name in ("energy", "health", "cyber"))
+        executed_actions = self.last_executed_actions
+        for i in range(self.num_agents):
+            executed_actions[i] = "idle"
+
+        self.streams.begin_step()
         self.jammed[:] = False
         self._wake_malware()
-        drained_energy, drained_health = self._drain_malware()
-        energy_spent += drained_energy
-        health_loss += drained_health
-        cyber_penalty += (self.compromised_for > 0).astype(np.float32) * 0.1
-        knowledge += self._refresh_task_knowledge() / max(1, n)
+        self._drain_malware(energy_spent, health_loss)
+        self.invalidate_derived("health", "cyber")
+        np.greater(self.compromised_for, 0, out=cyber_penalty)
+        cyber_penalty *= 0.1
+        self._share_task_knowledge()
 
-        for i, name in enumerate(agent_names):
-            if not self._is_alive(i):
-                continue
-            if not self._is_powered(i):
-                executed_actions[i] = "idle"
-                self._propagate_kepler(i)
-                continue
+        self.last_episode = None
+        self.info_epoch += 1
 
-            act = self._maybe_force_action(i, int(actions.get(name, 7)))
-            forced_penalty[i] += 1.0 if self.last_action_forced[i] else 0.0
-            action_name = self._action_name(act)
-            executed_actions[i] = action_name
-            energy_spent[i] += self._apply_energy_cost(i, action_name)
-            if self.energy[i] <= 0.0 and action_name != "lowpower":
-                self._propagate_kepler(i)
+    def _apply_actions(self, actions: np.ndarray) -> None:
+        """NumPy action loop: transition, payload and propagation per satellite."""
+        for i in range(self.num_agents):
+            if not self._is_alive(i):
                 continue
-
-            if action_name in {"relay_ground", "relay_sat"} and self.compromised_for[i] > 0 and self.rng.random() < self.config.malware_jam_prob:
-                self.jammed[i] = True
-                jam_penalty[i] += 1.0
-                cyber_penalty[i] += 0.5
-            elif action_name == "orbit_down":
-                self._apply_orbit_shift(i, -self.config.orbit_shift_step)
-            elif action_name == "orbit_up":
-                self._apply_orbit_shift(i, self.config.orbit_shift_step)
-            elif action_name == "observe":
-                serviced[i], overflow[i] = self._observe_task(i)
-            elif action_name == "relay_ground":
-                delivered[i], knowledge[i], ground_task_intake[i] = \
-                    self._relay_ground(i)
-            elif action_name == "relay_sat":
-                knowledge[i], data_loss[i] = self._relay_sat(i)
-            elif action_name == "cyberscan":
-                self.scan_boost[i] = 4
-                if self.compromised_for[i] > 0:
-                    self.compromised_for[i] = max(
-                        0, self.compromised_for[i] - self.config.scan_duration_reduction)
-                    if self.rng.random() < self.config.scan_clean_prob:
-                        self.compromised_for[i] = 0
-            elif action_name == "lowpower":
-                if self.config.enable_recharge and self._in_sunlight(i):
-                    self.energy[i] = min(self.config.energy_budget, float(
-                        self.energy[i] + self.config.recharge_rate))
-
+            if self._apply_action(i, int(actions[i])):
+                self._apply_payload(i, self.last_executed_actions[i])
             self._propagate_kepler(i)
 
-        if self.config.enable_recharge:
-            for i in range(n):
-                if self._is_alive(i) and self._in_sunlight(i):
-                    self.energy[i] = min(self.config.energy_budget, float(
-                        self.energy[i] + 0.15 * self.config.recharge_rate))
+    def _apply_action(self, i: int, act: int) -> bool:
+        """Apply satellite i's action except for its payload and propagation.
+
+        Resolves forced actions, energy costs, jamming, orbit shifts,
+        cyberscans and low-power recharge for an alive satellite. Returns
+        whether an observe or relay payload still has to be applied with
+        `_apply_payload`.
+        """
+        (energy_spent, cyber_penalty, jam_penalty, forced_penalty) = (
+            self._reward_columns[REWARD_INDEX[name]]
+            for name in ("energy", "cyber", "jam", "forced_action"))
+        executed_actions = self.last_executed_actions
+        if not self._is_powered(i):
+            executed_actions[i] = "idle"
+            return False
 
-        self._refresh_satellite_positions()
-        self._update_debris_clouds()
-        self.update_comm_graph()
-        knowledge += self._refresh_task_knowledge() / max(1, n)
+        act = self._maybe_force_action(i, act)
+        forced_penalty[i] += 1.0 if self.last_action_forced[i] else 0.0
+        action_name = self._action_name(act)
+        executed_actions[i] = action_name
+        energy_spent[i] += self._apply_energy_cost(i, action_name)
+        if self.energy[i] <= 0.0 and action_name != "lowpower":
+            return False
 
-        for i in range(n):
+        if action_name in {"relay_ground", "relay_sat"} and self.compromised_for[i] > 0 and self.streams.malware.random() < self.config.malware_jam_prob:
+            self.jammed[i] = True
+            jam_penalty[i] += 1.0
+            cyber_penalty[i] += 0.5
+        elif action_name == "orbit_down":
+            self._apply_orbit_shift(i, -self.config.orbit_shift_step)
+        elif action_name == "orbit_up":
+            self._apply_orbit_shift(i, self.config.orbit_shift_step)
+        elif action_name in {"observe", "relay_ground", "relay_sat"}:
+            return True
+        elif action_name == "cyberscan":
+            self.scan_boost[i] = 4
+            if self.compromised_for[i] > 0:
+                self.compromised_for[i] = max(
+                    0, self.compromised_for[i] - self.config.scan_duration_reduction)
+                if self.streams.malware.random() < self.config.scan_clean_prob:
+                    self.compromised_for[i] = 0
+        elif action_name == "lowpower":
+            if self.config.enable_recharge and self._in_sunlight(i):
+                self.energy[i] = min(self.config.energy_budget, float(
+                    self.energy[i] + self.config.recharge_rate))
+        return False
+
+    def _apply_payload(self, i: int, action_name: str) -> None:
+        """Observe and relay actions; they touch tasks, buffers and links."""
+        (serviced, delivered, ground_task_intake, knowledge, _, overflow, data_loss, *_) = self._reward_columns
+        if action_name == "observe":
+            serviced[i], overflow[i] = self._observe_task(i)
+        elif action_name == "relay_ground":
+            delivered[i], knowledge[i], ground_task_intake[i] = self._relay_ground(i)
+        else:
+            knowledge[i], data_loss[i] = self._relay_sat(i)
+
+    def _apply_passive_recharge(self) -> None:
+        """Sunlight recharge applied to every alive satellite after the actions."""
+        if self._use_compiled_kernels:
+            apply_passive_recharge(
+                self.health, self.energy, self._sunlight_mask(),
+                float(self.config.energy_budget), 0.15 * self.config.recharge_rate)
+            return
+        for i in range(self.num_agents):
+            if self._is_alive(i) and self._in_sunlight(i):
+                self.energy[i] = min(self.config.energy_budget, float(
+                    self.energy[i] + 0.15 * self.config.recharge_rate))
+
+    def _share_task_knowledge(self) -> None:
+        """Refresh task knowledge and credit the gain to the knowledge reward."""
+        knowledge = self._reward_columns[REWARD_INDEX["knowledge"]]
+        knowledge += self._refresh_task_knowledge() / max(1, self.num_agents)
+
+    def _apply_hazards(self) -> None:
+        """NumPy atmospheric drag and debris collision loop."""
+        columns = self._reward_columns
+        health_loss, atmospheric, debris_risk = (
+            columns[REWARD_INDEX[name]] for name in ("health", "atmospheric_drag", "debris_risk"))
+        executed_actions = self.last_executed_actions
+        # Health only changes for satellite i inside this loop, after its own
+        # Pc was read, so the cached Pc vector stays valid until the loop ends.
+        for i in range(self.num_agents):
             if not self._is_alive(i):
                 continue
             if self._is_low_orbit(i):
@@ -672,95 +1191,69 @@ class OrbitalCore:
                 self.health[i] -= loss
                 health_loss[i] += loss
                 atmospheric[i] += loss
-            pc = self._local_pc_estimate(i)
+            pc = self._local_pc_estimate(i) if self._is_alive(i) else 0.0
             if executed_actions[i] in {"orbit_down", "orbit_up"}:
                 pc *= (1.0 - self.config.debris_mitigation_factor)
             debris_risk[i] = pc
             if self.config.enable_debris and pc >= self.config.pc_alert_threshold and executed_actions[i] not in {"orbit_down", "orbit_up"}:
-                if self.rng.random() < self.config.pc_collision_scale * pc:
-                    loss = float(self.rng.uniform(self.config.debris_health_loss_min,
-                                 self.config.debris_health_loss_max) * max(0.25, pc))
-                    loss = min(float(self.health[i]), loss)
-                    self.health[i] -= loss
-                    health_loss[i] += loss
-                    collision[i] = 1.0
-                    if self.health[i] <= 0.0:
-                        lost = float(self.buffered_data[i])
-                        self.energy[i] = 0.0
-                        self.buffered_data[i] = 0.0
-                        data_loss[i] += lost
-
-        self._destroy_dead_satellites(data_loss)
-        self._update_tasks()
-        self.compromised_for = np.maximum(0, self.compromised_for - 1)
-        self.malware_awake = self.compromised_for > 0
-        self.scan_boost = np.maximum(0, self.scan_boost - 1)
-        self.last_executed_actions = executed_actions
+                self._debris_collision(i, pc)
+
+    def _debris_collision(self, i: int, pc: float) -> None:
+        """Draw whether satellite i at collision probability `pc` is hit, and apply the hit."""
+        columns = self._reward_columns
+        health_loss, collision, data_loss = (
+            columns[REWARD_INDEX[name]] for name in ("health", "collision", "data_loss"))
+        if self.streams.hazards.random() < self.config.pc_collision_scale * pc:
+            loss = float(self.streams.hazards.uniform(self.config.debris_health_loss_min,
+                         self.config.debris_health_loss_max) * max(0.25, pc))
+            loss = min(float(self.health[i]), loss)
+            self.health[i] -= loss
+            health_loss[i] += loss
+            collision[i] = 1.0
+            if self.health[i] <= 0.0:
+                lost = float(self.buffered_data[i])
+                self.energy[i] = 0.0
+                self.buffered_data[i] = 0.0
+                data_loss[i] += lost
+
+    def _end_step(self, actions: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Counters, rewards and episode end; returns the step outputs."""
+        reward_components = self.reward_components
+        isolation, failure = (
+            self._reward_columns[REWARD_INDEX[name]] for name in ("isolation", "failure"))
+        np.maximum(self.compromised_for - 1, 0, out=self.compromised_for)
+        np.greater(self.compromised_for, 0, out=self.malware_awake)
+        np.maximum(self.scan_boost - 1, 0, out=self.scan_boost)
+        self.invalidate_derived("health", "cyber")
         self.t += 1
 
-        alive = int((self.health > 0.0).sum())
-        isolated = self._isolated_count()
-        failures = float(n - alive)
-        components = {
-            "task": float(serviced.sum()),
-            "delivery": float(delivered.sum()),
-            "ground_task_intake": float(ground_task_intake.sum()),
-            "knowledge": float(knowledge.sum()),
-            "energy": float(energy_spent.sum()),
-            "overflow": float(overflow.sum()),
-            "data_loss": float(data_loss.sum()),
-            "health": float(health_loss.sum()),
-            "isolation": float(isolated),
-            "failure": failures,
-            "cyber": float(cyber_penalty.sum()),
-            "jam": float(jam_penalty.sum()),
-            "forced_action": float(forced_penalty.sum()),
-            "atmospheric_drag": float(atmospheric.sum()),
-            "debris_risk": float(debris_risk.sum()),
-            "collision": float(collision.sum()),
-        }
-        self.observed_total += float(serviced.sum())
-        self.knowledge_shared_total += float(knowledge.sum())
-        self.jam_count += int(jam_penalty.sum())
-        self.forced_action_count += int(forced_penalty.sum())
-        self.last_reward_components = components
-        shared = compute_shared_reward(components, self.config.reward_weights)
+        alive_mask = np.greater(self.health, 0.0, out=self._alive_scratch)
+        alive = int(np.count_nonzero(alive_mask))
+        np.equal(self._comm_degree(), 0, out=isolation)
+        isolation *= alive_mask
+        np.logical_not(alive_mask, out=failure)
+        totals = np.sum(reward_components, axis=0, out=self._reward_totals)
+        components = self.last_reward_components
+        components.update(zip(REWARD_COMPONENTS, totals.tolist()))
+        self.observed_total += components["task"]
+        self.knowledge_shared_total += components["knowledge"]
+        self.jam_count += int(components["jam"])
+        self.forced_action_count += int(components["forced_action"])
+        self._reward_totals64[...] = totals
+        shared = float(self._reward_totals64 @ self.reward_weight_vector)
         self.last_reward = shared
 
-        rewards = {}
-        for i, name in enumerate(agent_names):
-            if self.config.reward_mode == "local":
-                local_components = {
-                    "task": float(serviced[i]),
-                    "delivery": float(delivered[i]),
-                    "ground_task_intake": float(ground_task_intake[i]),
-                    "knowledge": float(knowledge[i]),
-                    "energy": float(energy_spent[i]),
-                    "overflow": float(overflow[i]),
-                    "data_loss": float(data_loss[i]),
-                    "health": float(health_loss[i]),
-                    "isolation": float(1.0 if self._is_alive(i) and self.comm_adj[i].sum() == 0 else 0.0),
-                    "failure": float(0.0 if self._is_alive(i) else 1.0),
-                    "cyber": float(cyber_penalty[i]),
-                    "jam": float(jam_penalty[i]),
-                    "forced_action": float(forced_penalty[i]),
-                    "atmospheric_drag": float(atmospheric[i]),
-                    "debris_risk": float(debris_risk[i]),
-                    "collision": float(collision[i]),
-                }
-                rewards[name] = compute_shared_reward(
-                    local_components, self.config.reward_weights)
-            else:
-                rewards[name] = shared
+        rewards = self._rewards
+        if self.config.reward_mode == "local":
+            self._reward_components64[...] = reward_components
+            np.matmul(self._reward_components64, self.reward_weight_vector, out=rewards)
+        else:
+            rewards.fill(shared)
 
         terminated = self._mission_failed()
         trunc = self.t >= self.config.max_steps
-        terminations = {name: terminated for name in agent_names}
-        truncations = {name: trunc for name in agent_names}
-        infos = {name: self._build_info(i)
-                 for i, name in enumerate(agent_names)}
         if terminated or trunc:
-            episode = {
+            self.last_episode = {
                 "steps": self.t,
                 "delivered": self.delivered_total,
                 "delivered_total": self.delivered_total,
@@ -774,29 +1267,131 @@ class OrbitalCore:
                 "last_reward": shared,
                 "alive": alive,
             }
-            for info in infos.values():
-                info["episode"] = episode
-        return rewards, terminations, truncations, infos
+        self._terminations.fill(terminated)
+        self._truncations.fill(trunc)
+        self.streams.end_step()
+        for hook in self.step_hooks:
+            hook(self, actions)
+        return rewards, self._terminations, self._truncations
+
+    def _draw_block(self, stream: np.random.Generator | BlockStream, count: int) -> tuple[np.ndarray, dict[str, Any] | None]:
+        """Pre-draw `count` uniforms from `stream` for a compiled kernel.
+
+        Returns the draws and the generator state before them; pass both to
+        `_consume_draws` so the stream advances by exactly the draws used,
+        matching the scalar ``rng.random()`` calls of the NumPy path. Block
+        streams hand out a view of their block instead (state is None).
+        """
+        if isinstance(stream, BlockStream):
+            return stream.reserve(count), None
+        state = stream.bit_generator.state
+        return stream.random(count), state
+
+    def _consume_draws(self, stream: np.random.Generator | BlockStream, state: dict[str, Any] | None, used: int) -> None:
+        if state is None:
+            stream.advance(used)
+            return
+        stream.bit_generator.state = state
+        stream.random(used)
+
+    def _apply_actions_compiled(self, actions: np.ndarray) -> None:
+        """Compiled counterpart of the action loop in `step_array`."""
+        cfg = self.config
+        energy_spent, cyber_penalty, jam_penalty, forced_penalty = (
+            self._reward_columns[REWARD_INDEX[name]]
+            for name in ("energy", "cyber", "jam", "forced_action"))
+        clouds = self.debris_clouds
+        if cfg.enable_debris:
+            cloud_active = clouds.density > 1e-4
+        else:
+            cloud_active = np.zeros((len(clouds),), dtype=np.bool_)
+        stream = self.streams.malware
+        draws, state = self._draw_block(stream, ACTION_DRAWS_PER_SATELLITE * self.num_agents)
+        used = dispatch_actions(
+            actions.astype(np.int64, copy=False), self.health, self.energy, self.compromised_for,
+            self.last_action_forced, self.jammed, self.scan_boost, self.orbit_semi_major_axis,
+            self.orbit_eccentricity, self.orbit_mean_anomaly, self.orbit_radius, self.orbit_theta,
+            self._sunlight_mask(), clouds.theta, clouds.radius, cloud_active,
+            self._energy_cost_vector, draws, self._executed_codes, self._run_payload,
+            forced_penalty, energy_spent, jam_penalty, cyber_penalty,
+            float(cfg.malware_forced_action_prob), float(cfg.malware_jam_prob),
+            int(cfg.scan_duration_reduction), float(cfg.scan_clean_prob),
+            bool(cfg.enable_recharge), float(cfg.recharge_rate), float(cfg.energy_budget),
+            float(cfg.orbit_shift_step), float(cfg.orbit_min_radius), float(cfg.orbit_max_radius),
+            float(cfg.low_orbit_margin), float(cfg.high_orbit_margin),
+            float(cfg.high_orbit_comm_cost_scale), float(cfg.kepler_constant),
+        )
+        self._consume_draws(stream, state, used)
+
+        executed_actions = self.last_executed_actions
+        for i, code in enumerate(self._executed_codes.tolist()):
+            executed_actions[i] = ACTION_MAP[code]
+        # Payloads run here in satellite order; they read nothing the
+        # transitions above write, so deferring them matches the NumPy loop.
+        for i in np.flatnonzero(self._run_payload).tolist():
+            self._apply_payload(i, executed_actions[i])
+
+    def _apply_hazards_compiled(self) -> None:
+        """Compiled counterpart of the atmospheric and collision loop."""
+        cfg = self.config
+        columns = self._reward_columns
+        stream = self.streams.hazards
+        draws, state = self._draw_block(stream, HAZARD_DRAWS_PER_SATELLITE * self.num_agents)
+        used = apply_hazards(
+            self.health, self.energy, self.buffered_data, self.orbit_radius,
+            self._pc_estimate_vector(), self._executed_codes, draws,
+            columns[REWARD_INDEX["health"]], columns[REWARD_INDEX["atmospheric_drag"]],
+            columns[REWARD_INDEX["debris_risk"]], columns[REWARD_INDEX["collision"]],
+            columns[REWARD_INDEX["data_loss"]],
+            float(cfg.orbit_min_radius), float(cfg.low_orbit_margin),
+            float(cfg.atmospheric_health_loss), bool(cfg.enable_debris),
+            float(cfg.debris_mitigation_factor), float(cfg.pc_alert_threshold),
+            float(cfg.pc_collision_scale), float(cfg.debris_health_loss_min),
+            float(cfg.debris_health_loss_max),
+        )
+        self._consume_draws(stream, state, used)
+
+    def build_infos(self) -> list[dict[str, Any]]:
+        """Per-satellite info dicts for the current state.
+
+        ``config.info_level`` selects the fields: none, the `SUMMARY_FIELDS`,
+        or all `INFO_FIELDS`. These are plain dicts that can be kept. With
+        ``"lazy"`` all fields are `LazyInfo` entries computed on first access,
+        which must be read before the next step or reset. The finished
+        episode's summary is always attached as ``"episode"`` when the last
+        step ended the episode.
+        """
+        level = self.config.info_level
+        if level == "none":
+            infos = [{} for _ in range(self.num_agents)]
+        elif level == "lazy":
+            fields = tuple(INFO_FIELDS)
+            infos = [LazyInfo(self, i, fields) for i in range(self.num_agents)]
+        elif level == "summary":
+            infos = [{name: INFO_FIELDS[name](self, i) for name in SUMMARY_FIELDS}
+                     for i in range(self.num_agents)]
+        else:
+            infos = [self._build_info(i) for i in range(self.num_agents)]
+        if self.last_episode is not None:
+            for info in infos:
+                info["episode"] = self.last_episode
+        return infos
 
     def _observe_task(self, i: int) -> tuple[float, float]:
-        sat_pos = self.positions[i]
-        sensing_dist = self._sensing_distance_threshold()
-        for task_idx, task in enumerate(self.tasks):
-            if not task.active or not self.known_tasks[i, task_idx]:
-                continue
-            task_pos = self._cartesian_from_orbit(
-                task.theta, task.radius, task.phi)
-            if float(np.linalg.norm(sat_pos - task_pos)) <= sensing_dist:
-                gain = min(self.config.obs_data_gain * task.priority, max(0.0,
-                           self.config.data_capacity - float(self.buffered_data[i])))
-                overflow = max(0.0, self.config.obs_data_gain *
-                               task.priority - gain)
-                self.buffered_data[i] += gain
-                task.active = False
-                self.known_tasks[:, task_idx] = False
-                self.station_known_tasks[task_idx] = False
-                return float(gain), float(overflow)
-        return 0.0, 0.0
+        in_range = self._task_distances()[i] <= self._sensing_distance_threshold()
+        candidates = np.flatnonzero(in_range & self.tasks.active & self.known_tasks[i])
+        if len(candidates) == 0:
+            return 0.0, 0.0
+        task_idx = int(candidates[0])
+        priority = float(self.tasks.priority[task_idx])
+        gain = min(self.config.obs_data_gain * priority, max(0.0,
+                   self.config.data_capacity - float(self.buffered_data[i])))
+        overflow = max(0.0, self.config.obs_data_gain * priority - gain)
+        self.buffered_data[i] += gain
+        self.tasks.active[task_idx] = False
+        self.known_tasks[:, task_idx] = False
+        self.station_known_tasks[task_idx] = False
+        return float(gain), float(overflow)
 
     def _relay_ground(self, i: int) -> tuple[float, float, float]:
         if self.jammed[i] or not self._direct_ground_contact(i):
@@ -851,28 +1446,49 @@ class OrbitalCore:
             self.jammed[i] = False
 
     def _update_tasks(self) -> None:
-        for idx, task in enumerate(self.tasks):
-            if task.active:
-                self._propagate_body(task)
-                task.age += 1
-                if task.age > 25:
-                    task.active = False
-                    self.known_tasks[:, idx] = False
-                    self.station_known_tasks[idx] = False
-                elif self.config.task_priority_mode == "dynamic":
-                    task.priority = float(
-                        np.clip(task.priority + self.rng.uniform(-0.05, 0.08), 0.1, 1.0))
-            elif self.rng.random() < self.config.task_spawn_rate:
-                self.tasks[idx] = self._spawn_task()
-                self.known_tasks[:, idx] = False
-                self.station_known_tasks[idx] = self.config.task_knowledge_mode == "ground_catalog"
-
-    def _isolated_count(self) -> int:
-        cnt = 0
-        for i in range(self.num_agents):
-            if self._is_alive(i) and self.comm_adj[i].sum() == 0:
-                cnt += 1
-        return cnt
+        update = self._draw_task_update()
+        self.tasks.propagate(update[0], self.config.kepler_constant)
+        self._apply_task_update(update)
+
+    def _draw_task_update(self) -> tuple[Any, ...]:
+        """Take this step's task draws; `_apply_task_update` applies them after propagation."""
+        self.invalidate_derived("tasks")
+        tasks = self.tasks
+        rng = self.streams.tasks
+        active = tasks.active.copy()
+        expired = active & (tasks.age + 1 > 25)
+        drifting = active & ~expired if self.config.task_priority_mode == "dynamic" else None
+        # Draws follow the original per-task order (drift for live tasks,
+        # respawn check and spawn for idle ones); see `_draw_debris_update`.
+        spawn_rate = self.config.task_spawn_rate
+        spawn_width = self._orbit_draws + 1
+        drift = np.zeros((len(tasks),), dtype=np.float64)
+        respawn: list[int] = []
+        respawn_draws: list[np.ndarray] = []
+        for idx in range(len(tasks)):
+            if active[idx]:
+                if drifting is not None and drifting[idx]:
+                    drift[idx] = rng.uniform(-0.05, 0.08)
+            elif rng.random() < spawn_rate:
+                respawn.append(idx)
+                respawn_draws.append(rng.random(spawn_width))
+        return active, expired, drifting, drift, respawn, respawn_draws
+
+    def _apply_task_update(self, update: tuple[Any, ...]) -> None:
+        active, expired, drifting, drift, respawn, respawn_draws = update
+        tasks = self.tasks
+        tasks.age[active] += 1
+        tasks.active[expired] = False
+        self.known_tasks[:, expired] = False
+        self.station_known_tasks[expired] = False
+        if drifting is not None:
+            tasks.priority[drifting] = np.clip(tasks.priority[drifting] + drift[drifting], 0.1, 1.0)
+
+        if respawn:
+            respawn = np.array(respawn)
+            self._spawn_tasks(respawn, np.array(respawn_draws))
+            self.known_tasks[:, respawn] = False
+            self.station_known_tasks[respawn] = self.config.task_knowledge_mode == "ground_catalog"
 
     def _mission_failed(self) -> bool:
         alive = int((self.health > 0.0).sum())
@@ -901,7 +1517,7 @@ class OrbitalCore:
         sunlight = 1.0 if self._in_sunlight(i) else 0.0
         ground_contact = 1.0 if self._direct_ground_contact(i) else 0.0
         route_ground = 1.0 if self._has_path_to_ground(i) else 0.0
-        deg_norm = float(self.comm_adj[i].sum()) / max(1, self.num_agents - 1)
+        deg_norm = float(self._comm_degree()[i]) / max(1, self.num_agents - 1)
         buffer_norm = min(
             float(self.buffered_data[i]) / max(self.config.data_capacity, 1e-6), 1.0)
         capacity_remaining = 1.0 - buffer_norm
@@ -912,7 +1528,7 @@ class OrbitalCore:
         suspicious = 1.0 if self.scan_boost[i] > 0 else 0.0
         jammed = 1.0 if self.jammed[i] else 0.0
         forced = 1.0 if self.last_action_forced[i] else 0.0
-        neighbors = np.where(self.comm_adj[i])[0]
+        neighbors = self.comm_graph.neighbors(i)
         compromised_neighbors = 0.0
         if len(neighbors) > 0:
             compromised_neighbors = float(
@@ -944,61 +1560,91 @@ class OrbitalCore:
 
         if self.compromised_for[i] > 0 and self.config.spoof_mode == "obs_spoof":
             obs = obs.copy()
-            obs[0] = float(self.rng.uniform(0.0, 1.0))
-            obs[2] = float(self.rng.uniform(0.0, 1.0))
-            obs[6:13] = self.rng.uniform(0.0, 1.0, size=(7,))
-            obs[13:15] = self.rng.uniform(0.0, 1.0, size=(2,))
+            rng = self.streams.observation
+            obs[0] = float(rng.uniform(0.0, 1.0))
+            obs[2] = float(rng.uniform(0.0, 1.0))
+            obs[6:13] = rng.uniform(0.0, 1.0, size=(7,))
+            obs[13:15] = rng.uniform(0.0, 1.0, size=(2,))
         return obs
 
+    def observe_all(self, out: np.ndarray | None = None) -> np.ndarray:
+        """Vectorized `observe` for every satellite.
+
+        Fills `out` (default: a buffer owned by the core and reused across
+        calls) with one observation row per satellite. Rows are bit-identical
+        to calling `observe(i)` for ``i = 0..N-1`` in order, including the RNG
+        draws used by ``obs_spoof``. Callers keeping observations past the
+        next call must copy them.
+        """
+        if out is None:
+            out = self._obs_buffer
+        cfg = self.config
+        n = self.num_agents
+        degree = self._comm_degree()
+        compromised = self.compromised_for > 0
+        buffer_norm = np.minimum(
+            self.buffered_data / max(cfg.data_capacity, 1e-6), 1.0)
+        known_count, known_prio = self._known_local_task_pressure_all()
+        neighbor_count = np.maximum(degree, 1)
+        compromised_neighbors = self.comm_graph.count_neighbors(compromised) / neighbor_count
+        alive_frac = float((self.health > 0.0).sum()) / n
+
+        out[:, 0] = self.energy / max(cfg.energy_budget, 1e-6)
+        out[:, 1] = self.health / max(cfg.health_budget, 1e-6)
+        out[:, 2] = self.orbit_theta.astype(np.float64) / (2.0 * np.pi)
+        out[:, 3] = np.clip(
+            (self.orbit_radius.astype(np.float64) - cfg.orbit_min_radius)
+            / max(1e-6, cfg.orbit_max_radius - cfg.orbit_min_radius),
+            -1.0,
+            1.0,
+        )
+        if cfg.world_dim == 3:
+            out[:, 4] = (self.orbit_phi.astype(np.float64) + cfg.inclination_max) / max(
+                1e-6, 2.0 * cfg.inclination_max)
+        else:
+            out[:, 4] = 0.0
+        out[:, 5] = self._sunlight_mask()
+        out[:, 6] = self._ground_contact_mask()
+        out[:, 7] = self._ground_route_table() >= 0
+        out[:, 8] = degree / max(1, n - 1)
+        out[:, 9] = buffer_norm
+        out[:, 10] = 1.0 - buffer_norm
+        out[:, 11] = known_count
+        out[:, 12] = known_prio
+        out[:, 13] = np.minimum(self._debris_density_vector(), 1.0)
+        out[:, 14] = self._pc_estimate_vector()
+        out[:, 15] = compromised
+        out[:, 16] = self.scan_boost > 0
+        out[:, 17] = self.jammed
+        out[:, 18] = np.where(degree > 0, compromised_neighbors, 0.0)
+        out[:, 19] = np.where(self.last_action_forced, -alive_frac, alive_frac)
+
+        if cfg.spoof_mode == "obs_spoof":
+            spoofed = np.flatnonzero(compromised)
+            if len(spoofed) > 0:
+                # Same draw order as observe(i): theta slot first after energy,
+                # then the contact..priority block, then debris and Pc.
+                noise = self.streams.observation.uniform(0.0, 1.0, size=(len(spoofed), 11))
+                out[spoofed, 0] = noise[:, 0]
+                out[spoofed, 2] = noise[:, 1]
+                out[spoofed, 6:15] = noise[:, 2:11]
+        return out
+
+    def _known_local_task_pressure_all(self) -> tuple[np.ndarray, np.ndarray]:
+        near = self._task_distances() <= self._discovery_distance_threshold()
+        near &= self.known_tasks & self.tasks.active[None, :]
+        scale = max(1.0, self.config.num_tasks)
+        local_count = np.minimum(near.sum(axis=1) / scale, 1.0)
+        local_prio = np.minimum(np.where(near, self.tasks.priority[None, :], 0.0).sum(axis=1) / scale, 1.0)
+        return local_count, local_prio
+
     def _known_local_task_pressure(self, i: int) -> tuple[float, float]:
-        local_count = 0.0
-        local_prio = 0.0
-        sensing_dist = self._discovery_distance_threshold()
-        sat_pos = self.positions[i]
-        for task_idx, task in enumerate(self.tasks):
-            if not task.active or not self.known_tasks[i, task_idx]:
-                continue
-            task_pos = self._cartesian_from_orbit(
-                task.theta, task.radius, task.phi)
-            if float(np.linalg.norm(sat_pos - task_pos)) <= sensing_dist:
-                local_count += 1.0
-                local_prio += task.priority
-        local_count = min(local_count / max(1.0, self.config.num_tasks), 1.0)
-        local_prio = min(local_prio / max(1.0, self.config.num_tasks), 1.0)
-        return float(local_count), float(local_prio)
+        near = self._task_distances()[i] <= self._discovery_distance_threshold()
+        near &= self.known_tasks[i] & self.tasks.active
+        scale = max(1.0, self.config.num_tasks)
+        local_count = min(float(np.count_nonzero(near)) / scale, 1.0)
+        local_prio = min(float(self.tasks.priority[near].sum()) / scale, 1.0)
+        return local_count, local_prio
 
     def _build_info(self, i: int) -> dict[str, Any]:
-        return {
-            "energy": float(self.energy[i]),
-            "health": float(self.health[i]),
-            "alive": bool(self._is_alive(i)),
-            "compromised": bool(self.compromised_for[i] > 0),
-            "malware_awake": bool(self.malware_awake[i]),
-            "jammed": bool(self.jammed[i]),
-            "last_action_forced": bool(self.last_action_forced[i]),
-            "local_degree": int(self.comm_adj[i].sum()),
-            "buffered_data": float(self.buffered_data[i]),
-            "known_tasks": int(self.known_tasks[i].sum()),
-            "theta": float(self.orbit_theta[i]),
-            "phi": float(self.orbit_phi[i]),
-            "radius": float(self.orbit_radius[i]),
-            "semi_major_axis": float(self.orbit_semi_major_axis[i]),
-            "eccentricity": float(self.orbit_eccentricity[i]),
-            "mean_anomaly": float(self.orbit_mean_anomaly[i]),
-            "arg_periapsis": float(self.orbit_arg_periapsis[i]),
-            "inclination": float(self.orbit_inclination[i]),
-            "raan": float(self.orbit_raan[i]),
-            "sunlight": bool(self._in_sunlight(i)),
-            "ground_contact": bool(self._direct_ground_contact(i)),
-            "ground_route": bool(self._has_path_to_ground(i)),
-            "local_debris_density": float(self._local_debris_density(i)),
-            "local_pc_estimate": float(self._local_pc_estimate(i)),
-            "last_executed_action": self.last_executed_actions[i],
-            "delivered_total": float(self.delivered_total),
-            "observed_total": float(self.observed_total),
-            "knowledge_shared": float(self.knowledge_shared_total),
-            "jam_count": int(self.jam_count),
-            "forced_actions": int(self.forced_action_count),
-            "time": self.t,
-            "reward_components": dict(self.last_reward_components),
-        }
+        return {name: field(self, i) for name, field in INFO_FIELDS.items()}
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from orbital.envs.core.kepler import TWO_PI, polar_from_positions, positions_from_elements
+
+if TYPE_CHECKING:
+    from orbital.envs.core.bodies import BodyCatalog
+
+
+# Elements that fix a body's orbit; the mean anomaly only selects the point on it.
+ORBIT_SHAPE_FIELDS = ("semi_major_axis", "eccentricity", "arg_periapsis", "inclination", "raan")
+
+
+class BodyEphemeris:
+    """Piecewise-cubic position tables for the bodies of one catalog.
+
+    When a body's orbit changes (at spawn), its world position over one full
+    period is tabulated at `samples` evenly spaced mean anomalies together
+    with the derivative, and stored as cubic Hermite coefficients per
+    segment. Positions then cost one coefficient lookup and a cubic
+    evaluation instead of a Newton solve.
+
+    Each table is checked against the Newton solver at the segment midpoints,
+    where the Hermite error term peaks, so `max_error` is an estimate of the
+    largest error rather than a bound (in practice it is within a fraction of
+    a percent of the maximum over a dense grid). Bodies whose estimate
+    exceeds `tolerance` (world units) are marked `exact` and keep using the
+    solver. `OrbitalCore` gives tables to debris clouds only.
+
+    `BodyCatalog.set_elements` builds the tables of the bodies it spawns.
+    Owners that overwrite element columns directly (state loads, restores)
+    call `invalidate`; the next lookup then rebuilds only the bodies whose
+    elements differ from the ones their table was built from.
+    """
+
+    def __init__(self, capacity: int, world_dim: int, samples: int = 64, tolerance: float = 1e-4):
+        self.world_dim = world_dim
+        self.samples = samples
+        self.tolerance = tolerance
+        self.segment = TWO_PI / samples
+        self.coefficients = np.zeros((capacity, samples, 4, world_dim), dtype=np.float64)
+        # NaN never compares equal, so every body starts out stale.
+        self.elements = {name: np.full((capacity,), np.nan) for name in ORBIT_SHAPE_FIELDS}
+        self.exact = np.zeros((capacity,), dtype=np.bool_)
+        self.max_error = np.zeros((capacity,), dtype=np.float64)
+        self.builds = 0
+        self._verify = True
+
+    def invalidate(self) -> None:
+        """Re-check every body against its table on the next lookup."""
+        self._verify = True
+
+    def build(self, catalog: BodyCatalog, rows: np.ndarray) -> None:
+        """Tabulate the current orbits of `rows` and record their midpoint error estimate."""
+        count = len(rows)
+        samples = self.samples
+        # Nodes 0..samples and the midpoints between them, per body.
+        anomalies = np.concatenate([
+            np.arange(samples + 1, dtype=np.float64) * self.segment,
+            (np.arange(samples, dtype=np.float64) + 0.5) * self.segment,
+        ])
+        points = anomalies.shape[0]
+        elements = {name: np.repeat(getattr(catalog, name)[rows], points) for name in ORBIT_SHAPE_FIELDS}
+        positions, rates = positions_from_elements(
+            elements["semi_major_axis"],
+            elements["eccentricity"],
+            np.tile(anomalies, count),
+            elements["arg_periapsis"],
+            elements["inclination"],
+            elements["raan"],
+            self.world_dim,
+            with_rates=True,
+        )
+        positions = positions.reshape(count, points, self.world_dim)
+        rates = rates.reshape(count, points, self.world_dim) * self.segment
+
+        start, end = positions[:, :samples], positions[:, 1:samples + 1]
+        start_rate, end_rate = rates[:, :samples], rates[:, 1:samples + 1]
+        delta = end - start
+        coefficients = self.coefficients[rows]
+        coefficients[:, :, 0] = start
+        coefficients[:, :, 1] = start_rate
+        coefficients[:, :, 2] = 3.0 * delta - 2.0 * start_rate - end_rate
+        coefficients[:, :, 3] = start_rate + end_rate - 2.0 * delta
+        self.coefficients[rows] = coefficients
+
+        midpoint = coefficients[:, :, 0] + 0.5 * (
+            coefficients[:, :, 1] + 0.5 * (coefficients[:, :, 2] + 0.5 * coefficients[:, :, 3]))
+        error = np.linalg.norm(midpoint - positions[:, samples + 1:], axis=-1).max(axis=1)
+        self.max_error[rows] = error
+        self.exact[rows] = error > self.tolerance
+        for name in ORBIT_SHAPE_FIELDS:
+            self.elements[name][rows] = getattr(catalog, name)[rows]
+        self.builds += count
+
+    def coordinates(
+        self, catalog: BodyCatalog, indices: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Same contract as `coordinates_from_elements` for the bodies at `indices`."""
+        if self._verify:
+            stale = np.zeros((len(catalog),), dtype=np.bool_)
+            for name in ORBIT_SHAPE_FIELDS:
+                stale |= getattr(catalog, name) != self.elements[name]
+            if stale.any():
+                self.build(catalog, np.flatnonzero(stale))
+            self._verify = False
+
+        scaled = np.mod(catalog.mean_anomaly[indices], TWO_PI) / self.segment
+        segment = np.minimum(scaled.astype(np.intp), self.samples - 1)
+        offset = (scaled - segment)[:, None]
+        c = self.coefficients[indices, segment]
+        positions = c[:, 0] + offset * (c[:, 1] + offset * (c[:, 2] + offset * c[:, 3]))
+
+        exact = self.exact[indices]
+        if exact.any():
+            rows = indices[exact]
+            positions[exact] = positions_from_elements(
+                catalog.semi_major_axis[rows],
+                catalog.eccentricity[rows],
+                catalog.mean_anomaly[rows],
+                catalog.arg_periapsis[rows],
+                catalog.inclination[rows],
+                catalog.raan[rows],
+                self.world_dim,
+            )
+        positions = positions.astype(np.float32)
+        return (positions, *polar_from_positions(positions, self.world_dim))
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+
+from orbital.envs.core.config import OrbitalConfig
+from orbital.envs.core.dynamics import OrbitalCore
+from orbital.envs.core.state import OrbitalState, StepOutputs
+from orbital.envs.core.streams import RandomStreams
+
+# Scratch cores reused by `step`, per thread and per config object.
+_SCRATCH_LIMIT = 8
+_scratch = threading.local()
+
+
+def _scratch_core(config: OrbitalConfig) -> OrbitalCore:
+    """Return this thread's scratch core for `config`, building it on first use.
+
+    Entries are keyed by the config object and keep it alive, so an id is
+    never reused while cached; the oldest entry is dropped past the limit.
+    """
+    cores: dict[int, tuple[OrbitalConfig, OrbitalCore]] | None = getattr(_scratch, "cores", None)
+    if cores is None:
+        cores = _scratch.cores = {}
+    entry = cores.get(id(config))
+    if entry is not None and entry[0] is config:
+        return entry[1]
+    if len(cores) >= _SCRATCH_LIMIT:
+        del cores[next(iter(cores))]
+    core = OrbitalCore.__new__(OrbitalCore)
+    core._setup(config)
+    cores[id(config)] = (config, core)
+    return core
+
+
+def step(
+    state: OrbitalState,
+    actions: np.ndarray,
+    rng: np.random.Generator | RandomStreams,
+    config: OrbitalConfig,
+) -> tuple[OrbitalState, StepOutputs]:
+    """Advance `state` by one step and return the successor state and outputs.
+
+    `state` is not modified, so it can be stepped again with other actions to
+    branch rollouts. The transition is the one `OrbitalCore.step_array`
+    applies in place: same arrays, same RNG draw order. `rng` is consumed as
+    the core would consume its own randomness; pass a copy to keep it.
+
+    `rng` is a generator with ``rng_streams="shared"``. With ``"split"`` it
+    must be a `RandomStreams` (such as ``copy.deepcopy(core.streams)``),
+    which carries every subsystem stream from one step to the next.
+    """
+    if config.rng_streams == "split" and not isinstance(rng, RandomStreams):
+        raise ValueError(
+            "rng_streams='split' needs a RandomStreams (e.g. a copy of core.streams), not a generator")
+    # The state is loaded into a cached core in place rather than a new
+    # `OrbitalCore.from_state` core, which would rebuild every buffer.
+    core = _scratch_core(config)
+    core.load_state(state)
+    core._attach_rng(rng)
+    rewards, terminations, truncations = core.step_array(actions)
+    outputs = StepOutputs(
+        rewards=rewards.copy(),
+        terminations=terminations.copy(),
+        truncations=truncations.copy(),
+        reward_components=core.reward_components.copy(),
+        executed_actions=tuple(core.last_executed_actions),
+        episode=core.last_episode,
+    )
+    return core.export_state(), outputs
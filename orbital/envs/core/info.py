@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from orbital.envs.core.dynamics import OrbitalCore
+
+
+InfoField = Callable[["OrbitalCore", int], Any]
+
+INFO_FIELDS: dict[str, InfoField] = {
+    "energy": lambda core, i: float(core.energy[i]),
+    "health": lambda core, i: float(core.health[i]),
+    "alive": lambda core, i: bool(core._is_alive(i)),
+    "compromised": lambda core, i: bool(core.compromised_for[i] > 0),
+    "malware_awake": lambda core, i: bool(core.malware_awake[i]),
+    "jammed": lambda core, i: bool(core.jammed[i]),
+    "last_action_forced": lambda core, i: bool(core.last_action_forced[i]),
+    "local_degree": lambda core, i: int(core._comm_degree()[i]),
+    "buffered_data": lambda core, i: float(core.buffered_data[i]),
+    "known_tasks": lambda core, i: int(core.known_tasks[i].sum()),
+    "theta": lambda core, i: float(core.orbit_theta[i]),
+    "phi": lambda core, i: float(core.orbit_phi[i]),
+    "radius": lambda core, i: float(core.orbit_radius[i]),
+    "semi_major_axis": lambda core, i: float(core.orbit_semi_major_axis[i]),
+    "eccentricity": lambda core, i: float(core.orbit_eccentricity[i]),
+    "mean_anomaly": lambda core, i: float(core.orbit_mean_anomaly[i]),
+    "arg_periapsis": lambda core, i: float(core.orbit_arg_periapsis[i]),
+    "inclination": lambda core, i: float(core.orbit_inclination[i]),
+    "raan": lambda core, i: float(core.orbit_raan[i]),
+    "sunlight": lambda core, i: bool(core._in_sunlight(i)),
+    "ground_contact": lambda core, i: bool(core._direct_ground_contact(i)),
+    "ground_route": lambda core, i: bool(core._has_path_to_ground(i)),
+    "local_debris_density": lambda core, i: float(core._local_debris_density(i)),
+    "local_pc_estimate": lambda core, i: float(core._local_pc_estimate(i)),
+    "last_executed_action": lambda core, i: core.last_executed_actions[i],
+    "delivered_total": lambda core, i: float(core.delivered_total),
+    "observed_total": lambda core, i: float(core.observed_total),
+    "knowledge_shared": lambda core, i: float(core.knowledge_shared_total),
+    "jam_count": lambda core, i: int(core.jam_count),
+    "forced_actions": lambda core, i: int(core.forced_action_count),
+    "time": lambda core, i: core.t,
+    "reward_components": lambda core, i: dict(core.last_reward_components),
+}
+
+# Per-satellite state that is read straight from the state arrays.
+SUMMARY_FIELDS = (
+    "energy",
+    "health",
+    "alive",
+    "compromised",
+    "jammed",
+    "buffered_data",
+    "last_executed_action",
+    "time",
+)
+
+
+class LazyInfo(dict):
+    """Info dict whose fields are computed from the core on first access.
+
+    Fields are evaluated against the core's current state, so they must be
+    read before the core steps or resets again; reading a field that was
+    never accessed after that raises `RuntimeError`. Converting with
+    ``dict(info)`` (or any call that lists values) evaluates every field at
+    once and returns a plain dict that can be kept.
+    """
+
+    __slots__ = ("_core", "_index", "_epoch", "_pending", "_order")
+
+    def __init__(self, core: OrbitalCore, index: int, fields: tuple[str, ...]):
+        super().__init__()
+        self._core = core
+        self._index = index
+        self._epoch = core.info_epoch
+        self._pending = {name: INFO_FIELDS[name] for name in fields}
+        self._order = fields
+
+    def _resolve(self, key: str) -> None:
+        if self._core.info_epoch != self._epoch:
+            raise RuntimeError(
+                f"info field {key!r} was read after the environment advanced; "
+                "read lazy infos before the next step or copy them with dict(info)")
+        dict.__setitem__(self, key, self._pending.pop(key)(self._core, self._index))
+
+    def _resolve_all(self) -> None:
+        if not self._pending:
+            return
+        for key in list(self._pending):
+            self._resolve(key)
+        # Restore the canonical field order, followed by any extra keys.
+        extras = {k: v for k, v in dict.items(self) if k not in self._order}
+        ordered = {k: dict.__getitem__(self, k) for k in self._order if dict.__contains__(self, k)}
+        dict.clear(self)
+        dict.update(self, ordered)
+        dict.update(self, extras)
+
+    def __getitem__(self, key):
+        if key in self._pending:
+            self._resolve(key)
+        return dict.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def __contains__(self, key) -> bool:
+        return key in self._pending or dict.__contains__(self, key)
+
+    def __len__(self) -> int:
+        return len(self._pending) + dict.__len__(self)
+
+    def __setitem__(self, key, value) -> None:
+        self._pending.pop(key, None)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key) -> None:
+        if self._pending.pop(key, None) is None:
+            dict.__delitem__(self, key)
+
+    def __iter__(self):
+        self._resolve_all()
+        return dict.__iter__(self)
+
+    def keys(self):
+        self._resolve_all()
+        return dict.keys(self)
+
+    def values(self):
+        self._resolve_all()
+        return dict.values(self)
+
+    def items(self):
+        self._resolve_all()
+        return dict.items(self)
+
+    def copy(self) -> dict[str, Any]:
+        self._resolve_all()
+        return dict(dict.items(self))
+
+    def pop(self, key, *default):
+        if key in self._pending:
+            self._resolve(key)
+        return dict.pop(self, key, *default)
+
+    def setdefault(self, key, default=None):
+        if key in self._pending:
+            self._resolve(key)
+        return dict.setdefault(self, key, default)
+
+    def update(self, *args, **kwargs) -> None:
+        for key in dict(*args, **kwargs):
+            self._pending.pop(key, None)
+        dict.update(self, *args, **kwargs)
+
+    def popitem(self):
+        self._resolve_all()
+        return dict.popitem(self)
+
+    def clear(self) -> None:
+        self._pending.clear()
+        dict.clear(self)
+
+    def __or__(self, other):
+        return self.copy() | other
+
+    def __eq__(self, other) -> bool:
+        self._resolve_all()
+        if isinstance(other, LazyInfo):
+            other._resolve_all()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other) -> bool:
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        self._resolve_all()
+        return dict.__repr__(self)
+
+    def __reduce__(self):
+        return dict, (self.copy(),)
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+TWO_PI = 2.0 * np.pi
+
+
+def solve_eccentric_anomaly(mean_anomaly: np.ndarray, eccentricity: np.ndarray, iterations: int = 8) -> np.ndarray:
+    """Solve Kepler's equation ``M = E - e sin(E)`` for a batch of bodies.
+
+    Mirrors the scalar Newton iteration in ``OrbitalCore`` (same starting
+    guess, iteration count and derivative floor) so both paths agree to
+    floating-point rounding.
+    """
+    mean = np.mod(np.asarray(mean_anomaly, dtype=np.float64), TWO_PI)
+    ecc = np.asarray(eccentricity, dtype=np.float64)
+    eccentric = np.where(ecc < 0.8, mean, np.pi)
+    for _ in range(iterations):
+        residual = eccentric - ecc * np.sin(eccentric) - mean
+        derivative = np.maximum(1e-8, 1.0 - ecc * np.cos(eccentric))
+        eccentric = eccentric - residual / derivative
+    return eccentric
+
+
+def perifocal_to_world(
+    x_perifocal: np.ndarray,
+    y_perifocal: np.ndarray,
+    arg_periapsis: np.ndarray,
+    inclination: np.ndarray,
+    raan: np.ndarray,
+    world_dim: int,
+) -> np.ndarray:
+    """Rotate perifocal-plane vectors into the world frame (float64, ``(n, world_dim)``)."""
+    arg = np.asarray(arg_periapsis, dtype=np.float64)
+    cos_arg = np.cos(arg)
+    sin_arg = np.sin(arg)
+    x_node = cos_arg * x_perifocal - sin_arg * y_perifocal
+    y_node = sin_arg * x_perifocal + cos_arg * y_perifocal
+
+    world = np.empty((x_node.shape[0], world_dim), dtype=np.float64)
+    if world_dim == 3:
+        inc = np.asarray(inclination, dtype=np.float64)
+        node = np.asarray(raan, dtype=np.float64)
+        cos_raan = np.cos(node)
+        sin_raan = np.sin(node)
+        y_plane = y_node * np.cos(inc)
+        world[:, 0] = cos_raan * x_node - sin_raan * y_plane
+        world[:, 1] = sin_raan * x_node + cos_raan * y_plane
+        world[:, 2] = y_node * np.sin(inc)
+    else:
+        world[:, 0] = x_node
+        world[:, 1] = y_node
+    return world
+
+
+def positions_from_elements(
+    semi_major_axis: np.ndarray,
+    eccentricity: np.ndarray,
+    mean_anomaly: np.ndarray,
+    arg_periapsis: np.ndarray,
+    inclination: np.ndarray,
+    raan: np.ndarray,
+    world_dim: int,
+    with_rates: bool = False,
+) -> np.ndarray | tuple[np.ndarray, np.ndarray]:
+    """Float64 world positions of Keplerian elements via the Newton solver.
+
+    With `with_rates` also returns their derivatives with respect to the
+    mean anomaly, which is what `BodyEphemeris` interpolates with.
+    """
+    a = np.asarray(semi_major_axis, dtype=np.float64)
+    e = np.asarray(eccentricity, dtype=np.float64)
+    eccentric_anomaly = solve_eccentric_anomaly(mean_anomaly, e)
+    cos_e = np.cos(eccentric_anomaly)
+    sin_e = np.sin(eccentric_anomaly)
+    minor = a * np.sqrt(1.0 - e ** 2)
+    x_perifocal = a * (cos_e - e)
+    y_perifocal = minor * sin_e
+    positions = perifocal_to_world(x_perifocal, y_perifocal, arg_periapsis, inclination, raan, world_dim)
+    if not with_rates:
+        return positions
+    # dE/dM = 1 / (1 - e cos E), from differentiating Kepler's equation.
+    anomaly_rate = 1.0 / np.maximum(1e-8, 1.0 - e * cos_e)
+    rates = perifocal_to_world(
+        -a * sin_e * anomaly_rate, minor * cos_e * anomaly_rate,
+        arg_periapsis, inclination, raan, world_dim)
+    return positions, rates
+
+
+def polar_from_positions(positions: np.ndarray, world_dim: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return float32 ``(theta, radius, phi)`` for float32 world positions."""
+    radius = np.sqrt(np.einsum("ij,ij->i", positions, positions))
+    theta = np.mod(np.arctan2(positions[:, 1], positions[:, 0]).astype(np.float64), TWO_PI)
+    if world_dim == 3:
+        phi = np.arcsin(np.clip(
+            positions[:, 2].astype(np.float64) / np.maximum(1e-6, radius), -1.0, 1.0))
+    else:
+        phi = np.zeros_like(theta)
+    return theta.astype(np.float32), radius.astype(np.float32), phi.astype(np.float32)
+
+
+def coordinates_from_elements(
+    semi_major_axis: np.ndarray,
+    eccentricity: np.ndarray,
+    mean_anomaly: np.ndarray,
+    arg_periapsis: np.ndarray,
+    inclination: np.ndarray,
+    raan: np.ndarray,
+    world_dim: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Propagate Keplerian elements to Cartesian and polar coordinates.
+
+    Returns ``(positions, theta, radius, phi)`` where ``positions`` has shape
+    ``(n, world_dim)`` and the others have shape ``(n,)``, all float32.
+    """
+    positions = positions_from_elements(
+        semi_major_axis, eccentricity, mean_anomaly, arg_periapsis, inclination, raan, world_dim,
+    ).astype(np.float32)
+    return (positions, *polar_from_positions(positions, world_dim))
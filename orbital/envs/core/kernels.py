@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+def wrapped_angle_delta(a0: np.ndarray, a1: np.ndarray) -> np.ndarray:
+    """Array form of `OrbitalCore._angle_delta`: ``a1 - a0`` wrapped to [-pi, pi)."""
+    return ((a1 - a0 + np.pi) % (2.0 * np.pi)) - np.pi
+
+
+def debris_density(
+    sat_theta: np.ndarray,
+    sat_radius: np.ndarray,
+    sat_phi: np.ndarray,
+    alive: np.ndarray,
+    cloud_theta: np.ndarray,
+    cloud_radius: np.ndarray,
+    cloud_phi: np.ndarray,
+    cloud_spread: np.ndarray,
+    cloud_density: np.ndarray,
+    world_dim: int,
+) -> np.ndarray:
+    """Gaussian debris density seen by every satellite, shape ``(N,)``.
+
+    Evaluates the N x D kernel between satellites and live clouds in
+    (theta, radius[, phi]) space. Dead satellites and depleted clouds
+    contribute nothing; totals are clipped to [0, 1.5].
+    """
+    density = np.zeros((sat_theta.shape[0],), dtype=np.float64)
+    live = cloud_density > 1e-4
+    if not live.any() or not alive.any():
+        return density
+    sats = np.flatnonzero(alive)
+    d_theta = wrapped_angle_delta(
+        sat_theta[sats, None].astype(np.float64), cloud_theta[None, live].astype(np.float64))
+    d_radius = sat_radius[sats, None].astype(np.float64) - cloud_radius[None, live]
+    dist_sq = d_theta * d_theta + d_radius * d_radius
+    if world_dim == 3:
+        d_phi = sat_phi[sats, None].astype(np.float64) - cloud_phi[None, live]
+        dist_sq += d_phi * d_phi
+    spread = np.maximum(1e-3, cloud_spread[live])
+    weights = np.exp(-0.5 * dist_sq / (spread * spread)[None, :])
+    density[sats] = np.clip(weights @ cloud_density[live], 0.0, 1.5)
+    return density
+
+
+def collision_probability(density: np.ndarray, compromised: np.ndarray, risk_gain: float) -> np.ndarray:
+    """Per-satellite Pc proxy; compromised satellites see 10% more risk."""
+    return np.clip(risk_gain * (density * np.where(compromised, 1.10, 1.0)), 0.0, 1.0)
+
+
+def pairwise_distances(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Euclidean distance matrix between rows of `a` ``(N, d)`` and `b` ``(M, d)``."""
+    diff = a[:, None, :] - b[None, :, :]
+    return np.sqrt(np.einsum("nmd,nmd->nm", diff, diff))
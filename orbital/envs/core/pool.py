@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import queue
+import threading
+from typing import NamedTuple
+
+import numpy as np
+
+from orbital.envs.core.config import OrbitalConfig
+from orbital.envs.core.dynamics import OrbitalCore
+from orbital.envs.core.state import OrbitalState
+from orbital.envs.core.streams import RandomStreams
+
+
+class PooledStart(NamedTuple):
+    """One pre-computed episode start: the seed, its initial state and its streams."""
+
+    seed: int
+    state: OrbitalState
+    streams: RandomStreams
+
+
+class InitialStatePool:
+    """Pre-compute episode starts in a background thread.
+
+    The worker owns a private core and resets it with a fresh seed per entry,
+    keeping up to `size` starts queued. Attach the pool to a core with
+    ``core.reset_pool = pool``; every unseeded ``core.reset(None)`` then
+    loads the next start instead of sampling one, leaving the core exactly
+    as ``core.reset(start.seed)`` would. Seeded resets are unaffected.
+
+    Episode seeds are drawn from `seed`, so a seeded pool hands out the same
+    sequence of episodes on every run. The worker is a daemon thread; call
+    `close` (or use the pool as a context manager) to stop it early.
+    """
+
+    def __init__(self, config: OrbitalConfig, seed: int | None = None, size: int = 8):
+        if size < 1:
+            raise ValueError("size must be >= 1")
+        self.config = config
+        self.size = size
+        self._seeds = np.random.default_rng(seed)
+        self._queue: queue.Queue[PooledStart | None] = queue.Queue(maxsize=size)
+        self._stop = threading.Event()
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._run, name="orbital-initial-states", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            core = OrbitalCore(self.config)
+            while not self._stop.is_set():
+                seed = int(self._seeds.integers(0, 2**63))
+                core.reset(seed)
+                start = PooledStart(seed, core.export_state(), core.streams)
+                while not self._stop.is_set():
+                    try:
+                        self._queue.put(start, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+        except BaseException as exc:  # surfaced to the consumer by `get`
+            self._error = exc
+            self._queue.put(None)
+
+    def get(self) -> PooledStart:
+        """Return the next episode start, waiting for the worker if the pool is empty."""
+        if self._stop.is_set():
+            raise RuntimeError("InitialStatePool is closed")
+        start = self._queue.get()
+        if start is None:
+            raise RuntimeError("InitialStatePool worker failed") from self._error
+        return start
+
+    def close(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def __enter__(self) -> InitialStatePool:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,359 @@
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Iterator
+
+import numpy as np
+
+from orbital.envs.core.bodies import DebrisCatalog, TaskCatalog
+from orbital.envs.core.comm import CommGraph
+from orbital.envs.core.config import OrbitalConfig
+from orbital.envs.core.dynamics import OrbitalCore
+from orbital.envs.core.reward import REWARD_COMPONENTS
+
+RECORDING_FORMAT = 2
+NO_ACTION = -1
+
+FrameLayout = dict[str, tuple[tuple[int, ...], np.dtype]]
+
+
+def frame_layout(config: OrbitalConfig) -> FrameLayout:
+    """Per-frame shape and dtype of every fixed-size recorded field.
+
+    The comm graph is stored as its CSR row pointer ``comm_indptr`` per
+    frame; the neighbour lists of all frames in a shard are concatenated
+    into ``comm_indices``, starting at each frame's ``comm_offset``.
+    """
+    n = config.num_satellites
+    tasks = config.num_tasks
+    clouds = config.num_debris_clouds
+    dim = config.world_dim
+    f32, f64 = np.dtype(np.float32), np.dtype(np.float64)
+    return {
+        "t": ((), np.dtype(np.int64)),
+        "actions": ((n,), np.dtype(np.int64)),
+        "positions": ((n, dim), f32),
+        "orbit_theta": ((n,), f32),
+        "orbit_radius": ((n,), f32),
+        "orbit_phi": ((n,), f32),
+        "energy": ((n,), f32),
+        "health": ((n,), f32),
+        "buffered_data": ((n,), f32),
+        "compromised_for": ((n,), np.dtype(np.int32)),
+        "jammed": ((n,), np.dtype(np.bool_)),
+        "comm_indptr": ((n + 1,), np.dtype(np.int64)),
+        "comm_offset": ((), np.dtype(np.int64)),
+        "known_tasks": ((n, tasks), np.dtype(np.bool_)),
+        "ground_station": ((n,), np.dtype(np.int32)),
+        "ground_route": ((n,), np.dtype(np.bool_)),
+        "reward_components": ((n, len(REWARD_COMPONENTS)), f32),
+        "delivered_total": ((), f64),
+        "task_theta": ((tasks,), f32),
+        "task_radius": ((tasks,), f32),
+        "task_phi": ((tasks,), f32),
+        "task_positions": ((tasks, dim), f32),
+        "task_priority": ((tasks,), f64),
+        "task_active": ((tasks,), np.dtype(np.bool_)),
+        "task_age": ((tasks,), np.dtype(np.int64)),
+        "debris_theta": ((clouds,), f32),
+        "debris_radius": ((clouds,), f32),
+        "debris_phi": ((clouds,), f32),
+        "debris_positions": ((clouds, dim), f32),
+        "debris_spread": ((clouds,), f64),
+        "debris_density": ((clouds,), f64),
+    }
+
+
+def _capture(core: OrbitalCore, actions: np.ndarray | None, row: dict[str, np.ndarray]) -> None:
+    row["t"][...] = core.t
+    if actions is None:
+        row["actions"][...] = NO_ACTION
+    else:
+        row["actions"][...] = actions
+    for name in ("positions", "orbit_theta", "orbit_radius", "orbit_phi", "energy", "health",
+                 "buffered_data", "compromised_for", "jammed", "known_tasks",
+                 "reward_components", "delivered_total"):
+        row[name][...] = getattr(core, name)
+    row["comm_indptr"][...] = core.comm_graph.indptr
+    row["ground_station"][...] = core.ground_contact_station()
+    row["ground_route"][...] = core._ground_route_table() >= 0
+    for prefix, catalog in (("task", core.tasks), ("debris", core.debris_clouds)):
+        for column in ("theta", "radius", "phi", "positions"):
+            row[f"{prefix}_{column}"][...] = getattr(catalog, column)
+    row["task_priority"][...] = core.tasks.priority
+    row["task_active"][...] = core.tasks.active
+    row["task_age"][...] = core.tasks.age
+    row["debris_spread"][...] = core.debris_clouds.spread
+    row["debris_density"][...] = core.debris_clouds.density
+
+
+class EpisodeRecorder:
+    """Append every frame of a core's episodes to chunked ``.npy`` shards.
+
+    `attach` registers the recorder in `OrbitalCore.step_hooks`. Each reset
+    opens a new ``episode_NNNNNN`` directory below `directory` and records
+    the initial frame; each step appends one frame holding the state after
+    the step, the actions that produced it and the reward components. A
+    frame is a fixed set of fields with fixed dtypes (see `frame_layout`);
+    field ``x`` is stored as ``x.00000.npy``, ``x.00001.npy``, ... with
+    `chunk_size` frames per shard, plus one variable-length
+    ``comm_indices`` shard holding the links. Frames are buffered in memory
+    until a shard is full or the episode ends.
+    """
+
+    def __init__(self, directory: str | Path, chunk_size: int = 256):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.chunk_size = chunk_size
+        self.episodes: list[Path] = []
+        self._core: OrbitalCore | None = None
+        self._episode_dir: Path | None = None
+        self._layout: FrameLayout = {}
+        self._buffers: dict[str, np.ndarray] = {}
+        self._rows: list[dict[str, np.ndarray]] = []
+        self._links: list[np.ndarray] = []
+        self._link_count = 0
+        self._count = 0
+        self._chunks = 0
+        indices = [int(path.name[len("episode_"):]) for path in self.directory.glob("episode_*")
+                   if path.name[len("episode_"):].isdigit()]
+        self._next_index = max(indices, default=-1) + 1
+
+    def attach(self, core: OrbitalCore) -> EpisodeRecorder:
+        """Start recording `core`; the current state becomes the first frame."""
+        if self._core is not None:
+            raise RuntimeError("recorder is already attached to a core")
+        self._core = core
+        core.step_hooks.append(self._on_frame)
+        self._on_frame(core, None)
+        return self
+
+    def detach(self) -> None:
+        """Stop recording and write out the episode in progress."""
+        if self._core is None:
+            return
+        self._core.step_hooks.remove(self._on_frame)
+        self._core = None
+        self._finish_episode(None)
+
+    close = detach
+
+    def __enter__(self) -> EpisodeRecorder:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.detach()
+
+    def _on_frame(self, core: OrbitalCore, actions: np.ndarray | None) -> None:
+        if actions is None:
+            self._finish_episode(None)
+            self._start_episode(core.config)
+        elif self._episode_dir is None:
+            return
+        row = self._rows[self._count]
+        _capture(core, actions, row)
+        # Graphs are immutable, so the shard can hold on to their arrays.
+        row["comm_offset"][...] = self._link_count
+        self._links.append(core.comm_graph.indices)
+        self._link_count += len(core.comm_graph.indices)
+        self._count += 1
+        if self._count == self.chunk_size:
+            self._flush()
+        if actions is not None and core.last_episode is not None:
+            self._finish_episode(core.last_episode)
+
+    def _start_episode(self, config: OrbitalConfig) -> None:
+        # Never reuse a directory, even one created after this recorder started.
+        while True:
+            self._episode_dir = self.directory / f"episode_{self._next_index:06d}"
+            self._next_index += 1
+            try:
+                self._episode_dir.mkdir()
+                break
+            except FileExistsError:
+                continue
+        self._config = config
+        layout = frame_layout(config)
+        if layout != self._layout:
+            self._layout = layout
+            self._buffers = {
+                name: np.zeros((self.chunk_size,) + shape, dtype=dtype)
+                for name, (shape, dtype) in layout.items()
+            }
+            self._rows = [{name: buf[k, ...] for name, buf in self._buffers.items()}
+                          for k in range(self.chunk_size)]
+        self._links = []
+        self._link_count = 0
+        self._count = 0
+        self._chunks = 0
+        self._frames = 0
+
+    def _flush(self) -> None:
+        if self._count == 0:
+            return
+        for name, buf in self._buffers.items():
+            np.save(self._episode_dir / f"{name}.{self._chunks:05d}.npy", buf[:self._count])
+        np.save(self._episode_dir / f"comm_indices.{self._chunks:05d}.npy",
+                np.concatenate(self._links).astype(np.int32, copy=False))
+        self._links = []
+        self._link_count = 0
+        self._chunks += 1
+        self._frames += self._count
+        self._count = 0
+
+    def _finish_episode(self, summary: dict[str, Any] | None) -> None:
+        if self._episode_dir is None:
+            return
+        self._flush()
+        meta = {
+            "format": RECORDING_FORMAT,
+            "config": asdict(self._config),
+            "chunk_size": self.chunk_size,
+            "num_frames": self._frames,
+            "fields": {name: [list(shape), dtype.str] for name, (shape, dtype) in self._layout.items()},
+            "episode": summary,
+        }
+        (self._episode_dir / "meta.json").write_text(json.dumps(meta, indent=1))
+        self.episodes.append(self._episode_dir)
+        self._episode_dir = None
+
+
+class EpisodeReader:
+    """Random access to a recorded episode through memory-mapped shards.
+
+    ``reader.field("energy")[k]`` reads one field at frame ``k`` without
+    loading the rest of the episode; ``reader[k]`` bundles all fields of a
+    frame into a `RecordedFrame` that renderers accept in place of a core.
+    """
+
+    def __init__(self, episode_dir: str | Path):
+        self.path = Path(episode_dir)
+        meta = json.loads((self.path / "meta.json").read_text())
+        if meta["format"] != RECORDING_FORMAT:
+            raise ValueError(f"unsupported recording format {meta['format']}")
+        self.config = OrbitalConfig(**meta["config"])
+        self.chunk_size = int(meta["chunk_size"])
+        self.num_frames = int(meta["num_frames"])
+        self.episode: dict[str, Any] | None = meta["episode"]
+        self.fields = {name: (tuple(shape), np.dtype(dtype)) for name, (shape, dtype) in meta["fields"].items()}
+        num_chunks = -(-self.num_frames // self.chunk_size)
+        self._shards = {
+            name: [np.load(self.path / f"{name}.{c:05d}.npy", mmap_mode="r") for c in range(num_chunks)]
+            for name in self.fields
+        }
+        self._link_shards = [np.load(self.path / f"comm_indices.{c:05d}.npy", mmap_mode="r")
+                             for c in range(num_chunks)]
+        self._geometry = OrbitalCore.__new__(OrbitalCore)
+        self._geometry._setup(self.config)
+
+    def __len__(self) -> int:
+        return self.num_frames
+
+    def field(self, name: str) -> _FieldView:
+        return _FieldView(self, name)
+
+    def read(self, name: str, k: int) -> np.ndarray:
+        if k < 0:
+            k += self.num_frames
+        if not 0 <= k < self.num_frames:
+            raise IndexError(f"frame {k} out of range for {self.num_frames} frames")
+        chunk, row = divmod(k, self.chunk_size)
+        return self._shards[name][chunk][row]
+
+    def comm_graph(self, k: int) -> CommGraph:
+        """Comm graph at frame `k`, backed by the memory-mapped link shard."""
+        indptr = self.read("comm_indptr", k)
+        offset = int(self.read("comm_offset", k))
+        if k < 0:
+            k += self.num_frames
+        links = self._link_shards[k // self.chunk_size]
+        return CommGraph(indptr, links[offset:offset + int(indptr[-1])])
+
+    def __getitem__(self, k: int) -> RecordedFrame:
+        return RecordedFrame(self, {name: self.read(name, k) for name in self.fields}, self.comm_graph(k))
+
+    def __iter__(self) -> Iterator[RecordedFrame]:
+        for k in range(self.num_frames):
+            yield self[k]
+
+    def render(self, renderer, k: int, mode: str = "rgb_array", show_links: bool = True):
+        """Draw frame `k` with a `PygameRenderer` or `PyVistaRenderer`."""
+        return renderer.render(self[k], mode=mode, show_links=show_links)
+
+
+class _FieldView:
+    """Frame-indexed view of one recorded field across all shards."""
+
+    def __init__(self, reader: EpisodeReader, name: str):
+        self._reader = reader
+        self._name = name
+
+    def __len__(self) -> int:
+        return self._reader.num_frames
+
+    def __getitem__(self, k: int) -> np.ndarray:
+        return self._reader.read(self._name, k)
+
+    def to_array(self) -> np.ndarray:
+        return np.concatenate(self._reader._shards[self._name])
+
+
+class RecordedFrame:
+    """Read-only stand-in for `OrbitalCore` at one recorded frame.
+
+    Exposes the attributes and queries the renderers use, backed by the
+    recorded arrays instead of a live simulation.
+    """
+
+    def __init__(self, reader: EpisodeReader, data: dict[str, np.ndarray], comm_graph: CommGraph):
+        geometry = reader._geometry
+        self.config = reader.config
+        self.num_agents = reader.config.num_satellites
+        self.ground_thetas = geometry.ground_thetas
+        self.ground_phis = geometry.ground_phis
+        self.ground_vectors = geometry.ground_vectors
+        self._geometry = geometry
+        self._data = data
+        self.t = int(data["t"])
+        self.delivered_total = float(data["delivered_total"])
+        self.actions = data["actions"]
+        for name in ("positions", "orbit_theta", "orbit_radius", "orbit_phi", "energy", "health",
+                     "buffered_data", "compromised_for", "jammed", "known_tasks",
+                     "reward_components"):
+            setattr(self, name, data[name])
+        self.comm_graph = comm_graph
+        self.last_reward_components = dict(zip(REWARD_COMPONENTS, data["reward_components"].sum(axis=0).tolist()))
+        self.tasks = TaskCatalog(reader.config.num_tasks, reader.config.world_dim)
+        self.debris_clouds = DebrisCatalog(reader.config.num_debris_clouds, reader.config.world_dim)
+        for prefix, catalog in (("task", self.tasks), ("debris", self.debris_clouds)):
+            for column in ("theta", "radius", "phi", "positions"):
+                getattr(catalog, column)[...] = data[f"{prefix}_{column}"]
+        self.tasks.priority[...] = data["task_priority"]
+        self.tasks.active[...] = data["task_active"]
+        self.tasks.age[...] = data["task_age"]
+        self.debris_clouds.spread[...] = data["debris_spread"]
+        self.debris_clouds.density[...] = data["debris_density"]
+
+    def ground_contact_station(self) -> np.ndarray:
+        return self._data["ground_station"]
+
+    def _direct_ground_contact(self, i: int) -> bool:
+        return bool(self._data["ground_station"][i] >= 0)
+
+    def _has_path_to_ground(self, i: int) -> bool:
+        return bool(self._data["ground_route"][i])
+
+    def task_is_known(self, task_idx: int) -> bool:
+        if task_idx < 0 or task_idx >= len(self.tasks):
+            return False
+        return bool(self.known_tasks[:, task_idx].any())
+
+    def _angle_delta(self, a0: float, a1: float) -> float:
+        return self._geometry._angle_delta(a0, a1)
+
+    def _cartesian_from_orbit(self, theta: float, radius: float, phi: float = 0.0) -> np.ndarray:
+        return self._geometry._cartesian_from_orbit(theta, radius, phi)
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+
+from orbital.envs.core.config import OrbitalConfig
+from orbital.envs.core.dynamics import OrbitalCore
+from orbital.envs.core.state import STATE_TOTALS, CoreSnapshot
+
+DIGEST_SIZE = 16
+
+
+def state_digest(core: OrbitalCore) -> bytes:
+    """Hash of the state arrays, comm graph, counters and generator state of `core`."""
+    h = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    for array in core._state_arrays():
+        h.update(np.ascontiguousarray(array).data)
+    h.update(core.comm_graph.indptr.data)
+    h.update(core.comm_graph.indices.data)
+    scalars = (core.t, *(getattr(core, name) for name in STATE_TOTALS))
+    h.update(repr(scalars).encode())
+    h.update(repr(core.streams.get_state()).encode())
+    return h.digest()
+
+
+class ReplayDivergenceError(RuntimeError):
+    """Raised when a replayed frame does not match the recorded digest."""
+
+    def __init__(self, step: int, expected: bytes, actual: bytes):
+        super().__init__(
+            f"replay diverged at step {step}: expected digest {expected.hex()}, got {actual.hex()}")
+        self.step = step
+        self.expected = expected
+        self.actual = actual
+
+
+@dataclass
+class ActionLog:
+    """Everything needed to re-simulate one episode exactly.
+
+    `actions` has shape ``(T, N)``; `digests` holds the `state_digest` of the
+    frame after reset followed by one per step, shape ``(T + 1, 16)``. With
+    `observe_after_step`, the episode was driven by a frontend that called
+    `observe_all` after the reset and after every step; this matters because
+    ``obs_spoof`` observations draw from the core's generator.
+    """
+
+    config: OrbitalConfig
+    seed: int
+    actions: np.ndarray
+    digests: np.ndarray
+    observe_after_step: bool = True
+
+    def __len__(self) -> int:
+        return self.actions.shape[0]
+
+    def save(self, path: str | Path) -> None:
+        meta = {"config": asdict(self.config), "seed": self.seed, "observe_after_step": self.observe_after_step}
+        with open(path, "wb") as f:
+            np.savez_compressed(f, actions=self.actions, digests=self.digests, meta=np.array(json.dumps(meta)))
+
+    @classmethod
+    def load(cls, path: str | Path) -> ActionLog:
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            return cls(
+                config=OrbitalConfig(**meta["config"]),
+                seed=meta["seed"],
+                actions=data["actions"],
+                digests=data["digests"],
+                observe_after_step=meta["observe_after_step"],
+            )
+
+
+class ActionLogger:
+    """Build an `ActionLog` for every episode a core plays.
+
+    Registered through `OrbitalCore.step_hooks`; each reset starts a new log
+    in `logs`. The core must be reset with an explicit integer seed.
+    """
+
+    def __init__(self, observe_after_step: bool = True):
+        self.observe_after_step = observe_after_step
+        self.logs: list[ActionLog] = []
+        self._core: OrbitalCore | None = None
+        self._actions: list[np.ndarray] = []
+        self._digests: list[bytes] = []
+
+    def attach(self, core: OrbitalCore) -> ActionLogger:
+        """Start logging at the next reset of `core`."""
+        if self._core is not None:
+            raise RuntimeError("logger is already attached to a core")
+        self._core = core
+        core.step_hooks.append(self._on_frame)
+        return self
+
+    def detach(self) -> None:
+        if self._core is None:
+            return
+        self._core.step_hooks.remove(self._on_frame)
+        self._core = None
+        self._finish()
+
+    def _on_frame(self, core: OrbitalCore, actions: np.ndarray | None) -> None:
+        if actions is None:
+            self._finish()
+            if core.seed is None:
+                raise ValueError("episodes logged for replay must be reset with an integer seed")
+            self._config = core.config
+            self._seed = int(core.seed)
+            self._actions = []
+            self._digests = [state_digest(core)]
+            return
+        if not self._digests:
+            return
+        self._actions.append(np.array(actions, dtype=np.int64))
+        self._digests.append(state_digest(core))
+        if core.last_episode is not None:
+            self._finish()
+
+    def _finish(self) -> None:
+        if not self._digests:
+            return
+        actions = np.stack(self._actions) if self._actions else np.zeros((0, self._config.num_satellites), dtype=np.int64)
+        digests = np.frombuffer(b"".join(self._digests), dtype=np.uint8).reshape(-1, DIGEST_SIZE)
+        self.logs.append(ActionLog(self._config, self._seed, actions, digests.copy(), self.observe_after_step))
+        self._actions = []
+        self._digests = []
+
+
+class EpisodeReplay:
+    """Re-simulate an `ActionLog`, checking every frame against its digest.
+
+    Frame ``k`` is the state after ``k`` steps. Replaying stops with
+    `ReplayDivergenceError` at the first frame whose digest differs. Every
+    `keyframe_interval` frames a `CoreSnapshot` is kept, so `seek` only
+    re-simulates from the nearest keyframe at or before the target.
+    """
+
+    def __init__(self, log: ActionLog, keyframe_interval: int = 32):
+        if keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be >= 1")
+        self.log = log
+        self.keyframe_interval = keyframe_interval
+        self.core = OrbitalCore(log.config)
+        self.core.reset(log.seed)
+        self.frame = 0
+        self.keyframes: dict[int, CoreSnapshot] = {}
+        self._check_frame()
+
+    def __len__(self) -> int:
+        return len(self.log) + 1
+
+    def _check_frame(self) -> None:
+        expected = self.log.digests[self.frame].tobytes()
+        actual = state_digest(self.core)
+        if actual != expected:
+            raise ReplayDivergenceError(self.frame, expected, actual)
+        if self.frame % self.keyframe_interval == 0 and self.frame not in self.keyframes:
+            self.keyframes[self.frame] = self.core.snapshot()
+
+    def _advance(self) -> None:
+        if self.log.observe_after_step:
+            self.core.observe_all()
+        self.core.step_array(self.log.actions[self.frame])
+        self.frame += 1
+        self._check_frame()
+
+    def seek(self, k: int) -> OrbitalCore:
+        """Move to frame `k` and return the replay core positioned there.
+
+        The core belongs to the replay: read or snapshot it, but do not step
+        or observe it directly.
+        """
+        if k < 0:
+            k += len(self)
+        if not 0 <= k < len(self):
+            raise IndexError(f"frame {k} out of range for {len(self)} frames")
+        start = max(f for f in self.keyframes if f <= k)
+        if not start <= self.frame <= k:
+            self.core.restore(self.keyframes[start])
+            self.frame = start
+        while self.frame < k:
+            self._advance()
+        return self.core
+
+    def verify(self) -> OrbitalCore:
+        """Replay to the last frame, raising on the first divergence."""
+        return self.seek(len(self) - 1)
@@ -1,5 +1,43 @@
 from __future__ import annotations
 
+import numpy as np
+
+
+# Fixed column order of the per-agent reward component matrix. Components in
+# REWARD_GAINS add to the mission value; all others are penalties.
+REWARD_COMPONENTS = (
+    "task",
+    "delivery",
+    "ground_task_intake",
+    "knowledge",
+    "energy",
+    "overflow",
+    "data_loss",
+    "health",
+    "isolation",
+    "failure",
+    "cyber",
+    "jam",
+    "forced_action",
+    "atmospheric_drag",
+    "debris_risk",
+    "collision",
+)
+REWARD_GAINS = frozenset({"task", "delivery", "ground_task_intake", "knowledge"})
+REWARD_INDEX = {name: k for k, name in enumerate(REWARD_COMPONENTS)}
+
+
+def compile_reward_weights(weights: dict[str, float]) -> np.ndarray:
+    """Return signed weights aligned with `REWARD_COMPONENTS`.
+
+    Multiplying a component matrix of shape ``(N, C)`` by this vector yields
+    one reward per row; missing weights count as zero.
+    """
+    return np.array([
+        (1.0 if name in REWARD_GAINS else -1.0) * float(weights.get(name, 0.0))
+        for name in REWARD_COMPONENTS
+    ], dtype=np.float64)
+
 
 def compute_shared_reward(components: dict[str, float], weights: dict[str, float]) -> float:
     """Compute weighted mission value from per-step component signals."""
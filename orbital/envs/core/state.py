@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from orbital.envs.core.comm import CommGraph
+
+
+# Episode counters carried alongside the arrays, in export order.
+STATE_TOTALS = (
+    "delivered_total",
+    "observed_total",
+    "knowledge_shared_total",
+    "jam_count",
+    "forced_action_count",
+)
+
+
+def _frozen_copy(value: np.ndarray) -> np.ndarray:
+    array = np.array(value, copy=True)
+    array.flags.writeable = False
+    return array
+
+
+@dataclass(frozen=True)
+class OrbitalState:
+    """Immutable snapshot of everything an ORBITAL transition reads.
+
+    `satellites` holds the `OrbitalCore.SATELLITE_STATE` arrays, `tasks` and
+    `debris` the `COLUMNS` of the two body catalogs, and `comm_graph` the
+    links of the last step (already immutable, so it is shared rather than
+    copied). Arrays are private, read-only copies, so a state can be kept, shared between rollouts or
+    pickled to another process without aliasing a live core. The generator
+    is not part of the state; it is passed to `step` separately.
+    """
+
+    satellites: dict[str, np.ndarray]
+    tasks: dict[str, np.ndarray]
+    debris: dict[str, np.ndarray]
+    station_known_tasks: np.ndarray
+    comm_graph: CommGraph
+    t: int
+    totals: dict[str, float]
+
+    @classmethod
+    def from_arrays(
+        cls,
+        satellites: dict[str, np.ndarray],
+        tasks: dict[str, np.ndarray],
+        debris: dict[str, np.ndarray],
+        station_known_tasks: np.ndarray,
+        comm_graph: CommGraph,
+        t: int,
+        totals: dict[str, float],
+    ) -> OrbitalState:
+        """Build a state from live arrays, copying each one."""
+        return cls(
+            satellites={name: _frozen_copy(value) for name, value in satellites.items()},
+            tasks={name: _frozen_copy(value) for name, value in tasks.items()},
+            debris={name: _frozen_copy(value) for name, value in debris.items()},
+            station_known_tasks=_frozen_copy(station_known_tasks),
+            comm_graph=comm_graph,
+            t=int(t),
+            totals={name: totals[name] for name in STATE_TOTALS},
+        )
+
+    @property
+    def num_satellites(self) -> int:
+        return self.satellites["energy"].shape[0]
+
+    @property
+    def nbytes(self) -> int:
+        arrays = [*self.satellites.values(), *self.tasks.values(), *self.debris.values()]
+        return sum(a.nbytes for a in arrays) + self.station_known_tasks.nbytes + self.comm_graph.nbytes
+
+    def equals(self, other: OrbitalState) -> bool:
+        """True when both states hold identical arrays and counters."""
+        if self.t != other.t or self.totals != other.totals:
+            return False
+        if not np.array_equal(self.station_known_tasks, other.station_known_tasks):
+            return False
+        if not self.comm_graph.equals(other.comm_graph):
+            return False
+        for mine, theirs in ((self.satellites, other.satellites), (self.tasks, other.tasks),
+                             (self.debris, other.debris)):
+            if mine.keys() != theirs.keys():
+                return False
+            if not all(np.array_equal(mine[name], theirs[name]) for name in mine):
+                return False
+        return True
+
+
+@dataclass(frozen=True)
+class StepOutputs:
+    """Per-step results returned next to the successor state by `step`."""
+
+    rewards: np.ndarray
+    terminations: np.ndarray
+    truncations: np.ndarray
+    reward_components: np.ndarray
+    executed_actions: tuple[str, ...]
+    episode: dict[str, Any] | None
+
+
+class CoreSnapshot:
+    """Raw copy of a core's state arrays, comm graph, counters and generator state.
+
+    Produced by `OrbitalCore.snapshot` and consumed by `OrbitalCore.restore`.
+    Unlike `OrbitalState` it stores the arrays positionally and skips the
+    read-only bookkeeping, because it only ever goes back into a core of the
+    same configuration.
+    """
+
+    __slots__ = ("arrays", "scalars", "rng_state", "comm_graph", "executed_actions", "last_episode")
+
+    def __init__(
+        self,
+        arrays: tuple[np.ndarray, ...],
+        scalars: tuple[Any, ...],
+        rng_state: dict[str, Any],
+        comm_graph: CommGraph,
+        executed_actions: tuple[str, ...],
+        last_episode: dict[str, Any] | None,
+    ):
+        self.arrays = arrays
+        self.scalars = scalars
+        self.rng_state = rng_state
+        self.comm_graph = comm_graph
+        self.executed_actions = executed_actions
+        self.last_episode = last_episode
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in self.arrays) + self.comm_graph.nbytes
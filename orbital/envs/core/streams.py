@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+from orbital.envs.core.compiled import ACTION_DRAWS_PER_SATELLITE, HAZARD_DRAWS_PER_SATELLITE
+from orbital.envs.core.config import OrbitalConfig
+
+# Fixed order of the child streams; child k is always spawned for the same
+# subsystem, so equal seeds give equal per-subsystem streams across configs.
+RNG_SUBSYSTEMS = ("orbits", "comm", "malware", "hazards", "tasks", "debris", "observation")
+
+# Uniforms per element and step for each subsystem's block (split mode).
+_TASK_DRAWS_PER_TASK = 9  # respawn, priority drift, 6 elements, spawn priority
+_DEBRIS_DRAWS_PER_CLOUD = 13  # respawn, 2 for the spread normal, burst, burst size, 6 elements, spread, density
+_MALWARE_WAKE_DRAWS = 2
+
+
+def block_sizes(config: OrbitalConfig) -> dict[str, int]:
+    """Uniforms each subsystem pre-draws per step; 0 draws on demand."""
+    n = config.num_satellites
+    return {
+        "orbits": 0,
+        "comm": 0,
+        "malware": _MALWARE_WAKE_DRAWS + ACTION_DRAWS_PER_SATELLITE * n,
+        "hazards": HAZARD_DRAWS_PER_SATELLITE * n,
+        "tasks": _TASK_DRAWS_PER_TASK * config.num_tasks,
+        "debris": _DEBRIS_DRAWS_PER_CLOUD * config.num_debris_clouds,
+        "observation": 0,
+    }
+
+
+class BlockStream:
+    """Generator-like reader over a child stream drawn one block per step.
+
+    `refill` draws the step's block with a single ``random`` call and
+    `discard` drops whatever the step left unused, so between steps the
+    stream's state is just its generator's. Requests beyond the block draw
+    exactly the shortfall. Supports the subset of the `np.random.Generator`
+    interface the core uses; ``uniform`` and ``normal`` are computed from the
+    block's uniforms.
+    """
+
+    __slots__ = ("generator", "block_size", "_block", "_cursor")
+
+    def __init__(self, generator: np.random.Generator, block_size: int):
+        self.generator = generator
+        self.block_size = block_size
+        self._block = np.empty((0,), dtype=np.float64)
+        self._cursor = 0
+
+    def refill(self) -> None:
+        self._block = self.generator.random(self.block_size)
+        self._cursor = 0
+
+    def discard(self) -> None:
+        self._block = self._block[:0]
+        self._cursor = 0
+
+    def reserve(self, count: int) -> np.ndarray:
+        """Next `count` uniforms, without consuming them (see `advance`)."""
+        end = self._cursor + count
+        if end > self._block.shape[0]:
+            extra = self.generator.random(end - self._block.shape[0])
+            self._block = np.concatenate((self._block[self._cursor:], extra))
+            self._cursor = 0
+            end = count
+        return self._block[self._cursor:end]
+
+    def advance(self, count: int) -> None:
+        self._cursor += count
+
+    def random(self, size: int | tuple[int, ...] | None = None) -> Any:
+        if size is None:
+            cursor = self._cursor
+            if cursor < self._block.shape[0]:
+                self._cursor = cursor + 1
+                return float(self._block[cursor])
+            value = self.reserve(1)[0]
+            self._cursor += 1
+            return float(value)
+        shape = (size,) if isinstance(size, (int, np.integer)) else tuple(size)
+        count = int(np.prod(shape))
+        values = self.reserve(count).reshape(shape)
+        self._cursor += count
+        return values
+
+    def uniform(self, low: Any = 0.0, high: Any = 1.0, size: int | tuple[int, ...] | None = None) -> Any:
+        if size is None:
+            size = np.broadcast(low, high).shape or None
+        low = np.asarray(low, dtype=np.float64) if np.ndim(low) else low
+        high = np.asarray(high, dtype=np.float64) if np.ndim(high) else high
+        return low + (high - low) * self.random(size)
+
+    def normal(self, loc: float = 0.0, scale: float = 1.0, size: int | None = None) -> Any:
+        count = 1 if size is None else int(size)
+        u = self.random(2 * count).reshape(2, count)
+        z = np.sqrt(-2.0 * np.log1p(-u[0])) * np.cos(2.0 * np.pi * u[1])
+        values = loc + scale * z
+        return float(values[0]) if size is None else values
+
+    def choice(self, a: np.ndarray) -> Any:
+        a = np.asarray(a)
+        return a[min(int(self.random() * a.shape[0]), a.shape[0] - 1)]
+
+
+class RandomStreams:
+    """The generators each subsystem of `OrbitalCore` draws from.
+
+    With ``rng_streams="shared"`` every subsystem uses the core's single
+    generator in the original draw order. With ``"split"`` each subsystem in
+    `RNG_SUBSYSTEMS` gets an independent child of the episode seed, read
+    through a `BlockStream` that is refilled at the start of every step, so
+    changing how much randomness one subsystem uses never shifts another's.
+    The core brackets each step (and reset) with `begin_step`/`end_step`.
+    """
+
+    def __init__(self, config: OrbitalConfig, rng: np.random.Generator, seed_seq: np.random.SeedSequence | None = None):
+        self.split = config.rng_streams == "split"
+        self.rng = rng
+        if self.split:
+            if seed_seq is None:
+                seed_seq = np.random.SeedSequence(int(rng.integers(0, 2**63)))
+            sizes = block_sizes(config)
+            children = seed_seq.spawn(len(RNG_SUBSYSTEMS))
+            self._streams = tuple(
+                BlockStream(np.random.default_rng(child), sizes[name])
+                for name, child in zip(RNG_SUBSYSTEMS, children))
+        else:
+            self._streams = (rng,) * len(RNG_SUBSYSTEMS)
+        (self.orbits, self.comm, self.malware, self.hazards,
+         self.tasks, self.debris, self.observation) = self._streams
+
+    def begin_step(self) -> None:
+        if self.split:
+            for stream in self._streams:
+                stream.refill()
+
+    def end_step(self) -> None:
+        if self.split:
+            for stream in self._streams:
+                stream.discard()
+
+    def get_state(self) -> Any:
+        """Generator state to store in snapshots and digests (between steps)."""
+        if self.split:
+            return tuple(stream.generator.bit_generator.state for stream in self._streams)
+        return self.rng.bit_generator.state
+
+    def set_state(self, state: Any) -> None:
+        if self.split:
+            for stream, value in zip(self._streams, state):
+                stream.generator.bit_generator.state = value
+                stream.discard()
+        else:
+            self.rng.bit_generator.state = state
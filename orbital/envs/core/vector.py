@@ -0,0 +1,383 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Sequence
+
+import numpy as np
+
+from orbital.envs.core.bodies import BodyCatalog
+from orbital.envs.core.compiled import CYBERSCAN, IDLE, LOWPOWER, ORBIT_DOWN, ORBIT_UP, RELAY_GROUND, RELAY_SAT
+from orbital.envs.core.config import OrbitalConfig
+from orbital.envs.core.dynamics import OrbitalCore
+from orbital.envs.core.kepler import TWO_PI, coordinates_from_elements
+from orbital.envs.core.reward import REWARD_INDEX
+from orbital.envs.core.spaces import ACTION_MAP, OBSERVATION_SIZE
+
+
+StepResult = tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, list[dict[str, Any]]]
+
+_ACTION_NAMES = tuple(ACTION_MAP[code] for code in range(len(ACTION_MAP)))
+_ACTION_CODES = {name: code for code, name in ACTION_MAP.items()}
+_ORBIT_ELEMENTS = (
+    "orbit_semi_major_axis",
+    "orbit_eccentricity",
+    "orbit_mean_anomaly",
+    "orbit_arg_periapsis",
+    "orbit_inclination",
+    "orbit_raan",
+)
+
+
+class AsyncStepMixin:
+    """``step_async``/``step_wait`` protocol shared by the batched environments.
+
+    Subclasses implement `_step_begin` to launch a step in the background and
+    `_step_end` to block until it finishes. Between the two calls the output
+    buffers are being written and must not be read.
+    """
+
+    _step_pending = False
+
+    def step_async(self, actions: np.ndarray) -> None:
+        if self._step_pending:
+            raise RuntimeError("step_async called while a step is pending; call step_wait first")
+        self._step_begin(actions)
+        self._step_pending = True
+
+    def step_wait(self) -> StepResult:
+        if not self._step_pending:
+            raise RuntimeError("step_wait called without a pending step_async")
+        try:
+            return self._step_end()
+        finally:
+            self._step_pending = False
+
+    def step(self, actions: np.ndarray) -> StepResult:
+        """Advance all environments by one step with ``(B, N)`` integer actions."""
+        self.step_async(actions)
+        return self.step_wait()
+
+    async def step_awaitable(self, actions: np.ndarray) -> StepResult:
+        """Launch a step and await its results without blocking the event loop."""
+        self.step_async(actions)
+        return await asyncio.get_running_loop().run_in_executor(None, self.step_wait)
+
+    def _check_not_pending(self) -> None:
+        if self._step_pending:
+            raise RuntimeError("a step is pending; call step_wait first")
+
+    def _check_actions(self, actions: np.ndarray) -> np.ndarray:
+        actions = np.asarray(actions)
+        if actions.shape != (self.num_envs, self.num_agents):
+            raise ValueError(
+                f"actions must have shape {(self.num_envs, self.num_agents)}, got {actions.shape}")
+        return actions
+
+    def _step_begin(self, actions: np.ndarray) -> None:
+        raise NotImplementedError
+
+    def _step_end(self) -> StepResult:
+        raise NotImplementedError
+
+
+class VectorOrbitalCore(AsyncStepMixin):
+    """Lockstep batch of B ORBITAL constellations sharing one configuration.
+
+    Every per-satellite state array listed in `OrbitalCore.SATELLITE_STATE`,
+    and the per-satellite reward components, are held as single
+    ``(B, N, ...)`` arrays on this object; each member core operates on its
+    own row view. A step runs the phases of `OrbitalCore.step_array`, with the
+    per-satellite ones (action transitions, passive recharge, Kepler
+    propagation and positions, atmospheric drag and collision risk) as array
+    operations over the whole ``(B, N)`` batch. Only satellites that draw
+    random numbers there (infected ones acting, and ones above the collision
+    alert threshold) take the scalar path, in satellite order, so each
+    environment consumes its generator exactly as a lone `OrbitalCore` would
+    and transitions match it bit for bit. Task and debris catalogs are backed
+    by ``B * K`` row catalogs as well, so their orbits propagate in one pass.
+    Malware wake-up, observe and relay payloads, the debris and task draws,
+    links, rewards and observations still run per environment. Observations,
+    rewards, terminations and truncations are written into preallocated
+    ``(B, N, ...)`` buffers.
+
+    Each environment owns a seed stream derived from the batch seed. An
+    environment that terminates or truncates is reset immediately with the
+    next seed from its stream; the step's outputs then carry the first
+    observation of the new episode, while `infos[b]` holds the finished
+    episode summary and its final observation.
+
+    `step_async` runs the batch on a background thread so the caller can
+    compute the next actions meanwhile; `step_wait` joins it.
+    """
+
+    def __init__(self, config: OrbitalConfig, num_envs: int, seed: int | Sequence[int] | None = None):
+        if num_envs < 1:
+            raise ValueError("num_envs must be >= 1")
+        self.config = config
+        self.num_envs = num_envs
+        self.num_agents = config.num_satellites
+        self.agent_names = [f"sat_{i}" for i in range(self.num_agents)]
+        self.cores = [OrbitalCore(config) for _ in range(num_envs)]
+        for name in OrbitalCore.SATELLITE_STATE:
+            stacked = np.stack([getattr(core, name) for core in self.cores])
+            setattr(self, name, stacked)
+            for b, core in enumerate(self.cores):
+                setattr(core, name, stacked[b])
+        self.reward_components = np.stack([core.reward_components for core in self.cores])
+        self._reward_columns = tuple(np.moveaxis(self.reward_components, -1, 0))
+        for b, core in enumerate(self.cores):
+            core.reward_components = self.reward_components[b]
+            core._reward_columns = tuple(core.reward_components.T)
+        self._tasks = self._stack_catalogs("tasks")
+        self._debris_clouds = self._stack_catalogs("debris_clouds")
+
+        shape = (num_envs, self.num_agents)
+        self._executed_codes = np.full(shape, IDLE, dtype=np.int64)
+        self._run_payload = np.zeros(shape, dtype=np.bool_)
+        self._pc_estimates = np.zeros(shape, dtype=np.float64)
+        self._energy_cost_vector = self.cores[0]._energy_cost_vector
+        self.observations = np.zeros(shape + (OBSERVATION_SIZE,), dtype=np.float32)
+        self.rewards = np.zeros(shape, dtype=np.float64)
+        self.terminations = np.zeros(shape, dtype=np.bool_)
+        self.truncations = np.zeros(shape, dtype=np.bool_)
+        self.episode_seeds = np.zeros((num_envs,), dtype=np.uint64)
+        self._seeders: list[np.random.Generator] = []
+        self._executor: ThreadPoolExecutor | None = None
+        self._future: Future | None = None
+        self.reset(seed)
+
+    def _stack_catalogs(self, name: str) -> BodyCatalog:
+        """Back the member cores' `name` catalogs with one catalog of B times their size.
+
+        Environment b owns rows ``b*K:(b+1)*K`` of every column, so the whole
+        batch of bodies propagates in one pass of `BodyCatalog.propagate`.
+        """
+        catalogs = [getattr(core, name) for core in self.cores]
+        capacity = len(catalogs[0])
+        stacked = type(catalogs[0])(capacity * self.num_envs, self.config.world_dim)
+        for column in stacked.COLUMNS:
+            storage = getattr(stacked, column)
+            for b, catalog in enumerate(catalogs):
+                rows = storage[b * capacity:(b + 1) * capacity]
+                rows[...] = getattr(catalog, column)
+                setattr(catalog, column, rows)
+        return stacked
+
+    def reset(self, seed: int | Sequence[int] | None = None) -> np.ndarray:
+        """Reset every environment and return the ``(B, N, obs)`` observations.
+
+        An int seeds independent per-environment seed streams; a sequence of
+        B ints seeds each environment's stream explicitly.
+        """
+        self._check_not_pending()
+        if seed is None or isinstance(seed, (int, np.integer)):
+            children = np.random.SeedSequence(seed).spawn(self.num_envs)
+        else:
+            if len(seed) != self.num_envs:
+                raise ValueError("seed sequence length must equal num_envs")
+            children = [np.random.SeedSequence(int(s)) for s in seed]
+        self._seeders = [np.random.default_rng(child) for child in children]
+        for b in range(self.num_envs):
+            self._reset_env(b)
+        self.rewards[...] = 0.0
+        self.terminations[...] = False
+        self.truncations[...] = False
+        return self.observations
+
+    def _reset_env(self, b: int) -> None:
+        episode_seed = int(self._seeders[b].integers(0, 2**63))
+        self.episode_seeds[b] = episode_seed
+        self.cores[b].reset(episode_seed)
+        self.cores[b].observe_all(out=self.observations[b])
+
+    def step(self, actions: np.ndarray) -> StepResult:
+        """Advance all environments by one step with ``(B, N)`` integer actions."""
+        self._check_not_pending()
+        return self._step_batch(self._check_actions(actions))
+
+    def _step_begin(self, actions: np.ndarray) -> None:
+        actions = self._check_actions(actions).copy()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="orbital-vector")
+        self._future = self._executor.submit(self._step_batch, actions)
+
+    def _step_end(self) -> StepResult:
+        future, self._future = self._future, None
+        return future.result()
+
+    def _step_batch(self, actions: np.ndarray) -> StepResult:
+        infos: list[dict[str, Any]] = [{} for _ in range(self.num_envs)]
+        cores = self.cores
+        for core in cores:
+            core._begin_step()
+        self._apply_actions(actions)
+        if self.config.enable_recharge:
+            self._apply_passive_recharge()
+        self._refresh_satellite_positions()
+        if self.config.enable_debris:
+            updates = [core._draw_debris_update() for core in cores]
+            self._propagate_bodies("debris_clouds", self._debris_clouds, updates)
+            for core, update in zip(cores, updates):
+                core._apply_debris_update(update)
+        for core in cores:
+            core.update_comm_graph()
+            core._share_task_knowledge()
+        self._apply_hazards()
+        for core in cores:
+            core._destroy_dead_satellites(core._reward_columns[REWARD_INDEX["data_loss"]])
+        updates = [core._draw_task_update() for core in cores]
+        self._propagate_bodies("tasks", self._tasks, updates)
+        for core, update in zip(cores, updates):
+            core._apply_task_update(update)
+        for b, core in enumerate(cores):
+            self.rewards[b], self.terminations[b], self.truncations[b] = core._end_step(actions[b])
+            core.observe_all(out=self.observations[b])
+            if core.last_episode is not None:
+                infos[b] = {
+                    "episode": core.last_episode,
+                    "final_observation": self.observations[b].copy(),
+                }
+                self._reset_env(b)
+        return self.observations, self.rewards, self.terminations, self.truncations, infos
+
+    def _apply_actions(self, actions: np.ndarray) -> None:
+        """Batched `OrbitalCore._apply_actions` over every environment.
+
+        Satellites that are not infected draw nothing here, so their actions
+        are resolved with masks over the whole batch. Infected ones go through
+        `OrbitalCore._apply_action` one by one; the two sets write disjoint
+        rows, so the split does not change the result.
+        """
+        cfg = self.config
+        energy_spent = self._reward_columns[REWARD_INDEX["energy"]]
+        codes = self._executed_codes
+        run_payload = self._run_payload
+        alive = self.health > 0.0
+        powered = alive & (self.energy > 0.0)
+        infected = powered & (self.compromised_for > 0)
+        clean = powered & ~infected
+
+        acts = np.asarray(actions, dtype=np.int64)
+        codes.fill(IDLE)
+        codes[clean] = np.where((acts[clean] < 0) | (acts[clean] > IDLE), IDLE, acts[clean])
+        self.last_action_forced[clean] = False
+        cost = self._energy_cost_vector[codes[clean]]
+        relay = (codes[clean] == RELAY_GROUND) | (codes[clean] == RELAY_SAT)
+        if relay.any():
+            high_start = cfg.orbit_max_radius - cfg.high_orbit_margin
+            radius = self.orbit_radius[clean][relay]
+            factor = np.clip((radius - high_start) / max(1e-6, cfg.high_orbit_margin), 0.0, 1.0)
+            factor[radius <= high_start] = 0.0
+            cost[relay] *= 1.0 + cfg.high_orbit_comm_cost_scale * factor.astype(np.float64)
+        cost = cost.astype(np.float32)
+        self.energy[clean] = np.maximum(0.0, self.energy[clean] - cost)
+        energy_spent[clean] += cost
+
+        # Actions take effect unless the cost drained the battery.
+        acting = clean & ((self.energy > 0.0) | (codes == LOWPOWER))
+        shift = acting & ((codes == ORBIT_DOWN) | (codes == ORBIT_UP))
+        if shift.any():
+            eccentricity = self.orbit_eccentricity[shift].astype(np.float64)
+            lo = cfg.orbit_min_radius / np.maximum(1e-6, 1.0 - eccentricity)
+            hi = cfg.orbit_max_radius / np.maximum(1e-6, 1.0 + eccentricity)
+            delta = np.where(codes[shift] == ORBIT_UP, cfg.orbit_shift_step, -cfg.orbit_shift_step)
+            self.orbit_semi_major_axis[shift] = np.clip(
+                self.orbit_semi_major_axis[shift].astype(np.float64) + delta, lo, hi)
+        np.logical_and(acting, codes <= RELAY_SAT, out=run_payload)
+        self.scan_boost[acting & (codes == CYBERSCAN)] = 4
+        if cfg.enable_recharge:
+            charge = acting & (codes == LOWPOWER) & (self.positions[..., 1] < 0.0)
+            self.energy[charge] = np.minimum(self.energy[charge] + cfg.recharge_rate, cfg.energy_budget)
+
+        for b, i in zip(*np.nonzero(infected)):
+            core = self.cores[b]
+            run_payload[b, i] = core._apply_action(int(i), int(actions[b, i]))
+            codes[b, i] = _ACTION_CODES[core.last_executed_actions[i]]
+
+        # Kepler propagation of every alive satellite. The mean motion uses
+        # Python's float power: NumPy's SIMD power can differ from it in the
+        # last bit, and the scalar path defines the trajectories.
+        axis = self.orbit_semi_major_axis[alive].tolist()
+        kepler_constant = cfg.kepler_constant
+        motion = np.array([kepler_constant / (max(1e-6, a) ** 1.5) for a in axis], dtype=np.float64)
+        anomaly = self.orbit_mean_anomaly[alive] + motion.astype(np.float32)
+        self.orbit_mean_anomaly[alive] = np.mod(anomaly.astype(np.float64), TWO_PI)
+
+        for b, core in enumerate(self.cores):
+            executed = core.last_executed_actions
+            executed[:] = [_ACTION_NAMES[code] for code in codes[b].tolist()]
+            for i in np.flatnonzero(run_payload[b]).tolist():
+                core._apply_payload(i, executed[i])
+            core.invalidate_derived("cyber")
+
+    def _propagate_bodies(self, name: str, stacked: BodyCatalog, updates: list[tuple[Any, ...]]) -> None:
+        """Propagate the bodies each update marks as moving, across all environments.
+
+        Ephemeris tables live on the member catalogs, so catalogs that have
+        them propagate one environment at a time.
+        """
+        kepler_constant = self.config.kepler_constant
+        if getattr(self.cores[0], name).ephemeris is not None:
+            for core, update in zip(self.cores, updates):
+                getattr(core, name).propagate(update[0], kepler_constant)
+            return
+        stacked.propagate(np.concatenate([update[0] for update in updates]), kepler_constant)
+
+    def _apply_passive_recharge(self) -> None:
+        """Batched `OrbitalCore._apply_passive_recharge`."""
+        cfg = self.config
+        charge = (self.health > 0.0) & (self.positions[..., 1] < 0.0)
+        self.energy[charge] = np.minimum(
+            self.energy[charge] + 0.15 * cfg.recharge_rate, cfg.energy_budget)
+
+    def _refresh_satellite_positions(self) -> None:
+        """Batched `OrbitalCore._refresh_satellite_positions`: one Kepler solve for all satellites."""
+        positions, theta, radius, phi = coordinates_from_elements(
+            *(getattr(self, name).reshape(-1) for name in _ORBIT_ELEMENTS),
+            self.config.world_dim,
+        )
+        self.positions[...] = positions.reshape(self.positions.shape)
+        self.orbit_theta[...] = theta.reshape(self.orbit_theta.shape)
+        self.orbit_radius[...] = radius.reshape(self.orbit_radius.shape)
+        self.orbit_phi[...] = phi.reshape(self.orbit_phi.shape)
+        for core in self.cores:
+            core.invalidate_derived("positions")
+
+    def _apply_hazards(self) -> None:
+        """Batched `OrbitalCore._apply_hazards`.
+
+        Drag and collision risk are applied over the whole batch; satellites
+        above the alert threshold then draw their collision in satellite order.
+        """
+        cfg = self.config
+        health_loss, atmospheric, debris_risk = (
+            self._reward_columns[REWARD_INDEX[name]] for name in ("health", "atmospheric_drag", "debris_risk"))
+        pc = self._pc_estimates
+        for b, core in enumerate(self.cores):
+            pc[b] = core._pc_estimate_vector()
+        alive = self.health > 0.0
+        low = alive & (self.orbit_radius <= cfg.orbit_min_radius + cfg.low_orbit_margin)
+        if low.any():
+            loss = np.minimum(self.health[low].astype(np.float64), cfg.atmospheric_health_loss)
+            loss = loss.astype(np.float32)
+            self.health[low] -= loss
+            health_loss[low] += loss
+            atmospheric[low] += loss
+
+        risk = np.where(self.health > 0.0, pc, 0.0)
+        maneuvered = (self._executed_codes == ORBIT_DOWN) | (self._executed_codes == ORBIT_UP)
+        risk[maneuvered] *= (1.0 - cfg.debris_mitigation_factor)
+        debris_risk[alive] = risk[alive]
+        if not cfg.enable_debris:
+            return
+        at_risk = alive & ~maneuvered & (risk >= cfg.pc_alert_threshold)
+        for b, i in zip(*np.nonzero(at_risk)):
+            self.cores[b]._debris_collision(int(i), float(risk[b, i]))
+
+    def close(self) -> None:
+        if self._step_pending:
+            self.step_wait()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
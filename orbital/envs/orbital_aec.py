@@ -47,7 +47,7 @@ class OrbitalAECEnv(AECEnv):
         self._cumulative_rewards = {a: 0.0 for a in self.agents}
         self.terminations = {a: False for a in self.agents}
         self.truncations = {a: False for a in self.agents}
-        self.infos = {a: self.core._build_info(i) for i, a in enumerate(self.agents)}
+        self.infos = dict(zip(self.agents, self.core.build_infos()))
         self._agent_selector = agent_selector(self.agents)
         self.agent_selection = self._agent_selector.next()
         self._pending_actions = {}
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
 from gymnasium.utils import seeding
 from pettingzoo import ParallelEnv
 
 from orbital.envs.core.config import OrbitalConfig
 from orbital.envs.core.dynamics import OrbitalCore
-from orbital.envs.core.spaces import build_action_space, build_observation_space
+from orbital.envs.core.spaces import OBSERVATION_SIZE, build_action_space, build_observation_space
 from orbital.envs.rendering.factory import create_renderer
 
 
@@ -26,6 +27,12 @@ class OrbitalParallelEnv(ParallelEnv):
         self._action_space = build_action_space()
         self._observation_space = build_observation_space()
         self.core = OrbitalCore(self.config)
+        # `step_array` returns read-only views of these buffers. Alternating
+        # between two keeps the previous step's observations valid for one
+        # more step; the dict API copies out of them instead.
+        self._obs_buffers = np.zeros(
+            (2, self.config.num_satellites, OBSERVATION_SIZE), dtype=np.float32)
+        self._obs_slot = 0
         self.render_mode = self.config.render_mode
         self.renderer = create_renderer(self.config.render_projection) if self.render_mode is not None else None
         self.np_random = None
@@ -37,21 +44,59 @@ class OrbitalParallelEnv(ParallelEnv):
         return self._action_space
 
     def reset(self, seed: int | None = None, options: dict | None = None):
+        """Start an episode; the returned observation arrays belong to the caller."""
         self.np_random, _ = seeding.np_random(seed)
         self.core.reset(seed)
         self.agents = self.possible_agents[:]
-        obs = {a: self.core.observe(i) for i, a in enumerate(self.agents)}
-        infos = {a: self.core._build_info(i) for i, a in enumerate(self.agents)}
+        obs = self._observe_agents()
+        infos = dict(zip(self.agents, self.core.build_infos()))
         return obs, infos
 
     def step(self, actions: dict[str, int]):
+        """PettingZoo parallel step.
+
+        Observations are fresh copies that the caller may keep, for example in
+        a rollout buffer. Use `step_array` to avoid the copy.
+        """
         if not self.agents:
             return {}, {}, {}, {}, {}
-        rewards, terms, truncs, infos = self.core.step(actions, self.agents)
-        obs = {a: self.core.observe(i) for i, a in enumerate(self.agents)}
-        if any(terms.values()) or any(truncs.values()):
+        agents = self.agents
+        action_array = np.full((self.config.num_satellites,), 7, dtype=np.int64)
+        for i, agent in enumerate(agents):
+            action_array[i] = int(actions.get(agent, 7))
+        obs, rewards, terms, truncs = self.step_array(action_array)
+        obs = obs.copy()
+        infos = self.core.build_infos()
+        return (
+            {a: obs[i] for i, a in enumerate(agents)},
+            {a: float(rewards[i]) for i, a in enumerate(agents)},
+            {a: bool(terms[i]) for i, a in enumerate(agents)},
+            {a: bool(truncs[i]) for i, a in enumerate(agents)},
+            {a: infos[i] for i, a in enumerate(agents)},
+        )
+
+    def step_array(self, actions: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Array counterpart of `step` indexed by satellite.
+
+        Returns ``(observations, rewards, terminations, truncations)`` with a
+        leading ``num_satellites`` axis, without copying. The observations are
+        a read-only view that stays valid through the next call and is
+        overwritten by the one after, so copy them to keep them longer. The
+        other arrays are reused by the next step. The episode summary of a
+        finished episode is available as ``core.last_episode``.
+        """
+        rewards, terms, truncs = self.core.step_array(actions)
+        self._obs_slot ^= 1
+        obs = self.core.observe_all(out=self._obs_buffers[self._obs_slot]).view()
+        obs.flags.writeable = False
+        if terms.any() or truncs.any():
             self.agents = []
-        return obs, rewards, terms, truncs, infos
+        return obs, rewards, terms, truncs
+
+    def _observe_agents(self) -> dict[str, np.ndarray]:
+        self._obs_slot ^= 1
+        rows = self.core.observe_all(out=self._obs_buffers[self._obs_slot]).copy()
+        return {a: rows[i] for i, a in enumerate(self.agents)}
 
     def render(self):
         if self.render_mode is None:
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import multiprocessing as mp
+import traceback
+from multiprocessing import shared_memory
+from typing import Any, Sequence
+
+import numpy as np
+
+from orbital.envs.core.spaces import OBSERVATION_SIZE
+from orbital.envs.core.vector import AsyncStepMixin, StepResult
+from orbital.envs.orbital_parallel import OrbitalParallelEnv
+
+
+def _buffer_layout(num_envs: int, num_agents: int) -> dict[str, tuple[tuple[int, ...], np.dtype]]:
+    agents = (num_envs, num_agents)
+    observations = agents + (OBSERVATION_SIZE,)
+    return {
+        "actions": (agents, np.dtype(np.int64)),
+        "observations": (observations, np.dtype(np.float32)),
+        "final_observations": (observations, np.dtype(np.float32)),
+        "rewards": (agents, np.dtype(np.float64)),
+        "terminations": (agents, np.dtype(np.bool_)),
+        "truncations": (agents, np.dtype(np.bool_)),
+        "episode_seeds": ((num_envs,), np.dtype(np.uint64)),
+    }
+
+
+def _buffer_offsets(layout: dict[str, tuple[tuple[int, ...], np.dtype]]) -> tuple[dict[str, int], int]:
+    offsets = {}
+    size = 0
+    for name, (shape, dtype) in layout.items():
+        offsets[name] = size
+        nbytes = int(np.prod(shape)) * dtype.itemsize
+        size += (nbytes + 7) // 8 * 8
+    return offsets, max(size, 1)
+
+
+def _bind_buffers(shm: shared_memory.SharedMemory, num_envs: int, num_agents: int) -> dict[str, np.ndarray]:
+    layout = _buffer_layout(num_envs, num_agents)
+    offsets, _ = _buffer_offsets(layout)
+    return {
+        name: np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offsets[name])
+        for name, (shape, dtype) in layout.items()
+    }
+
+
+def _worker(
+    index: int,
+    pipe,
+    parent_pipe,
+    shm_name: str,
+    num_envs: int,
+    env_cls: type[OrbitalParallelEnv],
+    env_kwargs: dict[str, Any],
+) -> None:
+    parent_pipe.close()
+    shm = shared_memory.SharedMemory(name=shm_name)
+    buffers = _bind_buffers(shm, num_envs, env_kwargs["num_satellites"])
+    env = env_cls(**env_kwargs)
+    agents = env.possible_agents
+    seeder = np.random.default_rng()
+
+    def reset_env() -> None:
+        episode_seed = int(seeder.integers(0, 2**63))
+        buffers["episode_seeds"][index] = episode_seed
+        obs, _ = env.reset(seed=episode_seed)
+        np.stack([obs[a] for a in agents], out=buffers["observations"][index])
+
+    try:
+        while True:
+            command, payload = pipe.recv()
+            if command == "reset":
+                seeder = np.random.default_rng(payload)
+                reset_env()
+                pipe.send(("ok", None))
+            elif command == "step":
+                obs, rewards, terms, truncs = env.step_array(buffers["actions"][index])
+                buffers["observations"][index] = obs
+                buffers["rewards"][index] = rewards
+                buffers["terminations"][index] = terms
+                buffers["truncations"][index] = truncs
+                episode = env.core.last_episode
+                if episode is not None:
+                    buffers["final_observations"][index] = obs
+                    reset_env()
+                pipe.send(("ok", episode))
+            elif command == "close":
+                pipe.send(("ok", None))
+                break
+            else:
+                raise ValueError(f"unknown worker command {command!r}")
+    except (EOFError, KeyboardInterrupt):
+        pass
+    except Exception:
+        pipe.send(("error", traceback.format_exc()))
+    finally:
+        env.close()
+        del buffers
+        shm.close()
+
+
+class OrbitalSubprocVectorEnv(AsyncStepMixin):
+    """Run K `OrbitalParallelEnv` copies in worker processes.
+
+    Actions, observations, rewards, terminations and truncations are exchanged
+    through one `multiprocessing.shared_memory` block laid out as ``(K, N, ...)``
+    arrays; the pipes only carry short commands and, when an episode ends, its
+    summary. Workers reset finished environments immediately with the next
+    seed from their own stream, so the returned observations always belong to
+    a running episode while `infos[k]` holds the finished episode's
+    ``"episode"`` summary and ``"final_observation"``.
+
+    The returned arrays are views onto the shared buffers and are overwritten
+    by the next `reset` or `step`. `step_async` only posts the actions, so the
+    caller can compute the next batch while the workers run; `step_wait`
+    collects the results.
+    """
+
+    def __init__(
+        self,
+        num_envs: int,
+        seed: int | Sequence[int] | None = None,
+        env_cls: type[OrbitalParallelEnv] = OrbitalParallelEnv,
+        context: str | None = None,
+        **env_kwargs: Any,
+    ):
+        if num_envs < 1:
+            raise ValueError("num_envs must be >= 1")
+        probe = env_cls(**env_kwargs)
+        self.config = probe.config
+        self.possible_agents = probe.possible_agents[:]
+        self.single_observation_space = probe.observation_space(self.possible_agents[0])
+        self.single_action_space = probe.action_space(self.possible_agents[0])
+        probe.close()
+        self.num_envs = num_envs
+        self.num_agents = self.config.num_satellites
+        env_kwargs = dict(env_kwargs, num_satellites=self.num_agents)
+
+        _, size = _buffer_offsets(_buffer_layout(num_envs, self.num_agents))
+        self._shm = shared_memory.SharedMemory(create=True, size=size)
+        self._buffers = _bind_buffers(self._shm, num_envs, self.num_agents)
+        for array in self._buffers.values():
+            array[...] = 0
+        self.observations = self._buffers["observations"]
+        self.rewards = self._buffers["rewards"]
+        self.terminations = self._buffers["terminations"]
+        self.truncations = self._buffers["truncations"]
+        self.episode_seeds = self._buffers["episode_seeds"]
+
+        ctx = mp.get_context(context)
+        self._pipes = []
+        self._processes = []
+        for index in range(num_envs):
+            parent_pipe, child_pipe = ctx.Pipe()
+            process = ctx.Process(
+                target=_worker,
+                args=(index, child_pipe, parent_pipe, self._shm.name, num_envs, env_cls, env_kwargs),
+                daemon=True,
+            )
+            process.start()
+            child_pipe.close()
+            self._pipes.append(parent_pipe)
+            self._processes.append(process)
+        self.closed = False
+        self.reset(seed)
+
+    def reset(self, seed: int | Sequence[int] | None = None) -> np.ndarray:
+        """Reset every environment and return the ``(K, N, obs)`` observations.
+
+        An int seeds independent per-environment seed streams; a sequence of
+        K ints seeds each environment's stream explicitly.
+        """
+        self._check_not_pending()
+        if seed is None or isinstance(seed, (int, np.integer)):
+            children = np.random.SeedSequence(seed).spawn(self.num_envs)
+        else:
+            if len(seed) != self.num_envs:
+                raise ValueError("seed sequence length must equal num_envs")
+            children = [np.random.SeedSequence(int(s)) for s in seed]
+        for pipe, child in zip(self._pipes, children):
+            pipe.send(("reset", child))
+        self._collect()
+        self.rewards[...] = 0.0
+        self.terminations[...] = False
+        self.truncations[...] = False
+        return self.observations
+
+    def _step_begin(self, actions: np.ndarray) -> None:
+        self._buffers["actions"][...] = self._check_actions(actions)
+        for pipe in self._pipes:
+            pipe.send(("step", None))
+
+    def _step_end(self) -> StepResult:
+        infos: list[dict[str, Any]] = [{} for _ in range(self.num_envs)]
+        for index, episode in enumerate(self._collect()):
+            if episode is not None:
+                infos[index] = {
+                    "episode": episode,
+                    "final_observation": self._buffers["final_observations"][index].copy(),
+                }
+        return self.observations, self.rewards, self.terminations, self.truncations, infos
+
+    def _collect(self) -> list[Any]:
+        results = [pipe.recv() for pipe in self._pipes]
+        for index, (status, payload) in enumerate(results):
+            if status == "error":
+                raise RuntimeError(f"ORBITAL worker {index} failed:\n{payload}")
+        return [payload for _, payload in results]
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        if self._step_pending:
+            try:
+                self.step_wait()
+            except RuntimeError:
+                pass
+        for pipe in self._pipes:
+            try:
+                pipe.send(("close", None))
+                pipe.recv()
+            except (BrokenPipeError, EOFError, OSError):
+                pass
+            pipe.close()
+        for process in self._processes:
+            process.join(timeout=5.0)
+            if process.is_alive():
+                process.terminate()
+        self._buffers = {}
+        self.observations = self.rewards = self.terminations = self.truncations = self.episode_seeds = None
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self) -> OrbitalSubprocVectorEnv:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self):
+        if not getattr(self, "closed", True):
+            self.close()
@@ -420,18 +420,16 @@ class PygameRenderer:
                 pygame.draw.line(self.screen, col, tr[k - 1], tr[k], 1)
 
         if show_links:
-            for i in range(core.num_agents):
-                for j in range(i + 1, core.num_agents):
-                    health_arr = getattr(core, "health", core.energy)
-                    if health_arr[i] <= 0 or health_arr[j] <= 0:
-                        continue
-                    if core.comm_adj[i, j]:
-                        p1 = sat_points[i]
-                        p2 = sat_points[j]
-                        highlighted = core._has_path_to_ground(i) or core._has_path_to_ground(j)
-                        link_color = (112, 196, 255) if highlighted else (78, 96, 148)
-                        for a, b in self._clip_line_to_earth(p1, p2, cx, cy, float(earth_r)):
-                            pygame.draw.line(self.screen, link_color, a, b, 2 if highlighted else 1)
+            health_arr = getattr(core, "health", core.energy)
+            for i, j in zip(*core.comm_graph.edges()):
+                if health_arr[i] <= 0 or health_arr[j] <= 0:
+                    continue
+                p1 = sat_points[i]
+                p2 = sat_points[j]
+                highlighted = core._has_path_to_ground(i) or core._has_path_to_ground(j)
+                link_color = (112, 196, 255) if highlighted else (78, 96, 148)
+                for a, b in self._clip_line_to_earth(p1, p2, cx, cy, float(earth_r)):
+                    pygame.draw.line(self.screen, link_color, a, b, 2 if highlighted else 1)
 
         # Debris clouds are visualized as translucent hazard halos with a color
         # intentionally separated from observation tasks.
@@ -474,22 +472,11 @@ class PygameRenderer:
             self._draw_text(f"GS{gi}", gx + 10, gy - 10, (175, 244, 176), size=11, bold=True)
 
         if show_links:
+            contact_station = core.ground_contact_station()
             for i in range(core.num_agents):
-                health_arr = getattr(core, "health", core.energy)
-                if health_arr[i] <= 0 or not core._direct_ground_contact(i):
+                ground_idx = int(contact_station[i])
+                if ground_idx < 0:
                     continue
-                if core.config.world_dim == 3:
-                    sat_vec = core.positions[i]
-                    ground_idx = int(np.argmin([
-                        float(np.linalg.norm(sat_vec - core.ground_vectors[j]))
-                        for j in range(len(core.ground_vectors))
-                    ]))
-                else:
-                    sat_theta = float(core.orbit_theta[i])
-                    ground_idx = int(np.argmin([
-                        abs(core._angle_delta(sat_theta, float(gt)))
-                        for gt in core.ground_thetas
-                    ]))
                 for a, b in self._clip_line_to_earth(
                     sat_points[i],
                     ground_points[ground_idx],
@@ -506,7 +493,7 @@ class PygameRenderer:
             alive = health_arr[i] > 0
             if not alive:
                 continue
-            isolated = alive and int(core.comm_adj[i].sum()) == 0
+            isolated = alive and core.comm_graph.degree[i] == 0
             agent_name = f"sat_{i}"
             role = str(debug_roles.get(agent_name, ""))
             energy_ratio = core.energy[i] / max(core.config.energy_budget, 1e-6)
@@ -583,7 +570,7 @@ class PygameRenderer:
         active_debris = sum(1 for d in getattr(core, "debris_clouds", []) if d.density > 1e-4)
         health_arr = getattr(core, "health", core.energy)
         alive_count = int((health_arr > 0).sum())
-        isolated_count = sum(1 for i in range(core.num_agents) if health_arr[i] > 0 and int(core.comm_adj[i].sum()) == 0)
+        isolated_count = sum(1 for i in range(core.num_agents) if health_arr[i] > 0 and core.comm_graph.degree[i] == 0)
         y = panel_rect.top + 16
         x = panel_rect.left + 14
 
@@ -297,7 +297,6 @@ class PyVistaRenderer:
         self._scene_initialized = True
 
     def _update_links_buffer(self, core, show_links: bool) -> None:
-        n_agents = core.num_agents
         far = np.array([self._far, self._far, self._far], dtype=np.float32)
 
         if not show_links:
@@ -308,14 +307,11 @@ class PyVistaRenderer:
         points = []
         lines = []
         k = 0
-        for i in range(n_agents):
-            for j in range(i + 1, n_agents):
-                if not core.comm_adj[i, j]:
-                    continue
-                points.append(self._to_xyz(core.positions[i]))
-                points.append(self._to_xyz(core.positions[j]))
-                lines.extend([2, 2 * k, 2 * k + 1])
-                k += 1
+        for i, j in zip(*core.comm_graph.edges()):
+            points.append(self._to_xyz(core.positions[i]))
+            points.append(self._to_xyz(core.positions[j]))
+            lines.extend([2, 2 * k, 2 * k + 1])
+            k += 1
 
         if k == 0:
             self._links_poly.points[:] = far
@@ -429,7 +425,7 @@ class PyVistaRenderer:
             if compromised and alert_idx < alert_pts.shape[0]:
                 alert_pts[alert_idx] = sat_pts[i]
                 alert_idx += 1
-            if alive and int(core.comm_adj[i].sum()) == 0 and isolated_idx < isolated_pts.shape[0]:
+            if alive and core.comm_graph.degree[i] == 0 and isolated_idx < isolated_pts.shape[0]:
                 isolated_pts[isolated_idx] = sat_pts[i]
                 isolated_idx += 1
             if alive and core._direct_ground_contact(i) and contact_idx < contact_pts.shape[0]:
@@ -0,0 +1,61 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from orbital.envs.core.config import OrbitalConfig
+from orbital.envs.core.vector import VectorOrbitalCore
+from orbital.envs.orbital_vector import OrbitalSubprocVectorEnv
+
+
+def _rollout(envs, actions, mode):
+    outputs = []
+    for batch in actions:
+        if mode == "sync":
+            obs, rewards, _, _, _ = envs.step(batch)
+        elif mode == "async":
+            envs.step_async(batch)
+            obs, rewards, _, _, _ = envs.step_wait()
+        else:
+            obs, rewards, _, _, _ = asyncio.run(envs.step_awaitable(batch))
+        outputs.append((obs.copy(), rewards.copy()))
+    return outputs
+
+
+@pytest.mark.parametrize("mode", ["async", "awaitable"])
+def test_vector_core_async_step_matches_sync(mode):
+    config = OrbitalConfig(num_satellites=5, adversarial_rate=0.3, max_steps=8)
+    actions = np.random.default_rng(0).integers(0, 8, size=(12, 2, 5))
+    sync = VectorOrbitalCore(config, num_envs=2, seed=4)
+    background = VectorOrbitalCore(config, num_envs=2, seed=4)
+
+    for (obs, rewards), (ref_obs, ref_rewards) in zip(
+            _rollout(background, actions, mode), _rollout(sync, actions, "sync")):
+        np.testing.assert_array_equal(obs, ref_obs)
+        np.testing.assert_array_equal(rewards, ref_rewards)
+    background.close()
+
+
+@pytest.mark.parametrize("mode", ["async", "awaitable"])
+def test_subproc_vector_env_async_step_matches_sync(mode):
+    actions = np.random.default_rng(1).integers(0, 8, size=(6, 2, 4))
+    with OrbitalSubprocVectorEnv(2, seed=9, num_satellites=4) as envs:
+        results = _rollout(envs, actions, mode)
+    reference = VectorOrbitalCore(OrbitalConfig(num_satellites=4), num_envs=2, seed=9)
+
+    for (obs, rewards), (ref_obs, ref_rewards) in zip(results, _rollout(reference, actions, "sync")):
+        np.testing.assert_array_equal(obs, ref_obs)
+        np.testing.assert_array_equal(rewards, ref_rewards)
+
+
+def test_step_wait_requires_pending_step():
+    vec = VectorOrbitalCore(OrbitalConfig(num_satellites=3), num_envs=2, seed=0)
+    with pytest.raises(RuntimeError):
+        vec.step_wait()
+    vec.step_async(np.zeros((2, 3), dtype=int))
+    with pytest.raises(RuntimeError):
+        vec.step_async(np.zeros((2, 3), dtype=int))
+    with pytest.raises(RuntimeError):
+        vec.reset(0)
+    vec.step_wait()
+    vec.close()
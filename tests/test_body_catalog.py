@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from orbital.envs.core.config import OrbitalConfig
+from orbital.envs.core.dynamics import KeplerOrbit, OrbitalCore
+
+
+def test_task_and_debris_views_match_scalar_reference():
+    core = OrbitalCore(OrbitalConfig(world_dim=3, num_tasks=12, num_debris_clouds=5))
+    core.reset(seed=11)
+    actions = {f"sat_{idx}": 7 for idx in range(core.num_agents)}
+    for _ in range(3):
+        core.step(actions, list(actions))
+
+    for body in list(core.tasks) + list(core.debris_clouds):
+        orbit = KeplerOrbit(
+            semi_major_axis=body.orbit.semi_major_axis,
+            eccentricity=body.orbit.eccentricity,
+            mean_anomaly=body.orbit.mean_anomaly,
+            arg_periapsis=body.orbit.arg_periapsis,
+            inclination=body.orbit.inclination,
+            raan=body.orbit.raan,
+        )
+        vec, theta, radius, phi = core._coordinates_from_elements(orbit)
+        np.testing.assert_allclose(body.position, vec, rtol=1e-5, atol=1e-5)
+        assert body.theta == pytest.approx(theta, abs=1e-5)
+        assert body.radius == pytest.approx(radius, rel=1e-5)
+        assert body.phi == pytest.approx(phi, abs=1e-5)
+
+
+def test_views_write_through_to_columnar_storage():
+    core = OrbitalCore(OrbitalConfig(num_tasks=4, num_debris_clouds=2))
+    core.reset(seed=3)
+
+    core.tasks[2].active = False
+    core.tasks[-1].priority = 0.75
+    core.debris_clouds[0].density = 0.0
+
+    assert not core.tasks.active[2]
+    assert core.tasks.priority[3] == pytest.approx(0.75)
+    assert core.debris_clouds.density[0] == 0.0
+    assert len(core.tasks) == 4
+    assert [task.active for task in core.tasks] == [True, True, False, True]
+    with pytest.raises(IndexError):
+        core.tasks[4]
+
+
+def test_depleted_debris_clouds_respawn_in_place():
+    core = OrbitalCore(OrbitalConfig(num_debris_clouds=3, debris_spawn_rate=1.0))
+    core.reset(seed=5)
+    core.debris_clouds.density[:] = 0.0
+
+    core._update_debris_clouds()
+
+    assert np.all(core.debris_clouds.density >= 0.35)
+    assert np.all(core.debris_clouds.spread >= core.config.debris_spread_min)
@@ -0,0 +1,148 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from orbital.envs.core.comm import CommGraph, dense_link_candidates, grid_link_candidates
+from orbital.envs.core.config import OrbitalConfig
+from orbital.envs.core.dynamics import OrbitalCore
+
+
+def _reference_comm_graph(core):
+    n = core.num_agents
+    adj = np.zeros((n, n), dtype=np.bool_)
+    comm_dist = core._comm_distance_threshold()
+    for i in range(n):
+        if not core._is_alive(i):
+            continue
+        for j in range(i + 1, n):
+            if not core._is_alive(j):
+                continue
+            dist = float(np.linalg.norm(core.positions[i] - core.positions[j]))
+            los_clear = not core._segment_intersects_earth(core.positions[i], core.positions[j])
+            if dist <= comm_dist and los_clear and core.rng.random() > core.config.p_link_drop:
+                adj[i, j] = True
+                adj[j, i] = True
+    return adj
+
+
+def test_vectorized_comm_graph_matches_pairwise_loop():
+    for world_dim in (2, 3):
+        core = OrbitalCore(OrbitalConfig(num_satellites=60, world_dim=world_dim, comm_radius=5, p_link_drop=0.2))
+        core.reset(seed=world_dim)
+        core.health[::7] = 0.0
+
+        state = core.rng.bit_generator.state
+        expected = _reference_comm_graph(core)
+        expected_after = core.rng.random()
+
+        core.rng.bit_generator.state = state
+        core.update_comm_graph()
+
+        assert expected.any()
+        np.testing.assert_array_equal(core.comm_adj, expected)
+        assert core.rng.random() == expected_after
+
+
+def test_grid_neighbor_search_matches_dense_search():
+    for world_dim in (2, 3):
+        dense = OrbitalCore(OrbitalConfig(num_satellites=300, world_dim=world_dim, comm_neighbor_search="dense"))
+        grid = OrbitalCore(OrbitalConfig(num_satellites=300, world_dim=world_dim, comm_neighbor_search="grid"))
+        dense.reset(seed=9)
+        grid.reset(seed=9)
+        dense.health[::11] = 0.0
+        grid.health[::11] = 0.0
+
+        dense.update_comm_graph()
+        grid.update_comm_graph()
+
+        assert dense.comm_adj.sum() > 0
+        np.testing.assert_array_equal(grid.comm_adj, dense.comm_adj)
+        assert grid.rng.random() == dense.rng.random()
+
+
+def test_neighbor_search_backend_is_chosen_by_fleet_size():
+    small = OrbitalCore(OrbitalConfig(num_satellites=8, comm_grid_min_satellites=16))
+    large = OrbitalCore(OrbitalConfig(num_satellites=16, comm_grid_min_satellites=16))
+
+    assert small._link_candidates() is dense_link_candidates
+    assert large._link_candidates() is grid_link_candidates
+
+
+def _reference_route_distance(core, src):
+    if not core._is_alive(src):
+        return None
+    if core._direct_ground_contact(src):
+        return 0
+    visited = {src}
+    frontier = [(src, 0)]
+    while frontier:
+        node, dist = frontier.pop(0)
+        for j in np.where(core.comm_adj[node])[0]:
+            j = int(j)
+            if j in visited or not core._is_alive(j):
+                continue
+            if core._direct_ground_contact(j):
+                return dist + 1
+            visited.add(j)
+            frontier.append((j, dist + 1))
+    return None
+
+
+def test_route_table_matches_per_source_bfs():
+    core = OrbitalCore(OrbitalConfig(num_satellites=40, comm_radius=4, p_link_drop=0.3))
+    core.reset(seed=21)
+    actions = {f"sat_{idx}": 7 for idx in range(core.num_agents)}
+    for _ in range(3):
+        core.step(actions, list(actions))
+    core.health[[3, 17]] = 0.0
+    core.invalidate_derived("health")
+
+    expected = [_reference_route_distance(core, i) for i in range(core.num_agents)]
+
+    assert any(dist is not None and dist > 1 for dist in expected)
+    assert [core._ground_route_distance(i) for i in range(core.num_agents)] == expected
+
+
+def test_route_table_is_recomputed_after_comm_graph_update():
+    core = OrbitalCore(OrbitalConfig(num_satellites=12))
+    core.reset(seed=2)
+    table = core._ground_route_table()
+
+    assert core._ground_route_table() is table
+    core.update_comm_graph()
+    assert core._ground_route_table() is not table
+
+
+def test_csr_graph_round_trips_through_edges_and_dense_view():
+    core = OrbitalCore(OrbitalConfig(num_satellites=30, comm_radius=4, p_link_drop=0.2))
+    core.reset(seed=4)
+    graph = core.comm_graph
+    rebuilt = CommGraph.from_pairs(graph.num_nodes, *graph.edges())
+
+    assert graph.num_links > 0 and rebuilt.equals(graph)
+    np.testing.assert_array_equal(graph.degree, core.comm_adj.sum(axis=1))
+    for i in range(core.num_agents):
+        np.testing.assert_array_equal(graph.neighbors(i), np.flatnonzero(core.comm_adj[i]))
+
+
+def test_large_constellation_step_allocates_no_dense_adjacency():
+    n = 5000
+    actions = np.random.default_rng(0).integers(0, 8, size=n)
+
+    tracemalloc.start()
+    try:
+        core = OrbitalCore(OrbitalConfig(num_satellites=n, comm_radius=1, adversarial_rate=0.3))
+        core.reset(seed=0)
+        core.step_array(actions)
+        core.observe_all()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert core.comm_graph.num_links > 0
+    # Building the core, its links, routes and observations together stays
+    # below a single dense boolean (N, N) adjacency.
+    assert peak < n * n
+    with pytest.raises(ValueError):
+        core.comm_adj
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from orbital.envs.core.config import OrbitalConfig
+from orbital.envs.core.dynamics import OrbitalCore
+
+
+def _reference_density(core, i):
+    if not core._is_alive(i):
+        return 0.0
+    density = 0.0
+    for cloud in core.debris_clouds:
+        if cloud.density <= 1e-4:
+            continue
+        d_theta = core._angle_delta(float(core.orbit_theta[i]), cloud.theta)
+        d_radius = float(core.orbit_radius[i]) - cloud.radius
+        d_phi = float(core.orbit_phi[i]) - cloud.phi if core.config.world_dim == 3 else 0.0
+        dist = float(np.sqrt(d_theta * d_theta + d_radius * d_radius + d_phi * d_phi))
+        density += cloud.density * float(np.exp(-0.5 * (dist / max(1e-3, cloud.spread)) ** 2))
+    return float(np.clip(density, 0.0, 1.5))
+
+
+@pytest.mark.parametrize("world_dim", [2, 3])
+def test_debris_kernel_matches_per_cloud_loop(world_dim):
+    core = OrbitalCore(OrbitalConfig(num_satellites=20, num_debris_clouds=9, world_dim=world_dim, adversarial_rate=0.5))
+    core.reset(seed=world_dim)
+    # Put clouds across the 0/2pi seam from some satellites to exercise wrapping.
+    core.debris_clouds.theta[:3] = 0.02
+    core.orbit_theta[:3] = 2.0 * np.pi - 0.03
+    core.debris_clouds.radius[:3] = core.orbit_radius[:3]
+    core.debris_clouds.density[3] = 0.0
+    core.health[5] = 0.0
+    core.compromised_for[[1, 7]] = 3
+    core.invalidate_derived()
+
+    expected = np.array([_reference_density(core, i) for i in range(core.num_agents)])
+
+    np.testing.assert_allclose(core._debris_density_vector(), expected, rtol=1e-12, atol=1e-12)
+    assert expected[:3].min() > 0.1
+    for i in range(core.num_agents):
+        base = expected[i] * (1.10 if core.compromised_for[i] > 0 else 1.0)
+        assert core._local_pc_estimate(i) == pytest.approx(
+            float(np.clip(core.config.debris_risk_gain * base, 0.0, 1.0)), rel=1e-12, abs=1e-12)
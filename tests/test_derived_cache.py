@@ -0,0 +1,53 @@
+from orbital.envs.core.cache import DerivedStateCache
+from orbital.envs.core.config import OrbitalConfig
+from orbital.envs.core.dynamics import OrbitalCore
+
+
+def test_cache_invalidates_only_dependent_entries():
+    cache = DerivedStateCache()
+    calls = []
+    cache.get("contact", lambda: calls.append("contact") or 1, ("positions", "health"))
+    cache.get("degree", lambda: calls.append("degree") or 2, ("comm",))
+    cache.get("threshold", lambda: calls.append("threshold") or 3)
+
+    cache.invalidate("comm")
+    cache.get("contact", lambda: calls.append("contact") or 1, ("positions", "health"))
+    cache.get("degree", lambda: calls.append("degree") or 2, ("comm",))
+    cache.invalidate()
+    cache.get("threshold", lambda: calls.append("threshold") or 3)
+
+    assert calls == ["contact", "degree", "threshold", "degree"]
+    assert cache.hits == 2
+    assert cache.misses == 4
+
+
+def test_observe_and_info_share_derived_vectors_within_a_step():
+    core = OrbitalCore(OrbitalConfig(num_satellites=8))
+    core.reset(seed=4)
+    actions = {f"sat_{idx}": 7 for idx in range(core.num_agents)}
+    core.step(actions, list(actions))
+    core.derived_cache.reset_stats()
+
+    for i in range(core.num_agents):
+        core.observe(i)
+        core._build_info(i)
+    misses = core.derived_cache.misses
+
+    assert core.derived_cache.hits > 10 * misses
+    version = core.derived_cache.version
+    core.step(actions, list(actions))
+    assert core.derived_cache.version > version
+
+
+def test_direct_state_edits_are_visible_after_invalidation():
+    core = OrbitalCore(OrbitalConfig(num_satellites=6, adversarial_rate=0.0))
+    core.reset(seed=8)
+    baseline = core._local_pc_estimate(0)
+    core.debris_clouds.density[:] = 1.0
+    core.debris_clouds.spread[:] = core.config.debris_spread_max
+    core.debris_clouds.theta[:] = core.orbit_theta[0]
+    core.debris_clouds.radius[:] = core.orbit_radius[0]
+
+    assert core._local_pc_estimate(0) == baseline
+    core.invalidate_derived("debris")
+    assert core._local_pc_estimate(0) > baseline
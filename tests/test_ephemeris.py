@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from orbital.envs.core import OrbitalConfig, OrbitalCore
+from orbital.envs.core.bodies import ELEMENT_FIELDS
+from orbital.envs.core.kepler import TWO_PI, coordinates_from_elements, positions_from_elements
+
+
+def _newton(catalog):
+    return coordinates_from_elements(*(getattr(catalog, name) for name in ELEMENT_FIELDS), catalog.world_dim)
+
+
+@pytest.mark.parametrize("world_dim", [2, 3])
+def test_ephemeris_stays_within_tolerance(world_dim):
+    config = OrbitalConfig(
+        num_satellites=6, world_dim=world_dim, body_propagation="ephemeris", debris_spawn_rate=0.5)
+    core = OrbitalCore(config)
+    core.reset(2)
+    assert core.tasks.ephemeris is None
+    actions = np.random.default_rng(0).integers(0, 8, size=(60, 6))
+    for step_actions in actions:
+        core.step_array(step_actions)
+        table = core.debris_clouds.ephemeris
+        assert np.all(table.max_error[~table.exact] <= config.ephemeris_tolerance)
+        positions, theta, radius, phi = _newton(core.debris_clouds)
+        # Float32 rounding of the interpolated positions comes on top of the bound.
+        assert np.abs(core.debris_clouds.positions - positions).max() <= config.ephemeris_tolerance + 1e-5
+    assert core.debris_clouds.ephemeris.builds > config.num_debris_clouds  # respawns rebuilt their tables
+
+
+@pytest.mark.parametrize("world_dim", [2, 3])
+def test_midpoint_estimate_tracks_dense_grid_error(world_dim):
+    config = OrbitalConfig(
+        num_satellites=4, world_dim=world_dim, body_propagation="ephemeris",
+        num_debris_clouds=12, ephemeris_samples=16)
+    core = OrbitalCore(config)
+    core.reset(1)
+    clouds = core.debris_clouds
+    table = clouds.ephemeris
+    anomaly = np.linspace(0.0, TWO_PI, 2048, endpoint=False)
+    scaled = anomaly / table.segment
+    segment = np.minimum(scaled.astype(np.intp), table.samples - 1)
+    offset = (scaled - segment)[:, None]
+    for k in range(len(clouds)):
+        exact = positions_from_elements(
+            *(anomaly if name == "mean_anomaly" else np.full(anomaly.shape, getattr(clouds, name)[k])
+              for name in ELEMENT_FIELDS),
+            world_dim,
+        )
+        c = table.coefficients[k, segment]
+        interpolated = c[:, 0] + offset * (c[:, 1] + offset * (c[:, 2] + offset * c[:, 3]))
+        error = np.linalg.norm(interpolated - exact, axis=-1).max()
+        assert table.max_error[k] <= error <= 1.01 * table.max_error[k]
+
+
+def test_bodies_over_tolerance_fall_back_to_newton():
+    config = OrbitalConfig(
+        num_satellites=4, world_dim=3, body_propagation="ephemeris",
+        ephemeris_samples=8, ephemeris_tolerance=1e-9)
+    core = OrbitalCore(config)
+    core.reset(0)
+    core.step_array(np.zeros(4, dtype=np.int64))
+    assert core.debris_clouds.ephemeris.exact.all()
+    positions, theta, radius, phi = _newton(core.debris_clouds)
+    np.testing.assert_array_equal(core.debris_clouds.positions, positions)
+    np.testing.assert_array_equal(core.debris_clouds.theta, theta)
+
+
+def test_restore_rebuilds_tables_for_restored_orbits():
+    config = OrbitalConfig(num_satellites=5, body_propagation="ephemeris", debris_spawn_rate=1.0, debris_decay=0.5)
+    core = OrbitalCore(config)
+    core.reset(3)
+    snap = core.snapshot()
+    actions = np.random.default_rng(1).integers(0, 8, size=(40, 5))
+
+    def rollout():
+        frames = []
+        for step_actions in actions:
+            core.step_array(step_actions)
+            frames.append(core.debris_clouds.positions.copy())
+        return frames
+
+    first = rollout()
+    core.restore(snap)
+    second = rollout()
+    for a, b in zip(first, second):
+        np.testing.assert_array_equal(a, b)
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"body_propagation": "chebyshev"},
+    {"ephemeris_samples": 2},
+    {"ephemeris_tolerance": 0.0},
+])
+def test_ephemeris_config_validation(kwargs):
+    with pytest.raises(ValueError):
+        OrbitalConfig(**kwargs)
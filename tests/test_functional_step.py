@@ -0,0 +1,128 @@
+import copy
+import pickle
+
+import numpy as np
+import pytest
+
+from orbital.envs.core import OrbitalConfig, OrbitalCore, OrbitalState, step
+
+
+def _copy_rng(rng):
+    clone = np.random.default_rng()
+    clone.bit_generator.state = rng.bit_generator.state
+    return clone
+
+
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {"world_dim": 3, "reward_mode": "local", "adversarial_rate": 0.3},
+    {"enable_local_task_discovery": True, "task_knowledge_mode": "local_discovery"},
+])
+def test_functional_step_matches_core(kwargs):
+    config = OrbitalConfig(num_satellites=8, max_steps=20, **kwargs)
+    core = OrbitalCore(config)
+    core.reset(5)
+    state = core.export_state()
+    rng = _copy_rng(core.rng)
+    policy = np.random.default_rng(1)
+
+    for _ in range(config.max_steps):
+        actions = policy.integers(0, 8, size=config.num_satellites)
+        rewards, terms, truncs = core.step_array(actions)
+        state, outputs = step(state, actions, rng, config)
+        np.testing.assert_array_equal(outputs.rewards, rewards)
+        np.testing.assert_array_equal(outputs.terminations, terms)
+        np.testing.assert_array_equal(outputs.truncations, truncs)
+        np.testing.assert_array_equal(outputs.reward_components, core.reward_components)
+        assert list(outputs.executed_actions) == core.last_executed_actions
+        assert state.equals(core.export_state())
+        if outputs.episode is not None:
+            assert outputs.episode == core.last_episode
+            break
+    assert rng.bit_generator.state == core.rng.bit_generator.state
+
+
+def test_functional_step_carries_split_streams():
+    config = OrbitalConfig(num_satellites=6, adversarial_rate=0.5, rng_streams="split")
+    core = OrbitalCore(config)
+    core.reset(0)
+    state = core.export_state()
+    streams = copy.deepcopy(core.streams)
+    policy = np.random.default_rng(2)
+
+    for _ in range(20):
+        actions = policy.integers(0, 8, size=config.num_satellites)
+        rewards, _, _ = core.step_array(actions)
+        state, outputs = step(state, actions, streams, config)
+        np.testing.assert_array_equal(outputs.rewards, rewards)
+        assert state.equals(core.export_state())
+    assert repr(streams.get_state()) == repr(core.streams.get_state())
+
+    with pytest.raises(ValueError):
+        step(state, actions, np.random.default_rng(0), config)
+
+
+def test_functional_step_leaves_input_state_untouched():
+    config = OrbitalConfig(num_satellites=5, adversarial_rate=0.5)
+    core = OrbitalCore(config)
+    core.reset(3)
+    state = core.export_state()
+    before = copy.deepcopy(state)
+    actions = np.arange(config.num_satellites) % 8
+
+    branches = [step(state, actions, np.random.default_rng(0), config)[0] for _ in range(2)]
+    assert state.equals(before)
+    assert branches[0].equals(branches[1])
+    assert branches[0].t == state.t + 1
+    with pytest.raises(ValueError):
+        state.satellites["energy"][0] = 0.0
+
+
+def test_interleaved_branches_do_not_share_scratch_state():
+    config = OrbitalConfig(num_satellites=5, adversarial_rate=0.4, world_dim=3)
+    core = OrbitalCore(config)
+    core.reset(6)
+    root = core.export_state()
+    actions = np.random.default_rng(4).integers(0, 8, size=(10, config.num_satellites))
+
+    def branch(state, seed, steps):
+        rng = np.random.default_rng(seed)
+        for step_actions in actions[:steps]:
+            state, outputs = step(state, step_actions, rng, config)
+        return state, outputs
+
+    alone = branch(root, 1, 10)
+    a, b = root, root
+    rng_a, rng_b = np.random.default_rng(1), np.random.default_rng(2)
+    for step_actions in actions:
+        a, outputs_a = step(a, step_actions, rng_a, config)
+        b, _ = step(b, step_actions[::-1], rng_b, config)
+    assert a.equals(alone[0])
+    np.testing.assert_array_equal(outputs_a.rewards, alone[1].rewards)
+
+
+def test_state_round_trips_through_pickle_and_load_state():
+    config = OrbitalConfig(num_satellites=4, world_dim=3)
+    core = OrbitalCore(config)
+    core.reset(8)
+    core.step_array(np.zeros(config.num_satellites, dtype=np.int64))
+    state = pickle.loads(pickle.dumps(core.export_state()))
+
+    other = OrbitalCore(config)
+    other.reset(99)
+    other.load_state(state)
+    other.rng.bit_generator.state = core.rng.bit_generator.state
+    assert other.export_state().equals(core.export_state())
+    np.testing.assert_array_equal(other.observe_all(), core.observe_all())
+
+    with pytest.raises(ValueError):
+        OrbitalCore(OrbitalConfig(num_satellites=3)).load_state(state)
+
+
+def test_from_state_does_not_alias_state_arrays():
+    config = OrbitalConfig(num_satellites=4)
+    state = OrbitalCore(config).export_state()
+    core = OrbitalCore.from_state(config, state)
+    core.step_array(np.full(config.num_satellites, 7))
+    assert isinstance(state, OrbitalState)
+    assert state.t == 0 and core.t == 1
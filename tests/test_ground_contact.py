@@ -0,0 +1,52 @@
+import math
+
+import numpy as np
+import pytest
+
+from orbital.envs.core.config import OrbitalConfig
+from orbital.envs.core.dynamics import OrbitalCore
+
+
+def _reference_contact(core, i):
+    if not core._is_alive(i):
+        return False
+    if core.config.world_dim == 3:
+        sat_unit = core.positions[i].astype(np.float64)
+        sat_unit /= np.linalg.norm(sat_unit)
+        cos_th = np.cos(core.config.ground_contact_angle)
+        return any(
+            float(np.dot(sat_unit, g.astype(np.float64) / np.linalg.norm(g))) >= cos_th
+            for g in core.ground_vectors
+        )
+    sat_theta = float(core.orbit_theta[i])
+    return any(
+        abs(core._angle_delta(sat_theta, float(gs))) <= core.config.ground_contact_angle
+        for gs in core.ground_thetas
+    )
+
+
+@pytest.mark.parametrize("world_dim", [2, 3])
+def test_contact_matrix_matches_per_station_loop(world_dim):
+    thetas = tuple(np.linspace(0.0, 2.0 * math.pi, 24, endpoint=False))
+    phis = tuple(np.linspace(-0.4, 0.4, 24))
+    core = OrbitalCore(OrbitalConfig(
+        num_satellites=40,
+        world_dim=world_dim,
+        ground_station_thetas=thetas,
+        ground_station_phis=phis,
+        ground_contact_angle=0.15,
+    ))
+    core.reset(seed=world_dim)
+    core.health[3] = 0.0
+    core.invalidate_derived("health")
+
+    expected = [_reference_contact(core, i) for i in range(core.num_agents)]
+    matrix = core.ground_contact_matrix()
+    station = core.ground_contact_station()
+
+    assert matrix.shape == (40, 24)
+    assert any(expected) and not all(expected)
+    assert [core._direct_ground_contact(i) for i in range(core.num_agents)] == expected
+    np.testing.assert_array_equal(station >= 0, expected)
+    for i in np.flatnonzero(station >= 0):
+        assert matrix[i, station[i]]
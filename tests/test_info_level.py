@@ -0,0 +1,80 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from orbital import parallel_env
+from orbital.envs.core.config import OrbitalConfig
+from orbital.envs.core.dynamics import OrbitalCore
+from orbital.envs.core.info import INFO_FIELDS, SUMMARY_FIELDS
+
+
+def _core(**kwargs):
+    core = OrbitalCore(OrbitalConfig(num_satellites=4, max_steps=3, **kwargs))
+    core.reset(5)
+    return core
+
+
+def test_lazy_info_matches_eager_build():
+    core = _core(info_level="lazy")
+    core.step_array(np.zeros(4, dtype=int))
+    infos = core.build_infos()
+    for i, info in enumerate(infos):
+        assert list(info) == list(INFO_FIELDS)
+        assert info == core._build_info(i)
+    assert pickle.loads(pickle.dumps(infos[0])) == infos[0]
+
+
+def test_lazy_info_computes_only_accessed_fields(monkeypatch):
+    core = _core(info_level="lazy")
+    core.step_array(np.zeros(4, dtype=int))
+    info = core.build_infos()[0]
+
+    def fail(_):
+        raise AssertionError("routing should not be computed")
+
+    monkeypatch.setattr(core, "_has_path_to_ground", fail)
+    assert info["energy"] == float(core.energy[0])
+    assert "ground_route" in info and len(info) == len(INFO_FIELDS)
+    assert info.get("missing", 1) == 1
+
+
+def test_stale_lazy_info_raises_but_copies_survive():
+    core = _core(info_level="lazy")
+    core.step_array(np.zeros(4, dtype=int))
+    info = core.build_infos()[1]
+    health = info["health"]
+    kept = dict(core.build_infos()[1])
+    core.step_array(np.zeros(4, dtype=int))
+
+    assert info["health"] == health
+    assert kept["time"] == 1 and core.t == 2
+    with pytest.raises(RuntimeError):
+        info["ground_route"]
+
+
+def test_default_infos_can_be_read_after_the_next_step():
+    env = parallel_env(num_satellites=3)
+    env.reset(seed=0)
+    actions = {agent: 7 for agent in env.agents}
+    *_, infos = env.step(actions)
+    health = float(env.core.health[0])
+    env.step(actions)
+    assert infos["sat_0"]["health"] == health
+    assert infos["sat_0"]["time"] == 1
+
+
+@pytest.mark.parametrize("level, keys", [("summary", SUMMARY_FIELDS), ("none", ())])
+def test_reduced_info_levels_keep_episode_summary(level, keys):
+    core = _core(info_level=level)
+    for _ in range(3):
+        core.step_array(np.full(4, 7))
+        infos = core.build_infos()
+    for info in infos:
+        assert list(info) == list(keys) + ["episode"]
+        assert info["episode"]["steps"] == 3
+
+
+def test_info_level_is_validated():
+    with pytest.raises(ValueError):
+        OrbitalConfig(info_level="verbose")
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 from orbital.envs.core.config import OrbitalConfig
 from orbital.envs.core.dynamics import OrbitalCore
@@ -49,3 +50,19 @@ def test_default_satellite_orbits_are_elliptic_and_change_radius():
 
     assert np.all(core.orbit_eccentricity > 0.0)
     assert np.any(np.abs(core.orbit_radius - first_radius) > 1e-4)
+
+
+def test_batched_satellite_propagation_matches_scalar_reference():
+    for world_dim in (2, 3):
+        core = OrbitalCore(OrbitalConfig(num_satellites=24, world_dim=world_dim, eccentricity_max=0.5,
+                                         orbit_max_radius=12.0))
+        core.reset(seed=3)
+        core.orbit_mean_anomaly[:] = core.rng.uniform(-10.0, 10.0, size=core.num_agents)
+        core._refresh_satellite_positions()
+
+        for i in range(core.num_agents):
+            vec, theta, radius, phi = core._coordinates_from_elements(core._satellite_orbit(i))
+            np.testing.assert_allclose(core.positions[i], vec, rtol=1e-5, atol=1e-5)
+            assert abs(_angle_delta(core.orbit_theta[i], theta)) < 1e-5
+            assert core.orbit_radius[i] == pytest.approx(radius, rel=1e-5)
+            assert core.orbit_phi[i] == pytest.approx(phi, abs=1e-5)
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from orbital.envs.core.compiled import NUMBA_AVAILABLE
+from orbital.envs.core.config import OrbitalConfig
+from orbital.envs.core.dynamics import OrbitalCore
+
+
+def _cores(**kwargs):
+    config = OrbitalConfig(max_steps=10**6, **kwargs)
+    reference = OrbitalCore(config)
+    compiled = OrbitalCore(config)
+    # Without numba the kernels run as plain Python, which still checks that
+    # they reproduce the NumPy loops draw for draw.
+    compiled._use_compiled_kernels = True
+    return reference, compiled
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"num_satellites": 8, "adversarial_rate": 0.6, "malware_forced_action_prob": 0.7},
+    {"world_dim": 3, "num_satellites": 10, "adversarial_rate": 0.5, "num_debris_clouds": 6,
+     "pc_alert_threshold": 0.05, "pc_collision_scale": 0.9, "reward_mode": "local"},
+    {"orbit_shift_step": 0.8, "adversarial_rate": 0.4, "low_orbit_margin": 1.5,
+     "atmospheric_health_loss": 3.0, "enable_debris": False},
+])
+def test_compiled_kernels_match_numpy_path(kwargs):
+    reference, compiled = _cores(**kwargs)
+    reference.reset(3)
+    compiled.reset(3)
+    rng = np.random.default_rng(3)
+
+    for _ in range(120):
+        actions = rng.integers(0, 8, size=reference.num_agents)
+        rewards, _, _ = reference.step_array(actions)
+        np.testing.assert_array_equal(compiled.step_array(actions)[0], rewards)
+        np.testing.assert_array_equal(compiled.reward_components, reference.reward_components)
+        for name in OrbitalCore.SATELLITE_STATE:
+            np.testing.assert_array_equal(getattr(compiled, name), getattr(reference, name))
+        assert compiled.last_executed_actions == reference.last_executed_actions
+        assert compiled.rng.bit_generator.state == reference.rng.bit_generator.state
+
+
+def test_kernel_backend_selection():
+    with pytest.raises(ValueError):
+        OrbitalConfig(kernel_backend="cuda")
+    assert OrbitalCore(OrbitalConfig(kernel_backend="auto"))._use_compiled_kernels == NUMBA_AVAILABLE
+    if not NUMBA_AVAILABLE:
+        with pytest.raises(ModuleNotFoundError):
+            OrbitalCore(OrbitalConfig(kernel_backend="numba"))
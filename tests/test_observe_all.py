@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from orbital.envs.core.config import OrbitalConfig
+from orbital.envs.core.dynamics import OrbitalCore
+
+
+def test_observe_all_matches_per_agent_observe_including_spoofing():
+    for world_dim in (2, 3):
+        core = OrbitalCore(OrbitalConfig(num_satellites=16, world_dim=world_dim, adversarial_rate=0.8))
+        core.reset(seed=world_dim)
+        rng = np.random.default_rng(0)
+        for _ in range(12):
+            actions = {f"sat_{idx}": int(rng.integers(0, 8)) for idx in range(core.num_agents)}
+            core.step(actions, list(actions))
+
+            state = core.rng.bit_generator.state
+            expected = np.stack([core.observe(i) for i in range(core.num_agents)])
+            core.rng.bit_generator.state = state
+            batched = core.observe_all()
+
+            np.testing.assert_allclose(batched, expected, rtol=1e-6, atol=1e-7)
+            assert batched.dtype == np.float32
+        assert core.compromised_for.any()
+
+
+def test_observe_all_reuses_buffer():
+    core = OrbitalCore(OrbitalConfig(num_satellites=4))
+    core.reset(seed=0)
+    out = np.empty((4, 20), dtype=np.float32)
+
+    assert core.observe_all() is core.observe_all()
+    assert core.observe_all(out=out) is out
+
+
+def test_parallel_env_dict_observations_are_owned_by_the_caller():
+    from orbital import parallel_env
+
+    env = parallel_env(num_satellites=5)
+    obs, _ = env.reset(seed=3)
+    history = [obs]
+    actions = {agent: 7 for agent in env.agents}
+    for _ in range(3):
+        obs, *_ = env.step(actions)
+        history.append(obs)
+    saved = [{agent: row.copy() for agent, row in step_obs.items()} for step_obs in history]
+    for _ in range(3):
+        env.step(actions)
+    for step_obs, expected in zip(history, saved):
+        for agent in expected:
+            np.testing.assert_array_equal(step_obs[agent], expected[agent])
+
+
+def test_parallel_env_step_array_observations_are_read_only_for_one_step():
+    from orbital import parallel_env
+
+    env = parallel_env(num_satellites=5)
+    env.reset(seed=3)
+    actions = np.full(5, 7)
+    first, *_ = env.step_array(actions)
+    snapshot = first.copy()
+    second, *_ = env.step_array(actions)
+    np.testing.assert_array_equal(first, snapshot)
+    assert not first.flags.writeable and not second.flags.writeable
+    with pytest.raises(ValueError):
+        first[0, 0] = 1.0
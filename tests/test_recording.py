@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from orbital.envs.core import OrbitalConfig, OrbitalCore
+from orbital.envs.core.recording import NO_ACTION, EpisodeReader, EpisodeRecorder
+
+
+def _frame_matches_core(frame, core):
+    for name in ("positions", "orbit_theta", "orbit_radius", "energy", "health", "buffered_data",
+                 "compromised_for", "jammed", "known_tasks"):
+        np.testing.assert_array_equal(getattr(frame, name), getattr(core, name))
+    assert frame.comm_graph.equals(core.comm_graph)
+    assert frame.t == core.t
+    assert frame.delivered_total == pytest.approx(core.delivered_total)
+    np.testing.assert_array_equal(frame.ground_contact_station(), core.ground_contact_station())
+    for i in range(core.num_agents):
+        assert frame._direct_ground_contact(i) == core._direct_ground_contact(i)
+        assert frame._has_path_to_ground(i) == core._has_path_to_ground(i)
+    for recorded, live in zip(frame.tasks, core.tasks):
+        assert (recorded.theta, recorded.priority, recorded.active, recorded.age) == \
+            (live.theta, live.priority, live.active, live.age)
+    for recorded, live in zip(frame.debris_clouds, core.debris_clouds):
+        assert (recorded.radius, recorded.spread, recorded.density) == (live.radius, live.spread, live.density)
+    assert [core.task_is_known(k) for k in range(len(core.tasks))] == \
+        [frame.task_is_known(k) for k in range(len(frame.tasks))]
+
+
+@pytest.mark.parametrize("world_dim", [2, 3])
+def test_recorded_frames_match_live_core(tmp_path, world_dim):
+    config = OrbitalConfig(num_satellites=5, max_steps=9, world_dim=world_dim, adversarial_rate=0.3)
+    core = OrbitalCore(config)
+    shadow = OrbitalCore(config)
+    recorder = EpisodeRecorder(tmp_path, chunk_size=4)
+    core.reset(2)
+    recorder.attach(core)
+    shadow.restore(core.snapshot())
+    policy = np.random.default_rng(0)
+    snapshots = [shadow.snapshot()]
+    actions = []
+    for _ in range(config.max_steps):
+        acts = policy.integers(0, 8, size=config.num_satellites)
+        actions.append(acts)
+        core.step_array(acts)
+        shadow.step_array(acts)
+        snapshots.append(shadow.snapshot())
+    core.reset(3)
+    core.step_array(np.zeros(config.num_satellites, dtype=np.int64))
+    recorder.detach()
+    core.step_array(np.zeros(config.num_satellites, dtype=np.int64))
+
+    assert [p.name for p in recorder.episodes] == ["episode_000000", "episode_000001"]
+    reader = EpisodeReader(recorder.episodes[0])
+    assert len(reader) == config.max_steps + 1
+    assert reader.episode["steps"] == config.max_steps
+    assert isinstance(reader.field("energy")[3], np.memmap)
+    np.testing.assert_array_equal(reader.field("actions")[0], NO_ACTION)
+    np.testing.assert_array_equal(reader.field("actions").to_array()[1:], np.stack(actions))
+    for k in (0, 4, 5, config.max_steps):
+        shadow.restore(snapshots[k])
+        _frame_matches_core(reader[k], shadow)
+    assert reader[-1].t == config.max_steps
+
+    second = EpisodeReader(recorder.episodes[1])
+    assert len(second) == 2 and second.episode is None
+
+
+def test_reader_drives_renderer(tmp_path):
+    class FakeRenderer:
+        def render(self, core, mode="human", show_links=True):
+            return core.t, len(core.tasks), core.last_reward_components["energy"]
+
+    core = OrbitalCore(OrbitalConfig(num_satellites=3))
+    with EpisodeRecorder(tmp_path).attach(core):
+        core.step_array(np.zeros(3, dtype=np.int64))
+    reader = EpisodeReader(tmp_path / "episode_000000")
+    t, num_tasks, energy = reader.render(FakeRenderer(), 1)
+    assert (t, num_tasks) == (1, core.config.num_tasks)
+    assert energy == pytest.approx(float(reader.field("reward_components")[1][:, 4].sum()))
+
+
+def test_recorder_skips_past_existing_episode_indices(tmp_path):
+    kept = tmp_path / "episode_000001"
+    kept.mkdir()
+    (kept / "marker").write_text("keep")
+    core = OrbitalCore(OrbitalConfig(num_satellites=3, max_steps=2))
+    core.reset(0)
+    with EpisodeRecorder(tmp_path) as recorder:
+        recorder.attach(core)
+        core.step_array(np.zeros(3, dtype=np.int64))
+        core.step_array(np.zeros(3, dtype=np.int64))
+    assert [path.name for path in recorder.episodes] == ["episode_000002"]
+    assert (kept / "marker").read_text() == "keep"
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from orbital.envs.core import OrbitalConfig, OrbitalCore
+from orbital.envs.core.replay import ActionLog, ActionLogger, EpisodeReplay, ReplayDivergenceError, state_digest
+from orbital.envs.orbital_parallel import OrbitalParallelEnv
+
+
+def _play_parallel(seed, steps, **kwargs):
+    env = OrbitalParallelEnv(**kwargs)
+    logger = ActionLogger().attach(env.core)
+    env.reset(seed=seed)
+    policy = np.random.default_rng(seed)
+    for _ in range(steps):
+        env.step_array(policy.integers(0, 8, size=env.core.num_agents))
+        if env.core.last_episode is not None:
+            break
+    logger.detach()
+    return logger.logs[0], env.core
+
+
+def test_replay_reproduces_parallel_episode(tmp_path):
+    log, live = _play_parallel(7, 40, num_satellites=6, adversarial_rate=0.4, max_steps=40)
+    assert len(log) == 40 and log.digests.shape == (41, 16)
+    log.save(tmp_path / "episode.npz")
+    loaded = ActionLog.load(tmp_path / "episode.npz")
+    np.testing.assert_array_equal(loaded.actions, log.actions)
+
+    replay = EpisodeReplay(loaded, keyframe_interval=8)
+    core = replay.verify()
+    assert core.t == 40 and core.last_episode == live.last_episode
+    assert sorted(replay.keyframes) == [0, 8, 16, 24, 32, 40]
+
+
+def test_seek_uses_keyframes_and_matches_sequential_replay():
+    log, _ = _play_parallel(3, 30, num_satellites=5, world_dim=3, adversarial_rate=0.3)
+    replay = EpisodeReplay(log, keyframe_interval=10)
+    states = {}
+    for k in range(len(replay)):
+        states[k] = replay.seek(k).export_state()
+    for k in (25, 3, 17, 30, 0, 12):
+        core = replay.seek(k)
+        assert core.t == k
+        assert state_digest(core) == log.digests[k].tobytes()
+        assert core.export_state().equals(states[k])
+
+
+def test_replay_fails_fast_at_first_divergence():
+    log, _ = _play_parallel(5, 20, num_satellites=4, adversarial_rate=0.5)
+    log.actions = log.actions.copy()
+    log.actions[11] = (log.actions[11] + 1) % 8
+    replay = EpisodeReplay(log)
+    with pytest.raises(ReplayDivergenceError) as excinfo:
+        replay.verify()
+    assert excinfo.value.step == 12
+    assert replay.frame == 12
+
+
+def test_logger_requires_seeded_reset():
+    core = OrbitalCore(OrbitalConfig(num_satellites=3))
+    ActionLogger().attach(core)
+    with pytest.raises(ValueError):
+        core.reset(None)
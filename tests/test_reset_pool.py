@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from orbital.envs.core import InitialStatePool, OrbitalConfig, OrbitalCore
+
+
+def _rollout(core, steps=12):
+    actions = np.random.default_rng(0).integers(0, 8, size=(steps, core.num_agents))
+    out = []
+    for step_actions in actions:
+        rewards, _, _ = core.step_array(step_actions)
+        out.append((rewards.copy(), core.observe_all().copy()))
+    return out
+
+
+def test_reset_reuses_state_buffers():
+    core = OrbitalCore(OrbitalConfig(num_satellites=5, world_dim=3))
+    core.reset(1)
+    buffers = {name: getattr(core, name) for name in core.SATELLITE_STATE}
+    tasks, clouds, station = core.tasks, core.debris_clouds, core.station_known_tasks
+    core.step_array(np.zeros(5, dtype=np.int64))
+    core.reset(2)
+    assert all(getattr(core, name) is array for name, array in buffers.items())
+    assert core.tasks is tasks and core.debris_clouds is clouds and core.station_known_tasks is station
+    fresh = OrbitalCore(core.config)
+    fresh.reset(2)
+    assert core.export_state().equals(fresh.export_state())
+
+
+@pytest.mark.parametrize("world_dim", [2, 3])
+def test_fast_reset_samples_valid_orbits(world_dim):
+    config = OrbitalConfig(num_satellites=64, world_dim=world_dim, reset_mode="fast")
+    core = OrbitalCore(config)
+    core.reset(3)
+    e = core.orbit_eccentricity
+    assert np.all((e >= config.eccentricity_min) & (e <= config.eccentricity_max))
+    assert np.all(core.orbit_radius >= config.orbit_min_radius * 0.999)
+    assert np.all(core.orbit_radius <= config.orbit_max_radius * 1.001)
+    again = OrbitalCore(config)
+    again.reset(3)
+    assert core.export_state().equals(again.export_state())
+
+
+def test_pooled_reset_matches_seeded_reset():
+    config = OrbitalConfig(num_satellites=6, adversarial_rate=0.3, rng_streams="split")
+    core = OrbitalCore(config)
+    with InitialStatePool(config, seed=7, size=2) as pool:
+        core.reset_pool = pool
+        for _ in range(3):
+            core.reset(None)
+            reference = OrbitalCore(config)
+            reference.reset(core.seed)
+            assert core.export_state().equals(reference.export_state())
+            for a, b in zip(_rollout(core), _rollout(reference)):
+                np.testing.assert_array_equal(a[0], b[0])
+                np.testing.assert_array_equal(a[1], b[1])
+        # Seeded resets bypass the pool.
+        core.reset(5)
+        assert core.seed == 5
+
+
+def test_pool_rejects_other_configs():
+    with InitialStatePool(OrbitalConfig(num_satellites=4), size=1) as pool:
+        core = OrbitalCore(OrbitalConfig(num_satellites=5))
+        core.reset_pool = pool
+        with pytest.raises(ValueError):
+            core.reset(None)
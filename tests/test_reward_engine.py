@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from orbital.envs.core.config import DEFAULT_REWARD_WEIGHTS, OrbitalConfig
+from orbital.envs.core.dynamics import OrbitalCore
+from orbital.envs.core.reward import REWARD_COMPONENTS, compile_reward_weights, compute_shared_reward
+
+
+def test_compiled_weights_match_dict_reward():
+    rng = np.random.default_rng(0)
+    weights = dict(DEFAULT_REWARD_WEIGHTS)
+    del weights["jam"]
+    vector = compile_reward_weights(weights)
+    for _ in range(20):
+        row = rng.uniform(0.0, 3.0, size=len(REWARD_COMPONENTS))
+        components = dict(zip(REWARD_COMPONENTS, row.tolist()))
+        assert row @ vector == pytest.approx(compute_shared_reward(components, weights))
+
+
+@pytest.mark.parametrize("reward_mode", ["shared", "local"])
+def test_step_exposes_component_matrix(reward_mode):
+    config = OrbitalConfig(num_satellites=5, adversarial_rate=0.3, reward_mode=reward_mode)
+    core = OrbitalCore(config)
+    core.reset(3)
+    rng = np.random.default_rng(1)
+    for _ in range(10):
+        rewards, _, _ = core.step_array(rng.integers(0, 8, size=5))
+        matrix = core.reward_components
+        assert matrix.shape == (5, len(REWARD_COMPONENTS))
+        totals = matrix.sum(axis=0)
+        assert list(core.last_reward_components) == list(REWARD_COMPONENTS)
+        np.testing.assert_allclose(list(core.last_reward_components.values()), totals)
+        assert core.last_reward == pytest.approx(
+            compute_shared_reward(core.last_reward_components, config.reward_weights))
+        if reward_mode == "local":
+            expected = [compute_shared_reward(dict(zip(REWARD_COMPONENTS, row.tolist())), config.reward_weights)
+                        for row in matrix.astype(np.float64)]
+            np.testing.assert_allclose(rewards, expected)
+        else:
+            assert np.all(rewards == core.last_reward)
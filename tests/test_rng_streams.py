@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from orbital.envs.core import OrbitalConfig, OrbitalCore
+from orbital.envs.core.streams import RNG_SUBSYSTEMS, BlockStream
+
+
+def _stream_states(core):
+    return dict(zip(RNG_SUBSYSTEMS, core.streams.get_state()))
+
+
+def test_shared_mode_aliases_the_core_generator():
+    core = OrbitalCore(OrbitalConfig(num_satellites=3))
+    core.reset(0)
+    assert all(getattr(core.streams, name) is core.rng for name in RNG_SUBSYSTEMS)
+
+
+def test_split_streams_are_independent_across_configs():
+    seed = 21
+    base = OrbitalCore(OrbitalConfig(num_satellites=6, rng_streams="split", adversarial_rate=0.4))
+    other = OrbitalCore(OrbitalConfig(num_satellites=6, rng_streams="split", adversarial_rate=0.4,
+                                      num_tasks=20, enable_debris=False, p_link_drop=0.5))
+    base.reset(seed)
+    other.reset(seed)
+    # Satellite orbits come from their own stream, whatever the task and debris setup.
+    np.testing.assert_array_equal(base.orbit_semi_major_axis, other.orbit_semi_major_axis)
+    actions = np.full(6, 7)
+    for _ in range(10):
+        base.step_array(actions)
+        other.step_array(actions)
+        assert _stream_states(base)["malware"] == _stream_states(other)["malware"]
+        assert _stream_states(base)["hazards"] == _stream_states(other)["hazards"]
+    np.testing.assert_array_equal(base.compromised_for, other.compromised_for)
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"num_satellites": 8, "adversarial_rate": 0.6, "malware_forced_action_prob": 0.7},
+    {"world_dim": 3, "num_satellites": 10, "adversarial_rate": 0.5, "pc_alert_threshold": 0.05,
+     "pc_collision_scale": 0.9},
+])
+def test_split_mode_compiled_kernels_match_numpy_path(kwargs):
+    config = OrbitalConfig(max_steps=10**6, rng_streams="split", **kwargs)
+    reference = OrbitalCore(config)
+    compiled = OrbitalCore(config)
+    compiled._use_compiled_kernels = True
+    reference.reset(4)
+    compiled.reset(4)
+    policy = np.random.default_rng(0)
+    for _ in range(80):
+        actions = policy.integers(0, 8, size=config.num_satellites)
+        np.testing.assert_array_equal(compiled.step_array(actions)[0], reference.step_array(actions)[0])
+        np.testing.assert_array_equal(compiled.observe_all(), reference.observe_all())
+    assert compiled.export_state().equals(reference.export_state())
+    assert compiled.streams.get_state() == reference.streams.get_state()
+
+
+def test_split_mode_snapshot_restore_is_exact():
+    core = OrbitalCore(OrbitalConfig(num_satellites=5, rng_streams="split", adversarial_rate=0.5))
+    core.reset(9)
+    snap = core.snapshot()
+    actions = np.random.default_rng(0).integers(0, 8, size=(12, 5))
+    first = [core.step_array(a)[0].copy() for a in actions]
+    core.restore(snap)
+    second = [core.step_array(a)[0].copy() for a in actions]
+    np.testing.assert_array_equal(first, second)
+
+
+def test_block_stream_draws_one_block_per_step():
+    stream = BlockStream(np.random.default_rng(0), 6)
+    expected = np.random.default_rng(0).random(6 + 4 + 6)
+    stream.refill()
+    assert stream.random() == expected[0]
+    np.testing.assert_array_equal(stream.random(3), expected[1:4])
+    # Requests past the block draw exactly the shortfall.
+    np.testing.assert_array_equal(stream.random(6), expected[4:10])
+    stream.discard()
+    stream.refill()
+    np.testing.assert_array_equal(stream.random(6), expected[10:16])
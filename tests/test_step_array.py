@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from orbital.envs.core.config import OrbitalConfig
+from orbital.envs.core.dynamics import OrbitalCore
+from orbital.envs.orbital_parallel import OrbitalParallelEnv
+
+
+@pytest.mark.parametrize("reward_mode", ["shared", "local"])
+def test_step_array_matches_dict_step(reward_mode):
+    config = OrbitalConfig(num_satellites=6, adversarial_rate=0.3, max_steps=12, reward_mode=reward_mode)
+    by_dict = OrbitalCore(config)
+    by_array = OrbitalCore(config)
+    by_dict.reset(11)
+    by_array.reset(11)
+    names = [f"sat_{i}" for i in range(config.num_satellites)]
+    rng = np.random.default_rng(2)
+
+    for _ in range(config.max_steps):
+        actions = rng.integers(0, 8, size=config.num_satellites)
+        rewards, terms, truncs, infos = by_dict.step(dict(zip(names, actions.tolist())), names)
+        rewards_arr, terms_arr, truncs_arr = by_array.step_array(actions)
+        np.testing.assert_array_equal(rewards_arr, [rewards[name] for name in names])
+        np.testing.assert_array_equal(terms_arr, [terms[name] for name in names])
+        np.testing.assert_array_equal(truncs_arr, [truncs[name] for name in names])
+        np.testing.assert_array_equal(by_array.observe_all(), by_dict.observe_all())
+
+    assert truncs_arr.all()
+    assert by_array.last_episode == infos["sat_0"]["episode"]
+    assert all(info["episode"] is by_array.last_episode for info in by_array.build_infos())
+
+
+def test_step_array_rejects_wrong_shape():
+    core = OrbitalCore(OrbitalConfig(num_satellites=3))
+    core.reset(0)
+    with pytest.raises(ValueError):
+        core.step_array(np.zeros((4,), dtype=int))
+
+
+def test_parallel_env_step_array_ends_episode():
+    env = OrbitalParallelEnv(num_satellites=3, max_steps=2)
+    env.reset(seed=0)
+    obs, rewards, terms, truncs = env.step_array(np.full(3, 7))
+    assert obs.shape == (3, 20) and rewards.shape == (3,)
+    assert env.agents and env.core.last_episode is None
+    _, _, _, truncs = env.step_array(np.full(3, 7))
+    assert truncs.all() and env.agents == []
+    assert env.core.last_episode["steps"] == 2
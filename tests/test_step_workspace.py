@@ -0,0 +1,62 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from orbital.envs.core.config import OrbitalConfig
+from orbital.envs.core.dynamics import OrbitalCore
+
+
+def _numpy_snapshot():
+    return tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.DomainFilter(True, np.lib.tracemalloc_domain)])
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"world_dim": 3, "adversarial_rate": 0.3, "reward_mode": "local"}])
+def test_steady_state_steps_reuse_workspace(kwargs):
+    core = OrbitalCore(OrbitalConfig(num_satellites=8, max_steps=10**6, **kwargs))
+    core.reset(0)
+    actions = np.random.default_rng(0).integers(0, 8, size=(100, 8))
+    obs = np.zeros((8, 20), dtype=np.float32)
+    workspace = core.reward_components
+
+    tracemalloc.start(4)
+    try:
+        for k in range(20):
+            outputs = core.step_array(actions[k])
+            core.observe_all(out=obs)
+        before = _numpy_snapshot()
+        peaks = []
+        for k in range(20, 100):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            step_outputs = core.step_array(actions[k])
+            peaks.append(tracemalloc.get_traced_memory()[1] - current)
+            assert all(a is b for a, b in zip(step_outputs, outputs))
+            assert core.observe_all(out=obs) is obs
+        after = _numpy_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    assert core.reward_components is workspace
+    # The comm graph is rebuilt every step and sized by its number of links,
+    # so only allocations made outside comm.py must be flat.
+    growth = [stat for stat in after.compare_to(before, "traceback")
+              if not any(frame.filename.endswith("comm.py") for frame in stat.traceback)]
+    assert sum(stat.size_diff for stat in growth) == 0
+    assert sum(stat.count_diff for stat in growth) == 0
+    # Steps are not allocation-free: the comm graph, debris density and Pc,
+    # body and satellite propagation and the sunlight mask still build
+    # short-lived temporaries (about 5-7 KiB at their peak for 8 satellites).
+    # Bound that peak so per-step buffers cannot creep back in unnoticed.
+    assert max(peaks) < 10 * 1024
+
+
+def test_reset_reuses_workspace():
+    core = OrbitalCore(OrbitalConfig(num_satellites=4))
+    core.reset(0)
+    rewards, _, _ = core.step_array(np.zeros(4, dtype=int))
+    workspace = core.reward_components
+    core.reset(1)
+    assert core.reward_components is workspace and not workspace.any()
+    assert core.step_array(np.zeros(4, dtype=int))[0] is rewards
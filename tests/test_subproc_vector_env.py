@@ -0,0 +1,47 @@
+import numpy as np
+
+from orbital.envs.core.config import OrbitalConfig
+from orbital.envs.core.vector import VectorOrbitalCore
+from orbital.envs.orbital_vector import OrbitalSubprocVectorEnv
+
+
+def test_subproc_vector_env_matches_vector_core():
+    kwargs = dict(num_satellites=5, adversarial_rate=0.3, max_steps=6)
+    reference = VectorOrbitalCore(OrbitalConfig(**kwargs), num_envs=2, seed=3)
+    rng = np.random.default_rng(0)
+
+    with OrbitalSubprocVectorEnv(2, seed=3, **kwargs) as envs:
+        np.testing.assert_array_equal(envs.episode_seeds, reference.episode_seeds)
+        np.testing.assert_array_equal(envs.observations, reference.observations)
+        finished = 0
+        for _ in range(14):
+            actions = rng.integers(0, 8, size=(2, 5))
+            obs, rewards, terms, truncs, infos = envs.step(actions)
+            ref_obs, ref_rewards, ref_terms, ref_truncs, ref_infos = reference.step(actions)
+            np.testing.assert_array_equal(obs, ref_obs)
+            np.testing.assert_array_equal(rewards, ref_rewards)
+            np.testing.assert_array_equal(terms, ref_terms)
+            np.testing.assert_array_equal(truncs, ref_truncs)
+            for info, ref_info in zip(infos, ref_infos):
+                assert info.keys() == ref_info.keys()
+                if info:
+                    finished += 1
+                    assert info["episode"] == ref_info["episode"]
+                    np.testing.assert_array_equal(info["final_observation"], ref_info["final_observation"])
+        assert finished == 4
+
+
+def test_subproc_vector_env_close_releases_shared_memory():
+    envs = OrbitalSubprocVectorEnv(2, seed=0, num_satellites=3)
+    name = envs._shm.name
+    envs.close()
+    envs.close()
+    assert all(not process.is_alive() for process in envs._processes)
+    try:
+        from multiprocessing import shared_memory
+
+        shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        pass
+    else:
+        raise AssertionError("shared memory block still exists after close")
@@ -0,0 +1,62 @@
+import numpy as np
+
+from orbital.envs.core.config import OrbitalConfig
+from orbital.envs.core.dynamics import OrbitalCore
+
+
+def _make_core(**overrides):
+    config = dict(
+        num_satellites=12,
+        num_tasks=300,
+        enable_local_task_discovery=True,
+        task_knowledge_mode="local_discovery",
+        adversarial_rate=0.0,
+    )
+    config.update(overrides)
+    core = OrbitalCore(OrbitalConfig(**config))
+    core.reset(seed=13)
+    return core
+
+
+def test_discovery_matches_per_task_loop():
+    core = _make_core()
+    core.known_tasks[:] = False
+    core.station_known_tasks[:] = False
+    core.health[4] = 0.0
+    core.invalidate_derived("health")
+
+    expected = np.zeros_like(core.known_tasks)
+    for t in np.flatnonzero(core.tasks.active):
+        for i in range(core.num_agents):
+            dist = float(np.linalg.norm(core.positions[i] - core.tasks[t].position))
+            if core._is_alive(i) and dist <= core._discovery_distance_threshold():
+                expected[i, t] = True
+
+    gained = core._refresh_task_knowledge()
+
+    assert gained == expected.sum() > 0
+    np.testing.assert_array_equal(core.known_tasks, expected)
+    assert not core.known_tasks[4].any()
+
+
+def test_task_pressure_and_sensing_use_proximity_matrix():
+    core = _make_core(world_dim=3)
+    core.known_tasks[:] = True
+    sensing = core._sensing_distance_threshold()
+    discovery = core._discovery_distance_threshold()
+
+    for i in range(core.num_agents):
+        dists = np.linalg.norm(core.positions[i] - core.tasks.positions, axis=1)
+        near = (dists <= discovery) & core.tasks.active
+        count, prio = core._known_local_task_pressure(i)
+        assert count == min(near.sum() / core.config.num_tasks, 1.0)
+        assert np.isclose(prio, min(core.tasks.priority[near].sum() / core.config.num_tasks, 1.0))
+
+    in_range = (np.linalg.norm(core.positions[:, None] - core.tasks.positions[None], axis=2) <= sensing) \
+        & core.tasks.active
+    i = int(np.flatnonzero(in_range.any(axis=1))[0])
+    sensed = np.flatnonzero(in_range[i])
+    gain, _ = core._observe_task(i)
+    assert gain > 0.0
+    assert not core.tasks.active[sensed[0]]
+    assert core.tasks.active[sensed[1:]].all()